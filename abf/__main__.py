@@ -15,6 +15,6 @@ else:
     save_class = ABFCommonSave
 exporting = {".sav": True, ".json": False}[filepath.suffix]
 if exporting:
-    save_class.from_binary_file(filepath).to_json_file(filepath.with_suffix(".json"))
+    save_class.binary_file_to_json_file(filepath, filepath.with_suffix(".json"))
 else:
-    save_class.from_json_file(filepath).to_binary_file(filepath.with_suffix(".sav.new"))
+    save_class.json_file_to_binary_file(filepath, filepath.with_suffix(".sav.new"))
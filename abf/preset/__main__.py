@@ -32,12 +32,14 @@ player_output_folder.mkdir(mode=0o755, parents=True, exist_ok=True)
 
 save_regex = re.compile(r"Player_([A-Za-z0-9]+)\.sav")
 players: list[str] = []
-for index, save_file in enumerate(player_save_folder.glob("Player_*.sav")):
+save_files = list(player_save_folder.glob("Player_*.sav"))
+for index, (save_file, save) in enumerate(zip(save_files, ABFPlayerSave.load_many(save_files), strict=True)):
     matches = save_regex.match(save_file.name)
     if matches is None:
         raise ValueError(f"Invalid player save file name {save_file.name}")
 
-    save = ABFPlayerSave.from_binary_file(save_file)
+    if isinstance(save, BaseException):
+        raise save
     identifier = save.body["SaveIdentifier"]["value"]
     if identifier != matches[1]:
         raise ValueError(f"Player save file {save_file.name} identifier mismatched")
@@ -55,7 +57,7 @@ for save_file in save_folder.glob("WorldSave_*.sav"):
     if matches is None:
         raise ValueError(f"Invalid save file name {save_file.name}")
 
-    save = ABFWorldSave.from_binary_file(save_file)
+    save = ABFWorldSave.from_binary_file(save_file, lazy=True, nodes=True)
     identifier = save.body["SaveIdentifier"]["value"]
     if identifier != matches[1]:
         raise ValueError(f"World save file {save_file.name} identifier mismatched")
@@ -1406,3 +1408,6 @@ for identifier in updated_saves:
     save = saves[identifier]
     write_attributes(identifier, save.body)
     save.to_binary_file(output_folder / f"WorldSave_{identifier}.sav")
+
+for save in saves.values():
+    save.close()
@@ -17,6 +17,6 @@ entry, filename = sys.argv
 filepath = Path(filename).absolute()
 exporting = {".sav": True, ".json": False}[filepath.suffix]
 if exporting:
-    BoBSave.from_binary_file(filepath).to_json_file(filepath.with_suffix(".json"))
+    BoBSave.binary_file_to_json_file(filepath, filepath.with_suffix(".json"))
 else:
-    BoBSave.from_json_file(filepath).to_binary_file(filepath.with_suffix(".sav.new"))
+    BoBSave.json_file_to_binary_file(filepath, filepath.with_suffix(".sav.new"))
@@ -38,6 +38,6 @@ entry, filename = sys.argv
 filepath = Path(filename).absolute()
 exporting = {".sav": True, ".json": False}[filepath.suffix]
 if exporting:
-    ESSave.from_binary_file(filepath).to_json_file(filepath.with_suffix(".json"))
+    ESSave.binary_file_to_json_file(filepath, filepath.with_suffix(".json"))
 else:
-    ESSave.from_json_file(filepath).to_binary_file(filepath.with_suffix(".sav.new"))
+    ESSave.json_file_to_binary_file(filepath, filepath.with_suffix(".sav.new"))
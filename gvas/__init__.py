@@ -1,6 +1,17 @@
 from ._base import GVASSave
+from ._cache import GVASCache
+from ._catalog import GVASCatalog, GVASCatalogEntry
+from ._profiler import GVASProfileEntry, GVASProfiler
+from ._stats import reset_stats, stats
 
 
 __all__ = [
+    "GVASCache",
+    "GVASCatalog",
+    "GVASCatalogEntry",
+    "GVASProfileEntry",
+    "GVASProfiler",
     "GVASSave",
+    "reset_stats",
+    "stats",
 ]
@@ -1,8 +1,24 @@
+import array
+import contextlib
+import itertools
 import json
+import mmap
+import shutil
 import struct
+import tempfile
+import time
 from abc import abstractmethod
+from collections.abc import Generator, Iterable, Iterator, Mapping
 from pathlib import Path
-from typing import Any, ClassVar, Self, final
+from typing import Any, BinaryIO, ClassVar, Self, final, override
+
+from ._binary import GVASBinaryReader, GVASBinaryWriter
+from ._cache import GVASCache
+from ._json import GVASJSONReader, GVASJSONWriter
+from ._options import DEFAULT_OPTIONS, OPTIONS, POOL, PROJECTION, VALIDATIONS, GVASOptions
+from ._pool import GVASPool, process_pool
+from ._query import parse_query, select
+from ._stats import counted, merge, record
 
 
 class GVASSerde:
@@ -22,38 +38,276 @@ class GVASSerde:
     def from_dict(cls, data: Any) -> bytes:
         raise NotImplementedError(cls.__name__)
 
+    @classmethod
+    def from_dict_into(cls, data: Any, buffer: bytearray) -> None:
+        buffer += cls.from_dict(data)
+
+    @classmethod
+    def from_index(cls, data: bytes, index: dict[str, Any]) -> tuple[Any, int]:
+        raise NotImplementedError(cls.__name__)
+
+    @classmethod
+    def from_json_into(cls, reader: GVASJSONReader, writer: GVASBinaryWriter) -> None:
+        cls.from_dict_into(reader.value(), writer.buffer)
+        writer.flush()
+
+    @classmethod
+    def from_stream(cls, reader: GVASBinaryReader) -> Any:
+        return reader.decode_element(cls.from_bytes)
+
+    @classmethod
+    def index_from_bytes(cls, data: bytes, offset: int) -> tuple[dict[str, Any], int]:
+        raise NotImplementedError(cls.__name__)
+
+    @classmethod
+    def json_from_bytes(cls, data: bytes, offset: int, writer: GVASJSONWriter) -> int:
+        value, offset = cls.from_bytes(data, offset)
+        writer.value(value)
+        return offset
+
+    @classmethod
+    def query_from_bytes(cls, data: bytes, offset: int, segments: tuple[str, ...]) -> Generator[Any, None, int]:
+        value, offset = cls.from_bytes(data, offset)
+        yield from select(value, segments)
+        return offset
+
     @final
     def __init__(self) -> None:
         raise NotImplementedError(self.__class__.__name__)
 
 
+def _serde_modules() -> tuple[str, ...]:
+    modules: set[str] = set()
+    pending: list[type[GVASSerde]] = [GVASSerde]
+    while pending:
+        serde = pending.pop()
+        modules.add(serde.__module__)
+        pending.extend(serde.__subclasses__())
+    return tuple(sorted(modules))
+
+
 class GVASSave:
-    __slots__ = ("header", "body")
+    __slots__ = ("header", "body", "_data", "_mapped")
 
     _BODY_SERDE: ClassVar[type[GVASSerde]]
     _HEADER_SERDE: ClassVar[type[GVASSerde]]
+    _PEEK_SIZE: ClassVar[int] = 4096
 
     body: Any
     header: Any
+    _data: memoryview | None
+    _mapped: mmap.mmap | None
+
+    @staticmethod
+    @final
+    def _to_json(value: Any) -> Any:
+        if isinstance(value, Mapping):
+            return dict(value)
+        if isinstance(value, array.array):
+            if value.typecode == "b":
+                return [bool(element) for element in value]
+            return value.tolist()
+        if getattr(value, "ndim", None) == 2:
+            return [dict(zip(("x", "y", "z", "w"), row, strict=False)) for row in value.tolist()]
+        raise TypeError(f"Object of type {value.__class__.__name__} is not JSON serialisable")
 
     @final
     @classmethod
-    def from_binary_file(cls, filepath: Path) -> Self:
+    def binary_file_to_json_file(cls, filepath: Path, json_filepath: Path, *, chunk_size: int = 1 << 20) -> None:
+        temporary = json_filepath.with_name(f"{json_filepath.name}.tmp")
+        token = OPTIONS.set(DEFAULT_OPTIONS)
+        try:
+            with (
+                filepath.open("rb") as f,
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+                memoryview(mapped) as data,
+                temporary.open("w", encoding="utf-8") as output,
+            ):
+                writer = GVASJSONWriter(output, cls._to_json, chunk_size)
+                try:
+                    header, offset = cls._HEADER_SERDE.from_bytes(data, 0)
+                    bodysize = header.get("bodysize")
+                    if bodysize is not None and offset + bodysize != len(data):
+                        raise ValueError(f"Invalid body size {bodysize} at {offset}")
+                    writer.begin_object()
+                    writer.key("header")
+                    writer.value(header)
+                    writer.key("body")
+                    offset = cls._BODY_SERDE.json_from_bytes(data, offset, writer)
+                    writer.end()
+                    if struct.unpack_from("<I", data, offset)[0] != 0:
+                        raise ValueError(f"Invalid ending at {offset}")
+                    offset += 4
+                    if offset != len(data):
+                        raise ValueError(f"More bytes are available at {offset}")
+                except BaseException:
+                    writer.abort()
+                    raise
+                writer.close()
+            temporary.replace(json_filepath)
+        except BaseException:
+            temporary.unlink(missing_ok=True)
+            raise
+        finally:
+            OPTIONS.reset(token)
+
+    @final
+    @classmethod
+    def from_binary_file(
+        cls,
+        filepath: Path,
+        *,
+        arrays: bool = False,
+        cache: GVASCache | None = None,
+        compiled: bool = False,
+        include: Iterable[str] | None = None,
+        lazy: bool = False,
+        nodes: bool = False,
+        numpy: bool = False,
+        parallel_threshold: int = 1 << 20,
+        validation: str = "strict",
+        workers: int = 0,
+    ) -> Self:
+        if validation not in VALIDATIONS:
+            raise ValueError(f"Unknown validation {validation}")
+        if compiled and validation != "strict":
+            raise ValueError("Compiled decoding only supports strict validation")
+        if cache is not None and (arrays or include is not None or lazy or nodes or numpy):
+            raise ValueError("Cached loading only supports plain decoding")
+        if include is not None and lazy:
+            raise ValueError("Projected loading does not support lazy decoding")
+        start = time.perf_counter()
         with filepath.open("rb") as f:
-            data = f.read()
-        header, offset = cls._HEADER_SERDE.from_bytes(data, 0)
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        data = memoryview(mapped)
+        size = len(data)
+        key = None
+        if cache is not None:
+            key = cache.key(cls, filepath, data)
+            entry = cache.load(key)
+            if entry is not None:
+                data.release()
+                mapped.close()
+                self = cls._from_parts(*entry)
+                record("load", size, time.perf_counter() - start)
+                return self
+        pool = GVASPool(filepath, workers, parallel_threshold, _serde_modules()) if workers > 1 else None
+        token = OPTIONS.set(
+            GVASOptions(
+                arrays=arrays,
+                compiled=compiled,
+                lazy=lazy,
+                nodes=nodes,
+                numpy=numpy,
+                validation=validation,
+            ),
+        )
+        pool_token = POOL.set(pool)
+        patterns = None if include is None else tuple(tuple(pattern.split(".")) for pattern in include)
+        projection_token = PROJECTION.set(patterns)
+        try:
+            header, offset = cls._HEADER_SERDE.from_bytes(data, 0)
+            bodysize = header.get("bodysize")
+            if bodysize is not None and offset + bodysize != len(data):
+                raise ValueError(f"Invalid body size {bodysize} at {offset}")
+            body, offset = cls._BODY_SERDE.from_bytes(data, offset)
+            if struct.unpack_from("<I", data, offset)[0] != 0:
+                raise ValueError(f"Invalid ending at {offset}")
+            offset += 4
+            if offset != len(data):
+                raise ValueError(f"More bytes are available at {offset}")
+        except BaseException:
+            lazy = False
+            raise
+        finally:
+            PROJECTION.reset(projection_token)
+            POOL.reset(pool_token)
+            OPTIONS.reset(token)
+            if pool is not None:
+                pool.shutdown()
+            if not lazy:
+                data.release()
+                mapped.close()
+        if cache is not None and key is not None:
+            cache.store(key, header, body)
+        self = cls._from_parts(header, body)
+        if lazy:
+            self._data = data
+            self._mapped = mapped
+        record("load", size, time.perf_counter() - start)
+        return self
+
+    @final
+    @classmethod
+    def from_binary_stream(
+        cls,
+        file: BinaryIO,
+        *,
+        arrays: bool = False,
+        compiled: bool = False,
+        nodes: bool = False,
+        numpy: bool = False,
+        validation: str = "strict",
+        window: int = 1 << 20,
+    ) -> Self:
+        if validation not in VALIDATIONS:
+            raise ValueError(f"Unknown validation {validation}")
+        if compiled and validation != "strict":
+            raise ValueError("Compiled decoding only supports strict validation")
+        start = time.perf_counter()
+        reader = GVASBinaryReader(file, window)
+        token = OPTIONS.set(
+            GVASOptions(
+                arrays=arrays,
+                compiled=compiled,
+                lazy=False,
+                nodes=nodes,
+                numpy=numpy,
+                validation=validation,
+            ),
+        )
+        try:
+            header = reader.decode_element(cls._HEADER_SERDE.from_bytes)
+            offset = reader.tell()
+            body = cls._BODY_SERDE.from_stream(reader)
+        finally:
+            OPTIONS.reset(token)
+        end = reader.tell()
+        if reader.read(4) != b"\0\0\0\0":
+            raise ValueError(f"Invalid ending at {end}")
+        if not reader.exhausted():
+            raise ValueError(f"More bytes are available at {end + 4}")
         bodysize = header.get("bodysize")
-        if bodysize is not None and offset + bodysize != len(data):
+        if bodysize is not None and end + 4 - offset != bodysize:
             raise ValueError(f"Invalid body size {bodysize} at {offset}")
-        body, offset = cls._BODY_SERDE.from_bytes(data, offset)
-        if struct.unpack_from("<I", data, offset)[0] != 0:
-            raise ValueError(f"Invalid ending at {offset}")
-        offset += 4
-        if offset != len(data):
-            raise ValueError(f"More bytes are available at {offset}")
-        self = cls.__new__(cls)
-        self.header = header
-        self.body = body
+        self = cls._from_parts(header, body)
+        record("load", reader.tell(), time.perf_counter() - start)
+        return self
+
+    @final
+    @classmethod
+    def from_indexed_binary_file(cls, filepath: Path) -> Self:
+        index = cls.index_binary_file(filepath)
+        with filepath.open("rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        data = memoryview(mapped)
+        token = OPTIONS.set(GVASOptions(lazy=True))
+        try:
+            if len(data) != index["size"]:
+                raise ValueError(f"Outdated index for {filepath}")
+            header, offset = cls._HEADER_SERDE.from_bytes(data, 0)
+            if offset != index["offset"]:
+                raise ValueError(f"Invalid index offset {index['offset']} at {offset}")
+            body, offset = cls._BODY_SERDE.from_index(data, index)
+        except BaseException:
+            data.release()
+            mapped.close()
+            raise
+        finally:
+            OPTIONS.reset(token)
+        self = cls._from_parts(header, body)
+        self._data = data
+        self._mapped = mapped
         return self
 
     @final
@@ -65,25 +319,244 @@ class GVASSave:
         body = data.pop("body")
         if data:
             raise ValueError(f"Unknown keys in JSON: {', '.join(data.keys())}")
+        return cls._from_parts(header, body)
+
+    @final
+    @classmethod
+    def index_binary_file(cls, filepath: Path) -> dict[str, Any]:
+        index_filepath = filepath.with_name(f"{filepath.name}.index")
+        status = filepath.stat()
+        if index_filepath.is_file():
+            with index_filepath.open("r", encoding="utf-8") as f:
+                index = json.load(f)
+            if index.get("size") == status.st_size and index.get("mtime") == status.st_mtime_ns:
+                return index
+        with (
+            filepath.open("rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+            memoryview(mapped) as data,
+        ):
+            _, offset = cls._HEADER_SERDE.from_bytes(data, 0)
+            index, offset = cls._BODY_SERDE.index_from_bytes(data, offset)
+            if struct.unpack_from("<I", data, offset)[0] != 0:
+                raise ValueError(f"Invalid ending at {offset}")
+            offset += 4
+            if offset != len(data):
+                raise ValueError(f"More bytes are available at {offset}")
+        index = {"size": status.st_size, "mtime": status.st_mtime_ns} | index
+        with index_filepath.open("w", encoding="utf-8") as f:
+            json.dump(index, f, indent=2)
+        return index
+
+    @final
+    @classmethod
+    def json_file_to_binary_file(cls, json_filepath: Path, filepath: Path, *, chunk_size: int = 1 << 20) -> None:
+        temporary = filepath.with_name(f"{filepath.name}.tmp")
+        try:
+            with (
+                json_filepath.open("r", encoding="utf-8") as f,
+                temporary.open("wb") as output,
+                contextlib.ExitStack() as stack,
+            ):
+                reader = GVASJSONReader(f, chunk_size)
+                writer = GVASBinaryWriter(output, chunk_size)
+                header: dict[str, Any] | None = None
+                header_size = 0
+                body: BinaryIO | None = None
+                body_size: int | None = None
+                reader.begin_object()
+                while (key := reader.next_key()) is not None:
+                    if key == "header" and header is None:
+                        header = reader.value()
+                        header_size = len(cls._HEADER_SERDE.from_dict(header | {"bodysize": 0}))
+                        if body_size is None:
+                            writer.buffer += bytes(header_size)
+                    elif key == "body" and body_size is None:
+                        body_writer = writer
+                        if header is None:
+                            body = stack.enter_context(tempfile.TemporaryFile())
+                            body_writer = GVASBinaryWriter(body, chunk_size)
+                        start = body_writer.tell()
+                        cls._BODY_SERDE.from_json_into(reader, body_writer)
+                        body_writer.buffer += struct.pack("<I", 0)
+                        body_size = body_writer.tell() - start
+                        body_writer.close()
+                    else:
+                        raise ValueError(f"Unexpected key {key} in JSON")
+                reader.close()
+                if header is None or body_size is None:
+                    raise ValueError("Missing header or body in JSON")
+                header["bodysize"] = body_size
+                if body is None:
+                    writer.patch(0, cls._HEADER_SERDE.from_dict(header))
+                else:
+                    output.write(cls._HEADER_SERDE.from_dict(header))
+                    body.seek(0)
+                    shutil.copyfileobj(body, output)
+            temporary.replace(filepath)
+        except BaseException:
+            temporary.unlink(missing_ok=True)
+            raise
+
+    @final
+    @classmethod
+    def load_many(
+        cls,
+        paths: Iterable[Path | tuple[type[Self], Path]],
+        *,
+        arrays: bool = False,
+        cache: GVASCache | None = None,
+        compiled: bool = False,
+        lazy: bool = False,
+        nodes: bool = False,
+        numpy: bool = False,
+        validation: str = "strict",
+        workers: int | None = None,
+    ) -> list[Self | BaseException]:
+        with process_pool(workers, _serde_modules()) as executor:
+            futures = [
+                executor.submit(
+                    counted,
+                    save_class.from_binary_file,
+                    path,
+                    arrays=arrays,
+                    cache=cache,
+                    compiled=compiled,
+                    lazy=lazy,
+                    nodes=nodes,
+                    numpy=numpy,
+                    validation=validation,
+                )
+                for save_class, path in ((cls, item) if isinstance(item, Path) else item for item in paths)
+            ]
+            results: list[Self | BaseException] = []
+            for future in futures:
+                error = future.exception()
+                if error is None:
+                    save, counts = future.result()
+                    merge(counts)
+                    results.append(save)
+                else:
+                    results.append(error)
+        return results
+
+    @final
+    @classmethod
+    def peek_header(cls, filepath: Path) -> tuple[dict[str, Any], int]:
+        size = cls._PEEK_SIZE
+        with filepath.open("rb") as f:
+            data = f.read(size)
+            while True:
+                try:
+                    return cls._HEADER_SERDE.from_bytes(data, 0)
+                except (struct.error, ValueError):
+                    if len(data) < size or data[:4] != b"GVAS":
+                        raise
+                data += f.read(size)
+                size *= 2
+
+    @final
+    @classmethod
+    def query_binary_file(cls, filepath: Path, query: str) -> Iterator[Any]:
+        segments = parse_query(query)
+        with (
+            filepath.open("rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+            memoryview(mapped) as data,
+        ):
+            _, offset = cls._HEADER_SERDE.from_bytes(data, 0)
+            yield from cls._BODY_SERDE.query_from_bytes(data, offset, segments)
+
+    @final
+    @classmethod
+    def query_binary_files(
+        cls,
+        filepaths: Iterable[Path],
+        query: str,
+        *,
+        workers: int = 0,
+    ) -> Iterator[tuple[Path, Any]]:
+        if workers <= 1:
+            for filepath in filepaths:
+                for value in cls.query_binary_file(filepath, query):
+                    yield filepath, value
+            return
+        filepaths = list(filepaths)
+        with process_pool(workers, _serde_modules()) as executor:
+            for filepath, (values, counts) in zip(
+                filepaths,
+                executor.map(counted, itertools.repeat(cls._query_values), filepaths, itertools.repeat(query)),
+                strict=True,
+            ):
+                merge(counts)
+                for value in values:
+                    yield filepath, value
+
+    @final
+    @classmethod
+    def _from_parts(cls, header: Any, body: Any) -> Self:
         self = cls.__new__(cls)
         self.header = header
         self.body = body
+        self._data = None
+        self._mapped = None
         return self
 
+    @final
+    @classmethod
+    def _query_values(cls, filepath: Path, query: str) -> list[Any]:
+        return list(cls.query_binary_file(filepath, query))
+
     @final
     def __init__(self) -> None:
         raise NotImplementedError(self.__class__.__name__)
 
     @final
-    def to_binary_file(self, filepath: Path) -> None:
-        body = self._BODY_SERDE.from_dict(self.body) + struct.pack("<I", 0)
-        self.header["bodysize"] = len(body)
-        header = self._HEADER_SERDE.from_dict(self.header)
-        with filepath.open("wb") as f:
-            f.write(header)
-            f.write(body)
+    def __enter__(self) -> Self:
+        return self
+
+    @final
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    @final
+    @override
+    def __reduce__(self) -> tuple[Any, ...]:
+        return self._from_parts, (self.header, self.body)
+
+    @final
+    def close(self) -> None:
+        if self._data is not None:
+            self._data.release()
+            self._data = None
+        if self._mapped is not None:
+            self._mapped.close()
+            self._mapped = None
+
+    @final
+    def get(self, name: str) -> Any:
+        return self.body.get(name)
+
+    @final
+    def to_binary_file(self, filepath: Path, *, compiled: bool = False) -> None:
+        start = time.perf_counter()
+        header_size = len(self._HEADER_SERDE.from_dict(self.header | {"bodysize": 0}))
+        buffer = bytearray(header_size)
+        token = OPTIONS.set(GVASOptions(compiled=compiled))
+        try:
+            self._BODY_SERDE.from_dict_into(self.body, buffer)
+        finally:
+            OPTIONS.reset(token)
+        buffer += struct.pack("<I", 0)
+        self.header["bodysize"] = len(buffer) - header_size
+        buffer[:header_size] = self._HEADER_SERDE.from_dict(self.header)
+        temporary = filepath.with_name(f"{filepath.name}.tmp")
+        with temporary.open("wb") as f:
+            f.write(buffer)
+        temporary.replace(filepath)
+        record("store", len(buffer), time.perf_counter() - start)
 
     @final
     def to_json_file(self, filepath: Path) -> None:
         with filepath.open("w", encoding="utf-8") as f:
-            json.dump({"header": self.header, "body": self.body}, f, indent=2)
+            json.dump({"header": self.header, "body": self.body}, f, indent=2, default=self._to_json)
@@ -0,0 +1,149 @@
+import os
+import struct
+from collections.abc import Callable
+from typing import Any, BinaryIO, ClassVar, final
+
+from .utils import GVASTruncatedError, read_name
+
+
+_UINT32 = struct.Struct("<I")
+
+
+@final
+class GVASBinaryReader:
+    __slots__ = ("_buffer", "_eof", "_file", "_offset", "_position", "window")
+
+    _MIN_WINDOW: ClassVar[int] = 1 << 10
+
+    window: int
+    _buffer: bytearray
+    _eof: bool
+    _file: BinaryIO
+    _offset: int
+    _position: int
+
+    def __init__(self, file: BinaryIO, window: int = 1 << 20) -> None:
+        if window < self._MIN_WINDOW:
+            raise ValueError(f"Invalid window {window}")
+        self._buffer = bytearray()
+        self._eof = False
+        self._file = file
+        self._offset = 0
+        self._position = 0
+        self.window = window
+
+    def decode(self, function: Callable[[bytearray, int], tuple[Any, int]], size: int) -> Any:
+        if len(self._buffer) - self._position < size:
+            self.ensure(size)
+        value, self._position = function(self._buffer, self._position)
+        return value
+
+    def decode_element(self, function: Callable[[bytearray, int], tuple[Any, int]], end: int | None = None) -> Any:
+        limit = self.window if end is None else min(self.window, end - self.tell())
+        available = self._fill_to(limit)
+        try:
+            value, self._position = function(self._buffer, self._position)
+        except (GVASTruncatedError, struct.error) as error:
+            if available < limit:
+                raise GVASTruncatedError(f"Unexpected end of stream at {self.tell() + available}") from error
+            if limit < self.window:
+                raise
+            raise ValueError(f"Element at {self.tell()} is larger than the window of {self.window} bytes") from error
+        return value
+
+    def ensure(self, size: int) -> None:
+        available = self._fill_to(size)
+        if available < size:
+            raise GVASTruncatedError(f"Unexpected end of stream at {self.tell() + available}")
+
+    def exhausted(self) -> bool:
+        return self._fill_to(1) == 0
+
+    def peek_uint32(self, offset: int) -> int:
+        if len(self._buffer) - self._position < offset + 4:
+            self.ensure(offset + 4)
+        return _UINT32.unpack_from(self._buffer, self._position + offset)[0]
+
+    def peek(self, size: int) -> tuple[bytearray, int]:
+        if len(self._buffer) - self._position < size:
+            self.ensure(size)
+        return self._buffer, self._position
+
+    def read(self, size: int) -> bytes:
+        self.ensure(size)
+        data = bytes(self._buffer[self._position : self._position + size])
+        self._position += size
+        return data
+
+    def read_name(self) -> str:
+        size = self.peek_uint32(0) + 4
+        if len(self._buffer) - self._position < size:
+            self.ensure(size)
+        value, size = read_name(self._buffer, self._position)
+        self._position += size
+        return value
+
+    def skip(self, size: int) -> None:
+        self._position += size
+
+    def tell(self) -> int:
+        return self._offset + self._position
+
+    def _fill_to(self, size: int) -> int:
+        available = len(self._buffer) - self._position
+        if available >= size or self._eof:
+            return available
+        if size > self.window:
+            raise ValueError(f"Element of {size} bytes at {self.tell()} is larger than the window of {self.window} bytes")
+        if self._position:
+            del self._buffer[: self._position]
+            self._offset += self._position
+            self._position = 0
+        while available < size:
+            chunk = self._file.read(self.window - available)
+            if not chunk:
+                self._eof = True
+                break
+            self._buffer += chunk
+            available += len(chunk)
+        return available
+
+
+@final
+class GVASBinaryWriter:
+    __slots__ = ("_file", "_flushed", "buffer", "chunk_size")
+
+    buffer: bytearray
+    chunk_size: int
+    _file: BinaryIO
+    _flushed: int
+
+    def __init__(self, file: BinaryIO, chunk_size: int = 1 << 20) -> None:
+        if chunk_size < 1:
+            raise ValueError(f"Invalid chunk size {chunk_size}")
+        self.buffer = bytearray()
+        self.chunk_size = chunk_size
+        self._file = file
+        self._flushed = 0
+
+    def close(self) -> None:
+        self._file.write(self.buffer)
+        self._flushed += len(self.buffer)
+        self.buffer.clear()
+
+    def flush(self) -> None:
+        if len(self.buffer) >= self.chunk_size:
+            self.close()
+
+    def patch(self, position: int, data: bytes) -> None:
+        split = min(max(self._flushed - position, 0), len(data))
+        if split > 0:
+            self._file.seek(position)
+            self._file.write(data[:split])
+            self._file.seek(0, os.SEEK_END)
+        if split < len(data):
+            start = position + split - self._flushed
+            self.buffer[start : start + len(data) - split] = data[split:]
+
+    def tell(self) -> int:
+        return self._flushed + len(self.buffer)
@@ -0,0 +1,66 @@
+import hashlib
+import marshal
+import os
+from pathlib import Path
+from typing import Any, ClassVar, final
+
+
+@final
+class GVASCache:
+    __slots__ = ("directory", "max_size")
+
+    _DIGEST_SIZE: ClassVar[int] = 32
+    _VERSION: ClassVar[int] = 1
+
+    directory: Path
+    max_size: int
+
+    def __init__(self, directory: Path, max_size: int = 1 << 30) -> None:
+        self.directory = directory
+        self.max_size = max_size
+
+    def key(self, save_class: type, filepath: Path, data: bytes) -> tuple[Path, bytes]:
+        status = filepath.stat()
+        fingerprint = (
+            f"{self._VERSION}:{marshal.version}:{save_class.__module__}.{save_class.__qualname__}:"
+            f"{filepath.resolve()}:{status.st_size}:{status.st_mtime_ns}"
+        )
+        name = hashlib.blake2b(fingerprint.encode("utf-8"), digest_size=16).hexdigest()
+        return self.directory / f"{name}.cache", hashlib.blake2b(data, digest_size=self._DIGEST_SIZE).digest()
+
+    def load(self, key: tuple[Path, bytes]) -> tuple[Any, Any] | None:
+        entry, digest = key
+        try:
+            with entry.open("rb") as f:
+                if f.read(self._DIGEST_SIZE) != digest:
+                    return None
+                header, body = marshal.loads(f.read())  # noqa: S302
+            os.utime(entry)
+        except (EOFError, OSError, TypeError, ValueError):
+            return None
+        return header, body
+
+    def store(self, key: tuple[Path, bytes], header: Any, body: Any) -> None:
+        entry, digest = key
+        self.directory.mkdir(parents=True, exist_ok=True)
+        temporary = entry.with_name(f"{entry.name}.{os.getpid()}.tmp")
+        with temporary.open("wb") as f:
+            f.write(digest)
+            f.write(marshal.dumps((header, body)))
+        temporary.replace(entry)
+        self._evict()
+
+    def _evict(self) -> None:
+        entries: list[tuple[int, int, Path]] = []
+        for entry in self.directory.glob("*.cache"):
+            try:
+                status = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((status.st_mtime_ns, status.st_size, entry))
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries):
+            if total <= self.max_size:
+                break
+            entry.unlink(missing_ok=True)
+            total -= size
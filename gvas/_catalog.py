@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple, final
+
+from ._stats import counted, merge
+
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from pathlib import Path
+
+    from ._base import GVASSave
+
+
+class GVASCatalogEntry(NamedTuple):
+    path: str
+    size: int
+    mtime: int
+    offset: int
+    header: dict[str, Any]
+
+
+@final
+class GVASCatalog:
+    __slots__ = ("entries", "errors", "filepath", "save_class")
+
+    _VERSION: ClassVar[int] = 1
+
+    entries: dict[str, GVASCatalogEntry]
+    errors: dict[str, str]
+    filepath: Path | None
+    save_class: type[GVASSave]
+
+    @staticmethod
+    def _flatten(value: Any, prefix: str) -> Iterator[tuple[str, Any]]:
+        if isinstance(value, dict):
+            for key, child in value.items():
+                yield from GVASCatalog._flatten(child, f"{prefix}.{key}" if prefix else key)
+        else:
+            yield prefix, value
+
+    def __init__(self, save_class: type[GVASSave], filepath: Path | None = None) -> None:
+        self.entries = {}
+        self.errors = {}
+        self.filepath = filepath
+        self.save_class = save_class
+        if filepath is None or not filepath.is_file():
+            return
+        with filepath.open("r", encoding="utf-8") as f:
+            catalog = json.load(f)
+        if catalog.get("version") != self._VERSION:
+            return
+        for entry in catalog["entries"]:
+            self.entries[entry["path"]] = GVASCatalogEntry(**entry)
+
+    def __iter__(self) -> Iterator[GVASCatalogEntry]:
+        return iter(self.entries.values())
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def refresh(self, directories: Iterable[Path], *, pattern: str = "*.sav", workers: int = 0) -> list[str]:
+        found: dict[str, tuple[Path, int, int]] = {}
+        for directory in directories:
+            for filepath in directory.rglob(pattern):
+                try:
+                    status = filepath.stat()
+                except FileNotFoundError:
+                    continue
+                found[str(filepath)] = (filepath, status.st_size, status.st_mtime_ns)
+        for path in self.entries.keys() - found.keys():
+            del self.entries[path]
+        self.errors = {}
+        changed = [
+            (path, filepath, size, mtime)
+            for path, (filepath, size, mtime) in found.items()
+            if (entry := self.entries.get(path)) is None or entry.size != size or entry.mtime != mtime
+        ]
+        peeked: list[tuple[dict[str, Any], int] | BaseException] = []
+        if workers > 1 and len(changed) > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(counted, self.save_class.peek_header, filepath) for _, filepath, _, _ in changed
+                ]
+                for future in futures:
+                    error = future.exception()
+                    if error is None:
+                        result, counts = future.result()
+                        merge(counts)
+                        peeked.append(result)
+                    else:
+                        peeked.append(error)
+        else:
+            for _, filepath, _, _ in changed:
+                try:
+                    peeked.append(self.save_class.peek_header(filepath))
+                except Exception as error:  # noqa: BLE001
+                    peeked.append(error)
+        updated: list[str] = []
+        for (path, _, size, mtime), result in zip(changed, peeked, strict=True):
+            if isinstance(result, BaseException):
+                self.entries.pop(path, None)
+                self.errors[path] = str(result)
+                continue
+            header, offset = result
+            self.entries[path] = GVASCatalogEntry(path, size, mtime, offset, header)
+            updated.append(path)
+        self.entries = dict(sorted(self.entries.items()))
+        return updated
+
+    def rows(self) -> list[dict[str, Any]]:
+        return [
+            {"path": entry.path, "size": entry.size, "mtime": entry.mtime, "offset": entry.offset}
+            | dict(self._flatten(entry.header, ""))
+            for entry in self.entries.values()
+        ]
+
+    def store(self, filepath: Path | None = None) -> None:
+        filepath = self.filepath if filepath is None else filepath
+        if filepath is None:
+            raise ValueError("Catalog has no file path")
+        temporary = filepath.with_name(f"{filepath.name}.{os.getpid()}.tmp")
+        with temporary.open("w", encoding="utf-8") as f:
+            json.dump(
+                {"version": self._VERSION, "entries": [entry._asdict() for entry in self.entries.values()]},
+                f,
+                indent=2,
+            )
+        temporary.replace(filepath)
@@ -0,0 +1,241 @@
+import json
+import queue
+import re
+import threading
+from collections.abc import Callable
+from typing import Any, TextIO, final
+
+
+_KEY = re.compile(r'"([^"\\]*)"[ \t\n\r]*:[ \t\n\r]*')
+_SEPARATOR = re.compile(r"[ \t\n\r]*(,?)[ \t\n\r]*")
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+@final
+class GVASJSONReader:
+    __slots__ = ("_buffer", "_decoder", "_eof", "_file", "_firsts", "_position", "chunk_size")
+
+    chunk_size: int
+    _buffer: str
+    _decoder: json.JSONDecoder
+    _eof: bool
+    _file: TextIO
+    _firsts: list[bool]
+    _position: int
+
+    def __init__(self, file: TextIO, chunk_size: int = 1 << 20) -> None:
+        if chunk_size < 1:
+            raise ValueError(f"Invalid chunk size {chunk_size}")
+        self.chunk_size = chunk_size
+        self._buffer = ""
+        self._decoder = json.JSONDecoder()
+        self._eof = False
+        self._file = file
+        self._firsts = []
+        self._position = 0
+
+    def begin_array(self) -> None:
+        self._expect("[")
+        self._firsts.append(True)
+
+    def begin_object(self) -> None:
+        self._expect("{")
+        self._firsts.append(True)
+
+    def buffered_value(self) -> Any:
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            else:
+                if end < len(self._buffer) or self._eof:
+                    self._position = end
+                    return value
+            if len(self._buffer) - self._position >= self.chunk_size:
+                return None
+            self._fill(self.chunk_size)
+
+    def close(self) -> None:
+        if self._peek() != "":
+            raise ValueError(f"Unexpected data at {self._position}")
+
+    def end_object(self) -> None:
+        key = self.next_key()
+        if key is not None:
+            raise ValueError(f"Unexpected key {key} at {self._position}")
+
+    def expect_key(self, name: str) -> None:
+        key = self.next_key()
+        if key != name:
+            raise ValueError(f"Expected key {name} instead of {key} at {self._position}")
+
+    def next_item(self) -> bool:
+        return self._next("]")
+
+    def next_key(self) -> str | None:
+        if not self._next("}"):
+            return None
+        match = _KEY.match(self._buffer, self._position)
+        if match is not None:
+            self._position = match.end()
+            return match.group(1)
+        if self._peek() != '"':
+            raise ValueError(f"Expected key at {self._position}")
+        key = self.value()
+        self._expect(":")
+        return key
+
+    def value(self) -> Any:
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            else:
+                if end < len(self._buffer) or self._eof:
+                    self._position = end
+                    return value
+            self._fill(max(self.chunk_size, len(self._buffer)))
+
+    def _expect(self, token: str) -> None:
+        if self._peek() != token:
+            raise ValueError(f"Expected {token} at {self._position}")
+        self._position += 1
+
+    def _fill(self, size: int) -> None:
+        chunk = self._file.read(size)
+        if not chunk:
+            self._eof = True
+            return
+        self._buffer = self._buffer[self._position :] + chunk
+        self._position = 0
+
+    def _next(self, closer: str) -> bool:
+        while True:
+            match = _SEPARATOR.match(self._buffer, self._position)
+            position = match.end()
+            if position < len(self._buffer) or self._eof:
+                break
+            self._fill(self.chunk_size)
+        self._position = position
+        first = self._firsts[-1]
+        if match.group(1):
+            if first:
+                raise ValueError(f"Unexpected , at {position}")
+        elif self._buffer[position : position + 1] == closer:
+            self._position += 1
+            self._firsts.pop()
+            return False
+        elif not first:
+            raise ValueError(f"Expected , at {position}")
+        self._firsts[-1] = False
+        return True
+
+    def _peek(self) -> str:
+        while True:
+            position = self._position = _WHITESPACE.match(self._buffer, self._position).end()
+            if position < len(self._buffer):
+                return self._buffer[position]
+            if self._eof:
+                return ""
+            self._fill(self.chunk_size)
+
+
+@final
+class GVASJSONWriter:
+    __slots__ = ("_chunks", "_closers", "_default", "_error", "_firsts", "_queue", "_size", "_thread", "chunk_size")
+
+    chunk_size: int
+    _chunks: list[str]
+    _closers: list[str]
+    _default: Callable[[Any], Any]
+    _error: OSError | ValueError | None
+    _firsts: list[bool]
+    _queue: queue.Queue[str | None]
+    _size: int
+    _thread: threading.Thread
+
+    def __init__(self, file: TextIO, default: Callable[[Any], Any], chunk_size: int = 1 << 20) -> None:
+        if chunk_size < 1:
+            raise ValueError(f"Invalid chunk size {chunk_size}")
+        self.chunk_size = chunk_size
+        self._chunks = []
+        self._closers = []
+        self._default = default
+        self._error = None
+        self._firsts = []
+        self._queue = queue.Queue(maxsize=8)
+        self._size = 0
+        self._thread = threading.Thread(target=self._drain, args=(file,), daemon=True)
+        self._thread.start()
+
+    def abort(self) -> None:
+        self._chunks = []
+        self._size = 0
+        self._queue.put(None)
+        self._thread.join()
+
+    def begin_array(self) -> None:
+        self._write("[")
+        self._closers.append("]")
+        self._firsts.append(True)
+
+    def begin_object(self) -> None:
+        self._write("{")
+        self._closers.append("}")
+        self._firsts.append(True)
+
+    def close(self) -> None:
+        if self._chunks:
+            self._queue.put("".join(self._chunks))
+            self._chunks = []
+            self._size = 0
+        self._queue.put(None)
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+    def end(self) -> None:
+        closer = self._closers.pop()
+        if not self._firsts.pop():
+            self._write("\n" + "  " * len(self._firsts))
+        self._write(closer)
+
+    def item(self) -> None:
+        level = len(self._firsts)
+        if self._firsts[-1]:
+            self._firsts[-1] = False
+            self._write("\n" + "  " * level)
+        else:
+            self._write(",\n" + "  " * level)
+
+    def key(self, name: str) -> None:
+        self.item()
+        self._write(json.dumps(name) + ": ")
+
+    def value(self, value: Any) -> None:
+        text = json.dumps(value, indent=2, default=self._default)
+        if "\n" in text:
+            text = text.replace("\n", "\n" + "  " * len(self._firsts))
+        self._write(text)
+
+    def _drain(self, file: TextIO) -> None:
+        while (chunk := self._queue.get()) is not None:
+            if self._error is None:
+                try:
+                    file.write(chunk)
+                except (OSError, ValueError) as e:
+                    self._error = e
+
+    def _write(self, text: str) -> None:
+        self._chunks.append(text)
+        self._size += len(text)
+        if self._size >= self.chunk_size:
+            self._queue.put("".join(self._chunks))
+            self._chunks = []
+            self._size = 0
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, NamedTuple
+
+
+if TYPE_CHECKING:
+    from ._pool import GVASPool
+    from ._profiler import GVASProfiler
+
+
+class GVASOptions(NamedTuple):
+    arrays: bool = False
+    compiled: bool = False
+    lazy: bool = False
+    nodes: bool = False
+    numpy: bool = False
+    validation: str = "strict"
+
+
+DEFAULT_OPTIONS = GVASOptions()
+OPTIONS: ContextVar[GVASOptions] = ContextVar("OPTIONS", default=DEFAULT_OPTIONS)
+POOL: ContextVar[GVASPool | None] = ContextVar("POOL", default=None)
+PROFILER: ContextVar[GVASProfiler | None] = ContextVar("PROFILER", default=None)
+PROJECTION: ContextVar[tuple[tuple[str, ...], ...] | None] = ContextVar("PROJECTION", default=None)
+VALIDATIONS = ("strict", "basic", "trusted")
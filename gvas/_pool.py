@@ -0,0 +1,42 @@
+import importlib
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, final
+
+
+def _import_modules(modules: tuple[str, ...]) -> None:
+    for module in modules:
+        importlib.import_module(module)
+
+
+def process_pool(workers: int | None, modules: tuple[str, ...]) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(max_workers=workers, initializer=_import_modules, initargs=(modules,))
+
+
+@final
+class GVASPool:
+    __slots__ = ("_executor", "_modules", "filepath", "threshold", "workers")
+
+    _executor: ProcessPoolExecutor | None
+    _modules: tuple[str, ...]
+    filepath: Path
+    threshold: int
+    workers: int
+
+    def __init__(self, filepath: Path, workers: int, threshold: int, modules: tuple[str, ...]) -> None:
+        self._executor = None
+        self._modules = modules
+        self.filepath = filepath
+        self.threshold = threshold
+        self.workers = workers
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def submit(self, function: Callable[..., Any], /, *args: Any) -> Future[Any]:
+        if self._executor is None:
+            self._executor = process_pool(self.workers, self._modules)
+        return self._executor.submit(function, *args)
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Any, NamedTuple, Self, final
+
+from ._options import PROFILER
+
+
+if TYPE_CHECKING:
+    from contextvars import Token
+    from pathlib import Path
+
+
+class GVASProfileEntry(NamedTuple):
+    category: str
+    type: str
+    count: int
+    seconds: float
+    self_seconds: float
+    bytes: int
+
+
+@final
+class GVASProfiler:
+    __slots__ = ("_children", "_origin", "_token", "_totals", "events")
+
+    _children: list[int]
+    _origin: int
+    _token: Token[GVASProfiler | None] | None
+    _totals: dict[tuple[str, str], list[int]]
+    events: list[tuple[str, str, str, int, int, int, int]]
+
+    def __init__(self) -> None:
+        self._children = [0]
+        self._origin = time.perf_counter_ns()
+        self._token = None
+        self._totals = {}
+        self.events = []
+
+    def __enter__(self) -> Self:
+        self._token = PROFILER.set(self)
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        if self._token is not None:
+            PROFILER.reset(self._token)
+            self._token = None
+
+    def begin(self) -> int:
+        self._children.append(0)
+        return time.perf_counter_ns()
+
+    def end(self, start: int, category: str, name: str, property_type: str, offset: int, size: int) -> None:
+        duration = time.perf_counter_ns() - start
+        children = self._children.pop()
+        self._children[-1] += duration
+        self.events.append((category, name, property_type, start, duration, offset, size))
+        total = self._totals.get((category, property_type))
+        if total is None:
+            total = self._totals[category, property_type] = [0, 0, 0, 0]
+        total[0] += 1
+        total[1] += duration
+        total[2] += duration - children
+        total[3] += size
+
+    def summary(self) -> list[GVASProfileEntry]:
+        entries = [
+            GVASProfileEntry(category, property_type, count, duration / 1e9, self_duration / 1e9, size)
+            for (category, property_type), (count, duration, self_duration, size) in self._totals.items()
+        ]
+        return sorted(entries, key=lambda entry: entry.self_seconds, reverse=True)
+
+    def to_chrome_trace(self, filepath: Path) -> None:
+        process = os.getpid()
+        thread = threading.get_ident()
+        events: list[dict[str, Any]] = [
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (start - self._origin) / 1e3,
+                "dur": duration / 1e3,
+                "pid": process,
+                "tid": thread,
+                "args": {"type": property_type, "offset": offset, "size": size},
+            }
+            for category, name, property_type, start, duration, offset, size in self.events
+        ]
+        with filepath.open("w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
@@ -0,0 +1,33 @@
+import re
+from collections.abc import Iterator, Mapping
+from fnmatch import fnmatchcase
+from typing import Any
+
+
+_PROPERTY_KEYS = frozenset(("type", "value"))
+_SEGMENT = re.compile(r"[^.\[\]]+")
+
+
+def parse_query(query: str) -> tuple[str, ...]:
+    segments = tuple(_SEGMENT.findall(query))
+    if not segments:
+        raise ValueError(f"Invalid query {query!r}")
+    return segments
+
+
+def select(value: Any, segments: tuple[str, ...]) -> Iterator[Any]:
+    if not segments:
+        yield value
+        return
+    pattern = segments[0]
+    if isinstance(value, Mapping):
+        if pattern not in _PROPERTY_KEYS and value.keys() == _PROPERTY_KEYS:
+            yield from select(value["value"], segments)
+            return
+        for key, item in value.items():
+            if fnmatchcase(str(key), pattern):
+                yield from select(item, segments[1:])
+    elif isinstance(value, list | tuple):
+        for index, item in enumerate(value):
+            if fnmatchcase(str(index), pattern):
+                yield from select(item, segments[1:])
@@ -0,0 +1,98 @@
+from collections import Counter, defaultdict
+from collections.abc import Callable, Mapping
+from typing import Any
+
+
+COMPILED_DECODED: defaultdict[tuple[str, ...], int] = defaultdict(int)
+COMPILED_ENCODED: defaultdict[tuple[str, ...], int] = defaultdict(int)
+COUNTERS: defaultdict[str, int] = defaultdict(int)
+DECODED: defaultdict[str, int] = defaultdict(int)
+ENCODED: defaultdict[str, int] = defaultdict(int)
+SECONDS: defaultdict[str, float] = defaultdict(float)
+TYPES_CREATED: defaultdict[str, int] = defaultdict(int)
+
+_MAX_SECONDS: dict[str, float] = {}
+_TOTALS: tuple[defaultdict[Any, Any], ...] = (
+    COMPILED_DECODED,
+    COMPILED_ENCODED,
+    COUNTERS,
+    DECODED,
+    ENCODED,
+    SECONDS,
+    TYPES_CREATED,
+)
+
+
+def _expand(counts: dict[str, int], compiled: dict[tuple[str, ...], int]) -> dict[str, int]:
+    expanded = Counter(counts)
+    for labels, count in compiled.items():
+        for label in labels:
+            expanded[label] += count
+    return dict(sorted(expanded.items()))
+
+
+def _hits(name: str) -> int:
+    return COUNTERS.get(f"{name}_lookups", 0) - COUNTERS.get(f"{name}_misses", 0)
+
+
+def counted(function: Callable[..., Any], /, *args: Any, **kwargs: Any) -> tuple[Any, tuple[Any, ...]]:
+    reset_stats()
+    result = function(*args, **kwargs)
+    return result, (tuple(dict(totals) for totals in _TOTALS), dict(_MAX_SECONDS))
+
+
+def lookup[K, V](registry: Mapping[K, V], key: K) -> V | None:
+    value = registry.get(key)
+    COUNTERS["registry_lookups"] += 1
+    if value is None:
+        COUNTERS["registry_misses"] += 1
+    return value
+
+
+def merge(counts: tuple[Any, ...]) -> None:
+    totals, maximums = counts
+    for target, source in zip(_TOTALS, totals, strict=True):
+        for key, value in source.items():
+            target[key] += value
+    for operation, seconds in maximums.items():
+        if seconds > _MAX_SECONDS.get(operation, 0.0):
+            _MAX_SECONDS[operation] = seconds
+
+
+def record(operation: str, size: int, seconds: float) -> None:
+    COUNTERS[operation] += 1
+    COUNTERS[f"{operation}_bytes"] += size
+    SECONDS[operation] += seconds
+    if seconds > _MAX_SECONDS.get(operation, 0.0):
+        _MAX_SECONDS[operation] = seconds
+
+
+def reset_stats() -> None:
+    for totals in _TOTALS:
+        totals.clear()
+    _MAX_SECONDS.clear()
+
+
+def stats() -> dict[str, Any]:
+    return {
+        "properties_decoded": _expand(DECODED, COMPILED_DECODED),
+        "properties_encoded": _expand(ENCODED, COMPILED_ENCODED),
+        "bytes_decoded": COUNTERS.get("load_bytes", 0),
+        "bytes_encoded": COUNTERS.get("store_bytes", 0),
+        "types_created": dict(sorted(TYPES_CREATED.items())),
+        "descriptor_hits": _hits("descriptor"),
+        "descriptor_misses": COUNTERS.get("descriptor_misses", 0),
+        "registry_hits": _hits("registry"),
+        "registry_misses": COUNTERS.get("registry_misses", 0),
+        "strings_read": COUNTERS.get("strings_read", 0),
+        "loads": {
+            "count": COUNTERS.get("load", 0),
+            "seconds": SECONDS.get("load", 0.0),
+            "max_seconds": _MAX_SECONDS.get("load", 0.0),
+        },
+        "stores": {
+            "count": COUNTERS.get("store", 0),
+            "seconds": SECONDS.get("store", 0.0),
+            "max_seconds": _MAX_SECONDS.get("store", 0.0),
+        },
+    }
@@ -0,0 +1,63 @@
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from ._corpus import SIZES, VERSIONS
+from ._measure import OPERATIONS, compare, measure
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m gvas.bench", description="Benchmark GVAS parsing and writing")
+    commands = parser.add_subparsers(dest="command", required=True)
+    run = commands.add_parser("run", help="measure synthetic saves")
+    run.add_argument("--size", action="append", choices=tuple(SIZES), help="corpus size, repeatable")
+    run.add_argument("--version", action="append", choices=tuple(VERSIONS), help="save version, repeatable")
+    run.add_argument("--repeat", type=int, default=3)
+    run.add_argument("--no-memory", action="store_true", help="skip the peak memory runs")
+    run.add_argument("--output", type=Path, default=Path("bench.json"))
+    for field in SIZES["small"]._fields:
+        run.add_argument(f"--{field}", type=int, help=f"override the number of {field}")
+    comparison = commands.add_parser("compare", help="compare results against a baseline")
+    comparison.add_argument("baseline", type=Path)
+    comparison.add_argument("current", type=Path)
+    comparison.add_argument("--threshold", type=float, default=1.1, help="slowdown ratio reported as a regression")
+    args = parser.parse_args()
+
+    if args.command == "run":
+        overrides = {
+            field: getattr(args, field) for field in SIZES["small"]._fields if getattr(args, field) is not None
+        }
+        specs = {size: SIZES[size]._replace(**overrides) for size in args.size or ("small",)}
+        results = measure(specs, tuple(args.version or VERSIONS), memory=not args.no_memory, repeat=args.repeat)
+        args.output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        for corpus, result in results["corpora"].items():
+            print(f"{corpus}: {result['bytes']} bytes, {result['properties']} properties")
+            for operation in OPERATIONS:
+                measurement = result["operations"].get(operation)
+                if measurement is not None:
+                    rate = measurement["properties_per_s"]
+                    peak = measurement["peak_bytes"]
+                    print(
+                        f"  {operation:<13}{measurement['seconds'] * 1e3:>10.2f} ms"
+                        f"{measurement['mb_per_s'] or 0:>10.2f} MB/s"
+                        + (f"{rate:>12.0f} properties/s" if rate is not None else " " * 25)
+                        + (f"{peak / 1e6:>10.2f} MB peak" if peak is not None else ""),
+                    )
+    else:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        current = json.loads(args.current.read_text(encoding="utf-8"))
+        regressions = 0
+        for row in compare(baseline, current):
+            regression = row.ratio > args.threshold
+            regressions += regression
+            print(
+                f"{row.corpus:<12}{row.operation:<13}{row.baseline * 1e3:>10.2f} ms{row.current * 1e3:>10.2f} ms"
+                f"{row.ratio:>8.2f}x" + ("  regression" if regression else ""),
+            )
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
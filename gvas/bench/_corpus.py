@@ -0,0 +1,139 @@
+import struct
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from .. import GVASSave
+from ..headers import GVASHeaderSerde
+from ..utils import write_string
+from ..v2.properties import GVASStructPropertySerde
+from ..v3.properties import GVASBlueprintStructPropertySerde
+
+
+class GVASBenchV2Save(GVASSave):
+    __slots__ = ()
+
+    _BODY_SERDE = GVASStructPropertySerde
+    _HEADER_SERDE = GVASHeaderSerde
+
+
+class GVASBenchV3Save(GVASSave):
+    __slots__ = ()
+
+    _BODY_SERDE = GVASBlueprintStructPropertySerde
+    _HEADER_SERDE = GVASHeaderSerde
+
+
+class GVASCorpusSpec(NamedTuple):
+    arrays: int
+    maps: int
+    numerics: int
+    strings: int
+    structs: int
+
+
+SIZES = {
+    "small": GVASCorpusSpec(arrays=16, maps=64, numerics=1024, strings=64, structs=64),
+    "medium": GVASCorpusSpec(arrays=256, maps=2048, numerics=65536, strings=1024, structs=2048),
+    "large": GVASCorpusSpec(arrays=1024, maps=16384, numerics=1048576, strings=4096, structs=16384),
+}
+VERSIONS: dict[str, type[GVASSave]] = {"v2": GVASBenchV2Save, "v3": GVASBenchV3Save}
+
+_HEADER = {
+    "save_version": {"major": 3, "minor": 3, "patch": 1},
+    "ue_version": {"major": 5, "minor": 4, "patch": 4, "tweak": 0, "build": 0, "branch": "++UE5+Release-5.4"},
+    "custom_version": {"00000000-0000-0000-0000-000000000001": 3},
+    "blueprint": "/Script/Bench.Save",
+}
+_ITEM_TYPE = {"type": "StructProperty", "blueprint": "/Script/Bench", "name": "Item"}
+_VECTOR_TYPE = {"type": "StructProperty", "blueprint": "/Script/CoreUObject", "name": "Vector"}
+
+
+def _v2_item(index: int) -> bytes:
+    return (
+        _v2_property("Count", "IntProperty", b"\0", struct.pack("<i", index))
+        + _v2_property("Name", "StrProperty", b"\0", write_string(f"Item_{index}"))
+        + _v2_property("Ratio", "FloatProperty", b"\0", struct.pack("<f", index / 2))
+        + write_string("None")
+    )
+
+
+def _v2_property(name: str, property_type: str, header: bytes, value: bytes) -> bytes:
+    return write_string(name, property_type) + struct.pack("<II", len(value), 0) + header + value
+
+
+def _v3_item(index: int) -> dict[str, dict[str, Any]]:
+    return {
+        "Count": {"type": {"type": "IntProperty"}, "value": index},
+        "Name": {"type": {"type": "NameProperty"}, "value": f"Item_{index}"},
+        "Location": {"type": _VECTOR_TYPE, "value": {"x": float(index), "y": 2.0, "z": 3.0}},
+        "Ratio": {"type": {"type": "FloatProperty"}, "value": index / 2},
+    }
+
+
+def create_v2_file(spec: GVASCorpusSpec, filepath: Path) -> None:
+    body = bytearray()
+    for index in range(spec.strings):
+        body += _v2_property(f"String_{index}", "StrProperty", b"\0", write_string(f"String {index}"))
+    for index in range(spec.arrays):
+        values = struct.pack("<I", 8) + write_string(*(f"{index}.{position}" for position in range(8)))
+        body += _v2_property(f"Array_{index}", "ArrayProperty", write_string("StrProperty") + b"\0", values)
+    floats = struct.pack(f"<I{spec.numerics}f", spec.numerics, *(position / 2 for position in range(spec.numerics)))
+    body += _v2_property("Floats", "ArrayProperty", write_string("FloatProperty") + b"\0", floats)
+    ints = struct.pack(f"<I{spec.numerics}i", spec.numerics, *range(spec.numerics))
+    body += _v2_property("Ints", "ArrayProperty", write_string("IntProperty") + b"\0", ints)
+    items = b"".join(_v2_item(index) for index in range(spec.structs))
+    body += _v2_property(
+        "Items",
+        "ArrayProperty",
+        write_string("StructProperty") + b"\0",
+        struct.pack("<I", spec.structs)
+        + write_string("Items", "StructProperty")
+        + struct.pack("<II", len(items), 0)
+        + write_string("BenchItem")
+        + bytes(17)
+        + items,
+    )
+    entries = b"".join(write_string(f"Key_{index}") + struct.pack("<i", index) for index in range(spec.maps))
+    body += _v2_property(
+        "ItemMap",
+        "MapProperty",
+        write_string("StrProperty", "IntProperty") + b"\0",
+        struct.pack("<II", 0, spec.maps) + entries,
+    )
+    body += write_string("None")
+    filepath.write_bytes(GVASHeaderSerde.from_dict(_HEADER) + body + struct.pack("<I", 0))
+
+
+def create_v3_file(spec: GVASCorpusSpec, filepath: Path) -> None:
+    save = GVASBenchV3Save.__new__(GVASBenchV3Save)
+    save.header = dict(_HEADER)
+    body: dict[str, dict[str, Any]] = {}
+    for index in range(spec.strings):
+        body[f"String_{index}"] = {"type": {"type": "StrProperty"}, "value": f"String {index}"}
+    for index in range(spec.arrays):
+        body[f"Array_{index}"] = {
+            "type": {"type": "ArrayProperty"},
+            "value": {"type": {"type": "StrProperty"}, "values": [f"{index}.{position}" for position in range(8)]},
+        }
+    body["Floats"] = {
+        "type": {"type": "ArrayProperty"},
+        "value": {"type": {"type": "FloatProperty"}, "values": [position / 2 for position in range(spec.numerics)]},
+    }
+    body["Ints"] = {
+        "type": {"type": "ArrayProperty"},
+        "value": {"type": {"type": "IntProperty"}, "values": list(range(spec.numerics))},
+    }
+    body["Items"] = {
+        "type": {"type": "ArrayProperty"},
+        "value": {"type": _ITEM_TYPE, "values": [_v3_item(index) for index in range(spec.structs)]},
+    }
+    body["ItemMap"] = {
+        "type": {"type": "MapProperty"},
+        "value": {
+            "key_type": {"type": "StrProperty"},
+            "value_type": _ITEM_TYPE,
+            "values": [[f"Key_{index}", _v3_item(index)] for index in range(spec.maps)],
+        },
+    }
+    save.body = body
+    save.to_binary_file(filepath)
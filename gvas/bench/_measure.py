@@ -0,0 +1,147 @@
+import gc
+import mmap
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable, Iterator, Mapping
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from ._corpus import VERSIONS, GVASCorpusSpec, create_v2_file, create_v3_file
+
+
+class GVASComparison(NamedTuple):
+    corpus: str
+    operation: str
+    baseline: float
+    current: float
+    ratio: float
+
+
+OPERATIONS = ("header_parse", "body_parse", "serialize", "json_export", "json_import")
+
+_CREATORS: dict[str, Callable[[GVASCorpusSpec, Path], None]] = {"v2": create_v2_file, "v3": create_v3_file}
+_HEADER_ITERATIONS = 1000
+_WRITABLE = frozenset(("v3",))
+
+
+def _count_properties(value: Any) -> int:
+    count = 0
+    stack = [value]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, Mapping):
+            if "type" in value and "value" in value:
+                count += 1
+            stack.extend(value.values())
+        elif isinstance(value, list | tuple):
+            stack.extend(value)
+    return count
+
+
+def _operations(version: str, filepath: Path, directory: Path) -> Iterator[tuple[str, Callable[[], Any]]]:
+    save_class = VERSIONS[version]
+
+    def header_parse() -> None:
+        with (
+            filepath.open("rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+            memoryview(mapped) as data,
+        ):
+            for _ in range(_HEADER_ITERATIONS):
+                save_class._HEADER_SERDE.from_bytes(data, 0)
+
+    json_filepath = directory / f"{filepath.stem}.json"
+    save = save_class.from_binary_file(filepath)
+    yield "header_parse", header_parse
+    yield "body_parse", lambda: save_class.from_binary_file(filepath)
+    if version in _WRITABLE:
+        yield "serialize", lambda: save.to_binary_file(directory / f"{filepath.stem}.out.sav")
+    yield "json_export", lambda: save_class.binary_file_to_json_file(filepath, json_filepath)
+    if version in _WRITABLE:
+        yield "json_import", lambda: save_class.json_file_to_binary_file(json_filepath, directory / "import.sav")
+
+
+def _peak_memory(function: Callable[[], Any]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _seconds(function: Callable[[], Any], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def compare(baseline: Mapping[str, Any], current: Mapping[str, Any]) -> list[GVASComparison]:
+    rows: list[GVASComparison] = []
+    for corpus, result in current["corpora"].items():
+        reference = baseline["corpora"].get(corpus)
+        if reference is None:
+            continue
+        for operation, measurement in result["operations"].items():
+            previous = reference["operations"].get(operation)
+            if previous is None:
+                continue
+            ratio = measurement["seconds"] / previous["seconds"] if previous["seconds"] else float("inf")
+            rows.append(GVASComparison(corpus, operation, previous["seconds"], measurement["seconds"], ratio))
+    return rows
+
+
+def measure(
+    specs: Mapping[str, GVASCorpusSpec],
+    versions: tuple[str, ...] = tuple(VERSIONS),
+    *,
+    memory: bool = True,
+    repeat: int = 3,
+) -> dict[str, Any]:
+    corpora: dict[str, Any] = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for name, spec in specs.items():
+            for version in versions:
+                save_class = VERSIONS[version]
+                filepath = Path(directory, f"{version}-{name}.sav")
+                _CREATORS[version](spec, filepath)
+                size = filepath.stat().st_size
+                save = save_class.from_binary_file(filepath)
+                header_size = len(save_class._HEADER_SERDE.from_dict(save.header))
+                properties = _count_properties(save.body)
+                del save
+                operations: dict[str, Any] = {}
+                for operation, function in _operations(version, filepath, Path(directory)):
+                    seconds = _seconds(function, repeat)
+                    if operation == "header_parse":
+                        processed = header_size * _HEADER_ITERATIONS
+                        count = 0
+                    else:
+                        processed = size
+                        count = properties
+                    operations[operation] = {
+                        "seconds": seconds,
+                        "mb_per_s": processed / seconds / 1e6 if seconds else None,
+                        "properties_per_s": count / seconds if count and seconds else None,
+                        "peak_bytes": _peak_memory(function) if memory else None,
+                    }
+                corpora[f"{version}-{name}"] = {
+                    "spec": spec._asdict(),
+                    "bytes": size,
+                    "properties": properties,
+                    "operations": operations,
+                }
+    return {
+        "python": sys.version,
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "corpora": corpora,
+    }
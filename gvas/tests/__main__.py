@@ -1,8 +1,34 @@
 import unittest
 
+from ._bench import GVASBenchTest
+from ._cache import GVASCacheTest
+from ._catalog import GVASCatalogTest
+from ._json import GVASJSONTest
+from ._lazy import GVASLazyTest
+from ._nodes import GVASNodeTest
+from ._parallel import GVASParallelTest
+from ._profiler import GVASProfilerTest
+from ._query import GVASQueryTest
+from ._saves import GVASSaveTest
+from ._stats import GVASStatsTest
+from ._streams import GVASStreamTest
 from ._utils import GVASUtilsTest
 
 
-__all__ = ["GVASUtilsTest"]
+__all__ = [
+    "GVASBenchTest",
+    "GVASCacheTest",
+    "GVASCatalogTest",
+    "GVASJSONTest",
+    "GVASLazyTest",
+    "GVASNodeTest",
+    "GVASParallelTest",
+    "GVASProfilerTest",
+    "GVASQueryTest",
+    "GVASSaveTest",
+    "GVASStatsTest",
+    "GVASStreamTest",
+    "GVASUtilsTest",
+]
 
 unittest.main(verbosity=2)
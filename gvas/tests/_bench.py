@@ -0,0 +1,38 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from ..bench._corpus import VERSIONS, GVASCorpusSpec, create_v2_file, create_v3_file
+from ..bench._measure import OPERATIONS, compare, measure
+
+
+class GVASBenchTest(unittest.TestCase):
+    def test_corpus(self) -> None:
+        spec = GVASCorpusSpec(arrays=2, maps=3, numerics=5, strings=4, structs=6)
+        with tempfile.TemporaryDirectory() as directory:
+            for version, create in (("v2", create_v2_file), ("v3", create_v3_file)):
+                filepath = Path(directory, f"{version}.sav")
+                create(spec, filepath)
+                body = VERSIONS[version].from_binary_file(filepath).body
+                self.assertEqual(len(body), spec.strings + spec.arrays + 4)
+                self.assertEqual(len(body["Items"]["value"]["values"]), spec.structs)
+                self.assertEqual(len(body["ItemMap"]["value"]), spec.maps)
+                with filepath.open("rb") as f:
+                    self.assertEqual(VERSIONS[version].from_binary_stream(f, window=1024).body, body)
+                create(spec._replace(numerics=1024), filepath)
+                with filepath.open("rb") as f, self.assertRaisesRegex(ValueError, "larger than the window"):
+                    VERSIONS[version].from_binary_stream(f, window=1024)
+
+    def test_measure(self) -> None:
+        spec = GVASCorpusSpec(arrays=1, maps=1, numerics=1, strings=1, structs=1)
+        results = json.loads(json.dumps(measure({"tiny": spec}, repeat=1)))
+        self.assertEqual(set(results["corpora"]), {"v2-tiny", "v3-tiny"})
+        self.assertEqual(list(results["corpora"]["v3-tiny"]["operations"]), list(OPERATIONS))
+        for result in results["corpora"].values():
+            for measurement in result["operations"].values():
+                self.assertGreater(measurement["seconds"], 0)
+                self.assertGreater(measurement["peak_bytes"], 0)
+        rows = compare(results, results)
+        self.assertEqual(len(rows), 8)
+        self.assertTrue(all(row.ratio == 1 for row in rows))
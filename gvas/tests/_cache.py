@@ -0,0 +1,27 @@
+import unittest
+
+from .. import GVASCache, reset_stats, stats
+from ._fixtures import GVASTestSave, create_save, normalise, saved_file
+
+
+class GVASCacheTest(unittest.TestCase):
+    def test_cached_binary_file(self) -> None:
+        save = create_save()
+        with saved_file(save) as filepath:
+            cache = GVASCache(filepath.with_name("Cache"))
+            loaded = GVASTestSave.from_binary_file(filepath, cache=cache)
+            self.assertEqual(len(list(cache.directory.glob("*.cache"))), 1)
+            reset_stats()
+            cached = GVASTestSave.from_binary_file(filepath, cache=cache)
+            self.assertEqual(stats()["properties_decoded"], {})
+            self.assertEqual(stats()["loads"]["count"], 1)
+            self.assertEqual(cached.header, loaded.header)
+            self.assertEqual(cached.body, loaded.body)
+            self.assertIs(type(cached.body["Item"]["type"]), type(loaded.body["Item"]["type"]))
+            self.assertEqual(normalise(cached.body), normalise(save.body))
+            with self.assertRaises(ValueError):
+                GVASTestSave.from_binary_file(filepath, cache=cache, lazy=True)
+            cache.max_size = 0
+            filepath.write_bytes(filepath.read_bytes())
+            GVASTestSave.from_binary_file(filepath, cache=cache)
+            self.assertEqual(list(cache.directory.glob("*.cache")), [])
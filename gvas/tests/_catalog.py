@@ -0,0 +1,41 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from .. import GVASCatalog
+from ._fixtures import GVASTestSave, create_save
+
+
+class GVASCatalogTest(unittest.TestCase):
+    def test_catalog(self) -> None:
+        save = create_save()
+        with tempfile.TemporaryDirectory() as directory:
+            saves = Path(directory) / "Saves"
+            (saves / "Nested").mkdir(parents=True)
+            first = saves / "First.sav"
+            second = saves / "Nested" / "Second.sav"
+            save.to_binary_file(first)
+            save.to_binary_file(second)
+            (saves / "Broken.sav").write_bytes(b"NOPE")
+            catalog = GVASCatalog(GVASTestSave, Path(directory) / "Catalog.json")
+            self.assertEqual(catalog.refresh([saves], workers=2), [str(first), str(second)])
+            self.assertEqual(list(catalog.errors), [str(saves / "Broken.sav")])
+            header, offset = GVASTestSave.peek_header(first)
+            self.assertEqual(catalog.entries[str(first)].header, header)
+            self.assertEqual(catalog.entries[str(first)].offset, offset)
+            self.assertEqual(catalog.entries[str(first)].size, first.stat().st_size)
+            (row, _) = catalog.rows()
+            self.assertEqual(row["blueprint"], "/Script/Test.Save")
+            self.assertEqual(row["ue_version.branch"], "++UE5+Release-5.4")
+            catalog.store()
+            reloaded = GVASCatalog(GVASTestSave, catalog.filepath)
+            self.assertEqual(list(reloaded), list(catalog))
+            self.assertEqual(reloaded.refresh([saves]), [])
+            save.header["blueprint"] = "/Script/Test.Other"
+            save.to_binary_file(second)
+            os.utime(second, ns=(0, 1))
+            first.unlink()
+            self.assertEqual(reloaded.refresh([saves]), [str(second)])
+            self.assertEqual(len(reloaded), 1)
+            self.assertEqual(reloaded.entries[str(second)].header["blueprint"], "/Script/Test.Other")
@@ -0,0 +1,172 @@
+import contextlib
+import json
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, ClassVar
+
+from .. import GVASSave
+from ..headers import GVASHeaderSerde
+from ..v3.properties import GVASBlueprintStructPropertySerde, GVASStrPropertySerde
+
+
+class GVASTestPropertySerde(GVASStrPropertySerde):
+    __slots__ = ()
+
+    _TYPE: ClassVar[str] = "Test"
+
+
+class GVASTestSave(GVASSave):
+    __slots__ = ()
+
+    _BODY_SERDE = GVASBlueprintStructPropertySerde
+    _HEADER_SERDE = GVASHeaderSerde
+
+
+def create_item(index: int) -> dict[str, dict[str, Any]]:
+    return {
+        "Count": {"type": {"type": "IntProperty"}, "value": index},
+        "Name": {"type": {"type": "NameProperty"}, "value": f"Item_{index}"},
+        "Location": {
+            "type": {"type": "StructProperty", "blueprint": "/Script/CoreUObject", "name": "Vector"},
+            "value": {"x": float(index), "y": 2.0, "z": 3.0},
+        },
+        "Flag": {"type": {"type": "BoolProperty"}, "value": index % 2 == 0},
+    }
+
+
+def create_save() -> GVASTestSave:
+    item_type = {"type": "StructProperty", "blueprint": "/Script/Test", "name": "Item"}
+    guid = "12345678-1234-5678-1234-567812345678"
+    save = GVASTestSave.__new__(GVASTestSave)
+    save.header = {
+        "save_version": {"major": 3, "minor": 3, "patch": 1},
+        "ue_version": {"major": 5, "minor": 4, "patch": 4, "tweak": 0, "build": 0, "branch": "++UE5+Release-5.4"},
+        "custom_version": {"00000000-0000-0000-0000-000000000001": 3},
+        "blueprint": "/Script/Test.Save",
+    }
+    save.body = {
+        "SaveIdentifier": {"type": {"type": "StrProperty"}, "value": "Facility"},
+        "Speed": {"type": {"type": "FloatProperty"}, "value": 1.5},
+        "Big": {"type": {"type": "Int64Property"}, "value": -(2**40)},
+        "Ratio": {"type": {"type": "DoubleProperty"}, "value": 0.25},
+        "Object": {"type": {"type": "ObjectProperty"}, "value": "/Game/Thing"},
+        "SoftObject": {"type": {"type": "SoftObjectProperty"}, "value": {"blueprint": "/Game/A", "reference": "B"}},
+        "Text": {"type": {"type": "TextProperty"}, "value": {"type": 255, "value": "Hello"}},
+        "Enum": {
+            "type": {"type": "EnumProperty", "blueprint": "/Script/Test", "name": "EMode"},
+            "value": "NewEnumerator1",
+        },
+        "Byte": {"type": {"type": "ByteProperty", "blueprint": "/Script/Test", "name": "EByte"}, "value": "Value2"},
+        "DateTime": {
+            "type": {"type": "StructProperty", "blueprint": "/Script/CoreUObject", "name": "DateTime"},
+            "value": 123456789,
+        },
+        "Guid": {"type": {"type": "StructProperty", "blueprint": "/Script/CoreUObject", "name": "Guid"}, "value": guid},
+        "Rotator": {
+            "type": {"type": "StructProperty", "blueprint": "/Script/CoreUObject", "name": "Rotator"},
+            "value": {"x": 0.0, "y": 90.0, "z": 0.0},
+        },
+        "Quat": {
+            "type": {"type": "StructProperty", "blueprint": "/Script/CoreUObject", "name": "Quat"},
+            "value": {"x": 0.0, "y": 0.0, "z": 0.0, "w": 1.0},
+        },
+        "Tags": {
+            "type": {"type": "StructProperty", "blueprint": "/Script/GameplayTags", "name": "GameplayTagContainer"},
+            "value": ["A.B", "C"],
+        },
+        "Item": {"type": item_type, "value": create_item(0)},
+        "GuidItem": {
+            "type": {"type": "StructProperty", "blueprint": "/Script/Test", "name": "GuidItem", "guid": "ABCDEF"},
+            "value": {"X": {"type": {"type": "IntProperty"}, "value": 7}},
+        },
+        "Doubles": {
+            "type": {"type": "ArrayProperty"},
+            "value": {"type": {"type": "DoubleProperty"}, "values": [0.5, 1.5]},
+        },
+        "Floats": {"type": {"type": "ArrayProperty"}, "value": {"type": {"type": "FloatProperty"}, "values": [0.5]}},
+        "Ints": {"type": {"type": "ArrayProperty"}, "value": {"type": {"type": "IntProperty"}, "values": [1, -2, 3]}},
+        "Int64s": {
+            "type": {"type": "ArrayProperty"},
+            "value": {"type": {"type": "Int64Property"}, "values": [2**40, -1]},
+        },
+        "Bools": {
+            "type": {"type": "ArrayProperty"},
+            "value": {"type": {"type": "BoolProperty"}, "values": [True, False]},
+        },
+        "Names": {"type": {"type": "ArrayProperty"}, "value": {"type": {"type": "NameProperty"}, "values": ["a", ""]}},
+        "Strs": {"type": {"type": "ArrayProperty"}, "value": {"type": {"type": "StrProperty"}, "values": ["x", "y"]}},
+        "Vectors": {
+            "type": {"type": "ArrayProperty"},
+            "value": {
+                "type": {"type": "StructProperty", "blueprint": "/Script/CoreUObject", "name": "Vector"},
+                "values": [{"x": 1.0, "y": 2.0, "z": 3.0}],
+            },
+        },
+        "Rotators": {
+            "type": {"type": "ArrayProperty"},
+            "value": {
+                "type": {"type": "StructProperty", "blueprint": "/Script/CoreUObject", "name": "Rotator"},
+                "values": [{"x": 0.0, "y": 45.0, "z": 90.0}, {"x": 1.0, "y": 2.0, "z": 3.0}],
+            },
+        },
+        "Quats": {
+            "type": {"type": "ArrayProperty"},
+            "value": {
+                "type": {"type": "StructProperty", "blueprint": "/Script/CoreUObject", "name": "Quat"},
+                "values": [{"x": 0.0, "y": 0.0, "z": 0.0, "w": 1.0}],
+            },
+        },
+        "Guids": {
+            "type": {"type": "ArrayProperty"},
+            "value": {
+                "type": {"type": "StructProperty", "blueprint": "/Script/CoreUObject", "name": "Guid"},
+                "values": [guid],
+            },
+        },
+        "Items": {"type": {"type": "ArrayProperty"}, "value": {"type": item_type, "values": [create_item(1)]}},
+        "NameSet": {"type": {"type": "SetProperty"}, "value": {"type": {"type": "NameProperty"}, "values": ["p", "q"]}},
+        "SoftObjectSet": {
+            "type": {"type": "SetProperty"},
+            "value": {"type": {"type": "SoftObjectProperty"}, "values": [{"blueprint": "/Game/A", "reference": "B"}]},
+        },
+        "ItemMap": {
+            "type": {"type": "MapProperty"},
+            "value": {
+                "key_type": {"type": "StrProperty"},
+                "value_type": item_type,
+                "values": [["First", create_item(2)], ["Second", create_item(3)]],
+            },
+        },
+        "IntMap": {
+            "type": {"type": "MapProperty"},
+            "value": {
+                "key_type": {"type": "IntProperty"},
+                "value_type": {"type": "NameProperty"},
+                "values": [[1, "One"], [2, "Two"]],
+            },
+        },
+    }
+    return save
+
+
+def normalise(data: Any) -> Any:
+    return json.loads(json.dumps(data, default=dict))
+
+
+def reverse_keys(data: Any) -> Any:
+    if isinstance(data, list):
+        return [reverse_keys(value) for value in data]
+    if not isinstance(data, dict):
+        return data
+    if data.keys() <= {"body", "header", "key_type", "type", "value", "value_type", "values"}:
+        return {key: reverse_keys(data[key]) for key in reversed(data)}
+    return {key: reverse_keys(value) for key, value in data.items()}
+
+
+@contextlib.contextmanager
+def saved_file(save: GVASSave) -> Iterator[Path]:
+    with tempfile.TemporaryDirectory() as directory:
+        filepath = Path(directory, "Test.sav")
+        save.to_binary_file(filepath)
+        yield filepath
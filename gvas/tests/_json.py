@@ -0,0 +1,48 @@
+import json
+import unittest
+
+from ..utils import write_string
+from ._fixtures import GVASTestSave, create_save, reverse_keys, saved_file
+
+
+class GVASJSONTest(unittest.TestCase):
+    def test_binary_file_to_json_file(self) -> None:
+        save = create_save()
+        with saved_file(save) as filepath:
+            expected = filepath.with_name("Expected.json")
+            GVASTestSave.from_binary_file(filepath).to_json_file(expected)
+            streamed = filepath.with_name("Streamed.json")
+            GVASTestSave.binary_file_to_json_file(filepath, streamed)
+            self.assertEqual(streamed.read_text(encoding="utf-8"), expected.read_text(encoding="utf-8"))
+            data = bytearray(filepath.read_bytes())
+            prefix = write_string("Speed", "FloatProperty")
+            data[data.index(prefix) + len(prefix) + 4] = 5
+            filepath.write_bytes(data)
+            with self.assertRaisesRegex(ValueError, "Invalid size"):
+                GVASTestSave.binary_file_to_json_file(filepath, streamed)
+            self.assertEqual(streamed.read_text(encoding="utf-8"), expected.read_text(encoding="utf-8"))
+            self.assertFalse(streamed.with_name("Streamed.json.tmp").exists())
+
+    def test_json_file_to_binary_file(self) -> None:
+        save = create_save()
+        with saved_file(save) as filepath:
+            json_filepath = filepath.with_name("Test.json")
+            save.to_json_file(json_filepath)
+            streamed = filepath.with_name("Streamed.sav")
+            GVASTestSave.json_file_to_binary_file(json_filepath, streamed)
+            self.assertEqual(streamed.read_bytes(), filepath.read_bytes())
+            GVASTestSave.json_file_to_binary_file(json_filepath, streamed, chunk_size=16)
+            self.assertEqual(streamed.read_bytes(), filepath.read_bytes())
+            data = json.loads(json_filepath.read_text(encoding="utf-8"))
+            for ordered in (json.dumps(data, sort_keys=True), json.dumps(reverse_keys(data))):
+                json_filepath.write_text(ordered, encoding="utf-8")
+                GVASTestSave.from_json_file(json_filepath).to_binary_file(filepath)
+                for size in (16, 1 << 20):
+                    streamed.unlink()
+                    GVASTestSave.json_file_to_binary_file(json_filepath, streamed, chunk_size=size)
+                    self.assertEqual(streamed.read_bytes(), filepath.read_bytes())
+            json_filepath.write_text(ordered[:-100], encoding="utf-8")
+            with self.assertRaises(ValueError):
+                GVASTestSave.json_file_to_binary_file(json_filepath, streamed)
+            self.assertEqual(streamed.read_bytes(), filepath.read_bytes())
+            self.assertFalse(streamed.with_name("Streamed.sav.tmp").exists())
@@ -0,0 +1,66 @@
+import pickle
+import unittest
+
+from ..v3.properties import GVASLazyStruct
+from ._fixtures import GVASTestSave, create_save, normalise, saved_file
+
+
+class GVASLazyTest(unittest.TestCase):
+    def test_lazy_binary_file(self) -> None:
+        save = create_save()
+        with saved_file(save) as filepath:
+            loaded = GVASTestSave.from_binary_file(filepath, lazy=True)
+            self.assertIsInstance(loaded.body, GVASLazyStruct)
+            self.assertEqual(list(loaded.body), list(save.body))
+            self.assertEqual(loaded.body["SaveIdentifier"]["value"], "Facility")
+            self.assertIsInstance(loaded.body["Item"]["value"], GVASLazyStruct)
+            self.assertEqual(normalise(loaded.body), normalise(save.body))
+            restored = pickle.loads(pickle.dumps(loaded))  # noqa: S301
+            self.assertIsInstance(restored.body, GVASLazyStruct)
+            self.assertIsNotNone(restored.body.source())
+            self.assertEqual(normalise(restored.body), normalise(save.body))
+            loaded.close()
+            restored.to_binary_file(filepath)
+            with GVASTestSave.from_binary_file(filepath, lazy=True) as loaded:
+                self.assertEqual(loaded.body["Speed"]["value"], 1.5)
+            with self.assertRaises(ValueError):
+                loaded.body["Ratio"]
+            (loaded,) = GVASTestSave.load_many([filepath], lazy=True, workers=1)
+            self.assertIsInstance(loaded.body, GVASLazyStruct)
+            self.assertEqual(normalise(loaded.body), normalise(save.body))
+
+    def test_lazy_binary_file_splicing(self) -> None:
+        save = create_save()
+        with saved_file(save) as filepath:
+            loaded = GVASTestSave.from_binary_file(filepath, lazy=True)
+            copied = filepath.with_name("Copied.sav")
+            loaded.to_binary_file(copied)
+            self.assertEqual(copied.read_bytes(), filepath.read_bytes())
+            self.assertEqual(normalise(loaded.body), normalise(save.body))
+            self.assertIsNotNone(loaded.body.source())
+            loaded.body["Ints"]["value"]["values"].append(4)
+            self.assertIsNone(loaded.body.source())
+            self.assertIsNone(loaded.body.property_source("Ints"))
+            self.assertIsNotNone(loaded.body.property_source("Doubles"))
+            loaded.body["Ints"]["value"]["values"].pop()
+            self.assertIsNotNone(loaded.body.source())
+            for _, item in loaded.body["ItemMap"]["value"]["values"][1:]:
+                item["Count"]["value"] = 42
+            save.body["ItemMap"]["value"]["values"][1][1]["Count"]["value"] = 42
+            loaded.to_binary_file(copied)
+            save.to_binary_file(filepath)
+            self.assertEqual(copied.read_bytes(), filepath.read_bytes())
+            loaded.close()
+
+    def test_indexed_binary_file(self) -> None:
+        save = create_save()
+        with saved_file(save) as filepath:
+            index = GVASTestSave.index_binary_file(filepath)
+            self.assertEqual(list(index["properties"]), list(save.body))
+            self.assertEqual(index["properties"]["ItemMap"]["type"], "MapProperty")
+            self.assertTrue(filepath.with_name("Test.sav.index").is_file())
+            loaded = GVASTestSave.from_indexed_binary_file(filepath)
+            self.assertEqual(loaded.get("SaveIdentifier"), save.body["SaveIdentifier"])
+            self.assertIsNone(loaded.get("Missing"))
+            self.assertEqual(normalise(loaded.body), normalise(save.body))
+            loaded.close()
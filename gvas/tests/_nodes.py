@@ -0,0 +1,40 @@
+import unittest
+
+from .. import reset_stats, stats
+from ..v3.properties import GVASPropertyNode, GVASStructNode
+from ._fixtures import GVASTestSave, create_save, normalise, saved_file
+
+
+class GVASNodeTest(unittest.TestCase):
+    def test_node_binary_file(self) -> None:
+        save = create_save()
+        with saved_file(save) as filepath:
+            loaded = GVASTestSave.from_binary_file(filepath, nodes=True)
+            self.assertIsInstance(loaded.body, GVASStructNode)
+            self.assertIsInstance(loaded.body["Item"], GVASPropertyNode)
+            self.assertIsInstance(loaded.body["Item"]["value"], GVASStructNode)
+            self.assertEqual(normalise(loaded.body.to_dict()), normalise(save.body))
+            self.assertEqual(normalise(loaded.body), normalise(save.body))
+            copied = filepath.with_name("Copied.sav")
+            loaded.to_binary_file(copied)
+            self.assertEqual(copied.read_bytes(), filepath.read_bytes())
+            reloaded = GVASTestSave.from_binary_file(filepath, nodes=True)
+            reset_stats()
+            loaded.body["Extra"] = {"type": {"type": "IntProperty"}, "value": 1}
+            del loaded.body["Speed"]
+            self.assertEqual(stats()["types_created"], {})
+            self.assertIn("Speed", reloaded.body)
+            self.assertNotIn("Extra", reloaded.body)
+            loaded.body["Item"]["value"]["Count"]["value"] = 42
+            save.body["Extra"] = {"type": {"type": "IntProperty"}, "value": 1}
+            del save.body["Speed"]
+            save.body["Item"]["value"]["Count"]["value"] = 42
+            self.assertEqual(list(loaded.body), list(save.body))
+            self.assertEqual(normalise(GVASStructNode.from_dict(save.body)), normalise(save.body))
+            loaded.to_binary_file(copied)
+            save.to_binary_file(filepath)
+            self.assertEqual(copied.read_bytes(), filepath.read_bytes())
+            lazy = GVASTestSave.from_binary_file(filepath, lazy=True, nodes=True)
+            self.assertIsInstance(lazy.body["Item"], GVASPropertyNode)
+            self.assertEqual(normalise(lazy.body), normalise(save.body))
+            del lazy
@@ -0,0 +1,49 @@
+import multiprocessing
+import unittest
+import unittest.mock
+from concurrent.futures import ProcessPoolExecutor
+
+from ..v3.properties import GVASStructNode
+from ._fixtures import GVASTestSave, create_save, normalise, saved_file
+
+
+class GVASParallelTest(unittest.TestCase):
+    def test_load_many(self) -> None:
+        save = create_save()
+        with saved_file(save) as filepath:
+            missing = filepath.with_name("Missing.sav")
+            loaded, paired, failed = GVASTestSave.load_many([filepath, (GVASTestSave, filepath), missing], workers=2)
+            self.assertIsInstance(loaded, GVASTestSave)
+            self.assertIsInstance(paired, GVASTestSave)
+            self.assertEqual(normalise(loaded.body), normalise(save.body))
+            self.assertEqual(normalise(paired.body), normalise(save.body))
+            self.assertIsInstance(failed, FileNotFoundError)
+            (nodes,) = GVASTestSave.load_many([filepath], nodes=True, workers=1)
+            self.assertIsInstance(nodes.body, GVASStructNode)
+            self.assertEqual(normalise(nodes.body.to_dict()), normalise(save.body))
+
+    def test_parallel_binary_file(self) -> None:
+        save = create_save()
+        with saved_file(save) as filepath:
+            loaded = GVASTestSave.from_binary_file(filepath, parallel_threshold=0, workers=2)
+            nodes = GVASTestSave.from_binary_file(filepath, nodes=True, parallel_threshold=0, workers=2)
+            self.assertEqual(normalise(loaded.body), normalise(save.body))
+            self.assertEqual(normalise(nodes.body.to_dict()), normalise(save.body))
+            with unittest.mock.patch.object(
+                ProcessPoolExecutor,
+                "__init__",
+                autospec=True,
+                side_effect=ProcessPoolExecutor.__init__,
+            ) as created:
+                GVASTestSave.from_binary_file(filepath, workers=2)
+            created.assert_not_called()
+
+    def test_parallel_registered_serde(self) -> None:
+        save = create_save()
+        for _, item in save.body["ItemMap"]["value"]["values"]:
+            item["Label"] = {"type": {"type": "TestProperty"}, "value": "Label"}
+        spawn = multiprocessing.get_context("spawn")
+        with saved_file(save) as filepath:
+            with unittest.mock.patch("multiprocessing.get_context", return_value=spawn):
+                loaded = GVASTestSave.from_binary_file(filepath, parallel_threshold=0, workers=2)
+            self.assertEqual(normalise(loaded.body), normalise(save.body))
@@ -0,0 +1,37 @@
+import json
+import unittest
+
+from .. import GVASProfiler
+from .._options import PROFILER
+from ..utils import write_string
+from ._fixtures import GVASTestSave, create_save, normalise, saved_file
+
+
+class GVASProfilerTest(unittest.TestCase):
+    def test_profiled_binary_file(self) -> None:
+        save = create_save()
+        with saved_file(save) as filepath:
+            copied = filepath.with_name("Copied.sav")
+            with GVASProfiler() as profiler:
+                loaded = GVASTestSave.from_binary_file(filepath, compiled=True)
+                loaded.to_binary_file(copied, compiled=True)
+            self.assertIsNone(PROFILER.get())
+            self.assertEqual(normalise(loaded.body), normalise(save.body))
+            self.assertEqual(copied.read_bytes(), filepath.read_bytes())
+            summary = {(entry.category, entry.type): entry for entry in profiler.summary()}
+            self.assertEqual(summary["decode", "StrProperty"].count, 1)
+            self.assertEqual(summary["decode", "StrProperty"].bytes, summary["encode", "StrProperty"].bytes)
+            self.assertEqual(summary["decode array", "StrProperty"].count, 1)
+            self.assertEqual(summary["decode", "StructProperty /Script/Test Item"].count, 1)
+            self.assertEqual(summary["decode array", "StructProperty /Script/Test Item"].count, 1)
+            self.assertEqual(summary["decode", "IntProperty"].count, summary["encode", "IntProperty"].count)
+            for entry in summary.values():
+                self.assertLessEqual(entry.self_seconds, entry.seconds)
+            trace = filepath.with_name("Test.json")
+            profiler.to_chrome_trace(trace)
+            events = json.loads(trace.read_text(encoding="utf-8"))["traceEvents"]
+            self.assertEqual(len(events), len(profiler.events))
+            event = next(event for event in events if event["name"] == "SaveIdentifier" and event["cat"] == "decode")
+            self.assertEqual(event["ph"], "X")
+            self.assertEqual(event["args"]["type"], "StrProperty")
+            self.assertEqual(filepath.read_bytes()[event["args"]["offset"] :][:19], write_string("SaveIdentifier"))
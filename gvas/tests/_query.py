@@ -0,0 +1,51 @@
+import unittest
+
+from .._query import parse_query, select
+from ..v3.properties import GVASStructNode
+from ._fixtures import GVASTestSave, create_item, create_save, normalise, saved_file
+
+
+class GVASQueryTest(unittest.TestCase):
+    def test_projected_binary_file(self) -> None:
+        save = create_save()
+        with saved_file(save) as filepath:
+            filepath.write_bytes(filepath.read_bytes().replace(b"Int64Property", b"XyzzyProperty"))
+            with self.assertRaises(KeyError):
+                GVASTestSave.from_binary_file(filepath)
+            include = ["SaveIdentifier", "ItemMap.S*.Name", "Items.0.Count"]
+            loaded = GVASTestSave.from_binary_file(filepath, include=include)
+            self.assertEqual(list(loaded.body), ["SaveIdentifier", "Items", "ItemMap"])
+            self.assertEqual(loaded.body["SaveIdentifier"], save.body["SaveIdentifier"])
+            self.assertEqual(loaded.body["Items"]["value"]["values"], [{"Count": create_item(1)["Count"]}])
+            self.assertEqual(loaded.body["ItemMap"]["value"]["values"], [("Second", {"Name": create_item(3)["Name"]})])
+            nodes = GVASTestSave.from_binary_file(filepath, include=["Items", "ItemMap"], nodes=True)
+            self.assertIsInstance(nodes.body, GVASStructNode)
+            self.assertEqual(
+                normalise(nodes.body.to_dict()),
+                normalise({"Items": save.body["Items"], "ItemMap": save.body["ItemMap"]}),
+            )
+
+    def test_query_binary_file(self) -> None:
+        save = create_save()
+        with saved_file(save) as filepath:
+            for query, expected in (
+                ("SaveIdentifier", [save.body["SaveIdentifier"]]),
+                ("SaveIdentifier.value", ["Facility"]),
+                ("ItemMap.values[*].1.Name.value", ["Item_2", "Item_3"]),
+                ("ItemMap.values[1].0", ["Second"]),
+                ("Items.values[0].Location.value.x", [1.0]),
+                ("Items.value.type.name", ["Item"]),
+                ("Items.type.type", ["ArrayProperty"]),
+                ("IntMap.values[*]", [(1, "One"), (2, "Two")]),
+                ("Ints.values", [[1, -2, 3]]),
+                ("SoftObject.value.reference", ["B"]),
+                ("Item*.type.type", ["StructProperty", "ArrayProperty", "MapProperty"]),
+            ):
+                self.assertEqual(list(GVASTestSave.query_binary_file(filepath, query)), expected, query)
+                self.assertEqual(list(select(save.body, parse_query(query))), normalise(expected), query)
+            copied = filepath.with_name("Copied.sav")
+            save.to_binary_file(copied)
+            self.assertEqual(
+                list(GVASTestSave.query_binary_files([filepath, copied], "ItemMap.values[*].0", workers=2)),
+                [(filepath, "First"), (filepath, "Second"), (copied, "First"), (copied, "Second")],
+            )
@@ -0,0 +1,149 @@
+import array
+import importlib.util
+import json
+import pickle
+import unittest
+import uuid
+
+from .. import GVASProfiler
+from ..utils import write_string
+from ..v3.properties import GVASPropertySerde
+from ._fixtures import GVASTestSave, create_save, normalise, saved_file
+
+
+class GVASSaveTest(unittest.TestCase):
+    def test_binary_roundtrip(self) -> None:
+        save = create_save()
+        with saved_file(save) as filepath:
+            loaded = GVASTestSave.from_binary_file(filepath)
+            self.assertEqual(normalise(loaded.body), normalise(save.body))
+            self.assertEqual(loaded.header | {"bodysize": save.header["bodysize"]}, save.header)
+            copied = filepath.with_name("Copied.sav")
+            loaded.to_binary_file(copied)
+            self.assertEqual(copied.read_bytes(), filepath.read_bytes())
+
+    def test_array_binary_file(self) -> None:
+        save = create_save()
+        with saved_file(save) as filepath:
+            loaded = GVASTestSave.from_binary_file(filepath, arrays=True)
+            for name, typecode in (("Doubles", "d"), ("Floats", "f"), ("Ints", "i"), ("Int64s", "q"), ("Bools", "b")):
+                values = loaded.body[name]["value"]["values"]
+                self.assertIsInstance(values, array.array)
+                self.assertEqual(values.typecode, typecode)
+            copied = filepath.with_name("Copied.json")
+            loaded.to_json_file(copied)
+            self.assertEqual(json.loads(copied.read_text(encoding="utf-8"))["body"], normalise(save.body))
+            copied = filepath.with_name("Copied.sav")
+            loaded.to_binary_file(copied)
+            self.assertEqual(copied.read_bytes(), filepath.read_bytes())
+
+    def test_binary_file_invalid_ending(self) -> None:
+        save = create_save()
+        with saved_file(save) as filepath:
+            filepath.write_bytes(filepath.read_bytes() + b"\0")
+            with self.assertRaises(ValueError):
+                GVASTestSave.from_binary_file(filepath)
+
+    def test_compiled_binary_file(self) -> None:
+        save = create_save()
+        del save.body["ItemMap"]["value"]["values"][1][1]["Flag"]
+        with saved_file(save) as filepath:
+            for _ in range(2):
+                loaded = GVASTestSave.from_binary_file(filepath, compiled=True)
+                self.assertEqual(normalise(loaded.body), normalise(save.body))
+                copied = filepath.with_name("Copied.sav")
+                loaded.to_binary_file(copied, compiled=True)
+                self.assertEqual(copied.read_bytes(), filepath.read_bytes())
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "NumPy is not installed")
+    def test_numpy_binary_file(self) -> None:
+        save = create_save()
+        with saved_file(save) as filepath:
+            loaded = GVASTestSave.from_binary_file(filepath, numpy=True)
+            for name, shape in (("Vectors", (1, 3)), ("Rotators", (2, 3)), ("Quats", (1, 4))):
+                self.assertEqual(loaded.body[name]["value"]["values"].shape, shape)
+            self.assertEqual(loaded.body["Rotators"]["value"]["values"][1].tolist(), [1.0, 2.0, 3.0])
+            copied = filepath.with_name("Copied.json")
+            loaded.to_json_file(copied)
+            self.assertEqual(json.loads(copied.read_text(encoding="utf-8"))["body"], normalise(save.body))
+            copied = filepath.with_name("Copied.sav")
+            loaded.to_binary_file(copied)
+            self.assertEqual(copied.read_bytes(), filepath.read_bytes())
+
+    def test_peek_header(self) -> None:
+        save = create_save()
+        save.header["custom_version"] = {str(uuid.UUID(int=index)): index for index in range(512)}
+        with saved_file(save) as filepath:
+            header, offset = GVASTestSave.peek_header(filepath)
+            self.assertGreater(offset, GVASTestSave._PEEK_SIZE)
+            self.assertEqual(header, GVASTestSave.from_binary_file(filepath).header)
+            filepath.write_bytes(filepath.read_bytes()[: offset - 1])
+            with self.assertRaises(ValueError):
+                GVASTestSave.peek_header(filepath)
+
+    def test_shared_type_descriptors(self) -> None:
+        save = create_save()
+        with saved_file(save) as filepath:
+            loaded = GVASTestSave.from_binary_file(filepath)
+        items = [item for _, item in loaded.body["ItemMap"]["value"]["values"]]
+        descriptor = GVASPropertySerde.descriptor_from_dict(save.body["Item"]["type"])
+        self.assertIs(GVASPropertySerde.descriptor_from_dict(loaded.body["Item"]["type"]), descriptor)
+        self.assertIs(GVASPropertySerde.descriptor_from_dict(dict(descriptor.mapping)), descriptor)
+        self.assertIs(
+            GVASPropertySerde.descriptor_from_dict(items[0]["Location"]["type"]),
+            GVASPropertySerde.descriptor_from_dict(items[1]["Location"]["type"]),
+        )
+        self.assertIs(type(loaded.body["Item"]["type"]), dict)
+        self.assertEqual(loaded.body["Item"]["type"], descriptor.mapping)
+        with self.assertRaises(TypeError):
+            descriptor.mapping["name"] = "Renamed"
+        loaded.body["Item"]["type"]["name"] = "Renamed"
+        self.assertEqual(descriptor.mapping["name"], "Item")
+        self.assertEqual(loaded.body["ItemMap"]["value"]["value_type"]["name"], "Item")
+        self.assertEqual(json.loads(json.dumps(loaded.body["Items"]))["value"]["type"], dict(descriptor.mapping))
+        self.assertEqual(pickle.loads(pickle.dumps(loaded.body)), loaded.body)  # noqa: S301
+
+    def test_validation_levels(self) -> None:
+        save = create_save()
+        with saved_file(save) as filepath:
+            for validation in ("basic", "trusted"):
+                loaded = GVASTestSave.from_binary_file(filepath, validation=validation)
+                self.assertEqual(normalise(loaded.body), normalise(save.body))
+                loaded = GVASTestSave.from_binary_file(filepath, nodes=True, validation=validation)
+                self.assertEqual(normalise(loaded.body.to_dict()), normalise(save.body))
+            with self.assertRaises(ValueError):
+                GVASTestSave.from_binary_file(filepath, validation="none")
+            data = bytearray(filepath.read_bytes())
+            prefix = write_string("Speed", "FloatProperty")
+            speed = data.index(prefix) + len(prefix)
+            data[speed + 4] = 5
+            filepath.write_bytes(data)
+            for validation in ("strict", "basic"):
+                with self.assertRaises(ValueError):
+                    GVASTestSave.from_binary_file(filepath, validation=validation)
+                with self.assertRaises(ValueError):
+                    GVASTestSave.from_binary_file(filepath, include=["Speed"], validation=validation)
+            loaded = GVASTestSave.from_binary_file(filepath, validation="trusted")
+            self.assertEqual(loaded.body["Speed"]["value"], 1.5)
+            loaded = GVASTestSave.from_binary_file(filepath, include=["Speed"], validation="trusted")
+            self.assertEqual(loaded.body["Speed"]["value"], 1.5)
+            with GVASProfiler():
+                loaded = GVASTestSave.from_binary_file(filepath, validation="trusted")
+            self.assertEqual(loaded.body["Speed"]["value"], 1.5)
+            with self.assertRaises(ValueError):
+                GVASTestSave.from_binary_file(filepath, compiled=True, validation="trusted")
+            data[speed + 4] = 4
+            data[speed + 8] = 1
+            filepath.write_bytes(data)
+            for validation in ("strict", "basic"):
+                with self.assertRaises(ValueError):
+                    GVASTestSave.from_binary_file(filepath, validation=validation)
+                with (
+                    self.assertRaises(ValueError),
+                    GVASTestSave.from_binary_file(filepath, lazy=True, validation=validation) as loaded,
+                ):
+                    loaded.body["Speed"]
+            loaded = GVASTestSave.from_binary_file(filepath, validation="trusted")
+            self.assertEqual(normalise(loaded.body), normalise(save.body))
+            with GVASTestSave.from_binary_file(filepath, lazy=True, validation="trusted") as loaded:
+                self.assertEqual(loaded.body["Speed"]["value"], 1.5)
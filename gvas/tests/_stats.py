@@ -0,0 +1,49 @@
+import unittest
+import uuid
+
+from .. import reset_stats, stats
+from ._fixtures import GVASTestSave, create_save, saved_file
+
+
+class GVASStatsTest(unittest.TestCase):
+    def test_stats(self) -> None:
+        save = create_save()
+        name = f"Stats{uuid.uuid4().hex}"
+        save.body["Fresh"] = {
+            "type": {"type": "StructProperty", "blueprint": "/Script/Test", "name": name},
+            "value": {"X": {"type": {"type": "IntProperty"}, "value": 1}},
+        }
+        reset_stats()
+        with saved_file(save) as filepath:
+            GVASTestSave.from_binary_file(filepath)
+            plain = stats()
+            self.assertEqual(plain["loads"]["count"], 1)
+            self.assertEqual(plain["stores"]["count"], 1)
+            self.assertEqual(plain["bytes_decoded"], filepath.stat().st_size)
+            self.assertEqual(plain["bytes_encoded"], filepath.stat().st_size)
+            self.assertEqual(plain["properties_decoded"], plain["properties_encoded"])
+            self.assertEqual(plain["properties_decoded"]["StrProperty"], 1)
+            self.assertEqual(plain["properties_decoded"][f"StructProperty /Script/Test {name}"], 1)
+            self.assertEqual(plain["types_created"], {"struct": 1})
+            self.assertEqual(plain["descriptor_misses"], 2)
+            self.assertGreater(plain["descriptor_hits"], 0)
+            self.assertEqual(plain["registry_misses"], 1)
+            self.assertGreater(plain["registry_hits"], 0)
+            self.assertGreater(plain["strings_read"], 0)
+            self.assertLessEqual(plain["loads"]["max_seconds"], plain["loads"]["seconds"])
+            reset_stats()
+            self.assertEqual(stats()["properties_decoded"], {})
+            self.assertEqual(stats()["strings_read"], 0)
+            for _ in range(2):
+                GVASTestSave.from_binary_file(filepath, compiled=True)
+            self.assertEqual(
+                stats()["properties_decoded"],
+                {label: count * 2 for label, count in plain["properties_decoded"].items()},
+            )
+            reset_stats()
+            GVASTestSave.load_many([filepath, filepath], workers=2)
+            pooled = stats()
+            self.assertEqual(pooled["loads"]["count"], 2)
+            self.assertEqual(pooled["bytes_decoded"], 2 * plain["bytes_decoded"])
+            self.assertEqual(pooled["properties_decoded"]["StrProperty"], 2)
+            self.assertGreater(pooled["strings_read"], plain["strings_read"])
@@ -0,0 +1,55 @@
+import io
+import os
+import threading
+import unittest
+import unittest.mock
+
+from ..v3.properties import GVASStructNode
+from ._fixtures import GVASTestSave, create_item, create_save, normalise, saved_file
+
+
+class GVASStreamTest(unittest.TestCase):
+    def test_binary_stream(self) -> None:
+        save = create_save()
+        save.body["Items"]["value"]["values"] = [create_item(index) for index in range(2000)]
+        save.body["ItemMap"]["value"]["values"] = [[f"Key_{index}", create_item(index)] for index in range(2000)]
+        with saved_file(save) as filepath:
+            data = filepath.read_bytes()
+            loaded = GVASTestSave.from_binary_file(filepath)
+            read_fd, write_fd = os.pipe()
+
+            def write() -> None:
+                with os.fdopen(write_fd, "wb", buffering=0) as f:
+                    for position in range(0, len(data), 4096):
+                        f.write(data[position : position + 4096])
+
+            writer = threading.Thread(target=write)
+            writer.start()
+            with os.fdopen(read_fd, "rb", buffering=0) as f:
+                streamed = GVASTestSave.from_binary_stream(f, window=1024)
+            writer.join()
+            self.assertEqual(streamed.header, loaded.header)
+            self.assertEqual(normalise(streamed.body), normalise(save.body))
+            f = unittest.mock.Mock(wraps=io.BytesIO(data))
+            nodes = GVASTestSave.from_binary_stream(f, nodes=True, window=1024)
+            self.assertIsInstance(nodes.body, GVASStructNode)
+            self.assertEqual(normalise(nodes.body.to_dict()), normalise(save.body))
+            self.assertLessEqual(max(call.args[0] for call in f.read.call_args_list), 1024)
+            for corrupted in (data[:-1], data + b"\0", data[: len(data) // 2]):
+                with self.assertRaises(ValueError):
+                    GVASTestSave.from_binary_stream(io.BytesIO(corrupted), window=1024)
+            corrupted = bytearray(data)
+            corrupted[data.index(b"StrProperty\0") + 16] += 1
+            f = io.BytesIO(corrupted)
+            with self.assertRaisesRegex(ValueError, "Invalid offset"):
+                GVASTestSave.from_binary_stream(f, window=1024)
+            self.assertLessEqual(f.tell(), 1024)
+            with self.assertRaises(ValueError):
+                GVASTestSave.from_binary_stream(io.BytesIO(data), window=16)
+            save.body["Label"] = {"type": {"type": "StrProperty"}, "value": "x" * 2048}
+            save.to_binary_file(filepath)
+            with filepath.open("rb") as f, self.assertRaisesRegex(ValueError, "larger than the window"):
+                GVASTestSave.from_binary_stream(f, window=1024)
+            with filepath.open("rb") as f:
+                streamed = GVASTestSave.from_binary_stream(f, window=4096)
+            self.assertEqual(normalise(streamed.body), normalise(save.body))
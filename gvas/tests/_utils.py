@@ -1,7 +1,7 @@
 import struct
 import unittest
 
-from ..utils import read_string, write_string
+from ..utils import read_name, read_string, write_name, write_string
 
 
 class GVASUtilsTest(unittest.TestCase):
@@ -35,6 +35,27 @@ class GVASUtilsTest(unittest.TestCase):
         self.assertEqual(result, test_string)
         self.assertEqual(bytes_read, 4 + len(encoded) + 1)
 
+    def test_read_name_interned(self) -> None:
+        encoded = b"CurrentStack_9_D443B69044D640B0989FD8A629801A49"
+        data = struct.pack(f"<L{len(encoded)}sxL{len(encoded)}sx", len(encoded) + 1, encoded, len(encoded) + 1, encoded)
+        first, bytes_read = read_name(memoryview(data), 0)
+        second, _ = read_name(data, bytes_read)
+        self.assertIs(first, second)
+        first, bytes_read = read_string(memoryview(data), 0)
+        second, _ = read_string(data, bytes_read)
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+
+    def test_read_string_truncated(self) -> None:
+        data = struct.pack("<L3s", 5, b"abc")
+        with self.assertRaises(ValueError):
+            read_string(data, 0)
+
+    def test_write_name_cached(self) -> None:
+        result = write_name("IntProperty")
+        self.assertEqual(result, write_string("IntProperty"))
+        self.assertIs(write_name("IntProperty"), result)
+
     def test_write_string_single(self) -> None:
         test_string = "Hello"
         result = write_string(test_string)
@@ -71,3 +92,6 @@ class GVASUtilsTest(unittest.TestCase):
                 read_result, bytes_read = read_string(written, 0)
                 self.assertEqual(read_result, test_string)
                 self.assertEqual(bytes_read, len(written))
+
+    def test_write_string_none(self) -> None:
+        self.assertEqual(write_string(), b"")
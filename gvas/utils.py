@@ -1,22 +1,59 @@
-import itertools
+import functools
 import struct
 
+from ._stats import COUNTERS
+
+
+class GVASTruncatedError(ValueError):
+    __slots__ = ()
+
+
+_NAMES: dict[str, bytes] = {}
+_UINT32 = struct.Struct("<I")
+
+
+@functools.lru_cache(maxsize=65536)
+def _decode_name(raw: bytes) -> str:
+    return raw.decode("utf-8")
+
+
+def _encode_string(value: str) -> bytes:
+    if not value:
+        return _UINT32.pack(0)
+    encoded = value.encode("utf-8")
+    return _UINT32.pack(len(encoded) + 1) + encoded + b"\0"
+
+
+def read_name(data: bytes, offset: int) -> tuple[str, int]:
+    length = _UINT32.unpack_from(data, offset)[0]
+    COUNTERS["strings_read"] += 1
+    if length < 1:
+        return "", 4
+    end = offset + 3 + length
+    if end >= len(data):
+        raise GVASTruncatedError(f"Invalid string length at {offset}")
+    return _decode_name(bytes(data[offset + 4 : end])), 4 + length
+
 
 def read_string(data: bytes, offset: int) -> tuple[str, int]:
-    length = struct.unpack_from("<I", data, offset)[0]
+    length = _UINT32.unpack_from(data, offset)[0]
+    COUNTERS["strings_read"] += 1
     if length < 1:
         return "", 4
-    string_value = struct.unpack_from(f"<{length - 1}sx", data, offset + 4)[0].decode("utf-8")
-    return string_value, 4 + length
+    end = offset + 3 + length
+    if end >= len(data):
+        raise GVASTruncatedError(f"Invalid string length at {offset}")
+    return str(data[offset + 4 : end], "utf-8"), 4 + length
+
+
+def write_name(name: str) -> bytes:
+    encoded = _NAMES.get(name)
+    if encoded is None:
+        encoded = _NAMES[name] = _encode_string(name)
+    return encoded
 
 
 def write_string(*strings: str) -> bytes:
-    if not strings:
-        return b""
-    formats, args = zip(
-        *(
-            (f"I{len(encoded)}sx" if encoded else "I", (len(encoded) + 1, encoded) if encoded else (0,))
-            for encoded in (value.encode("utf-8") for value in strings)
-        ),
-    )
-    return struct.pack("<" + "".join(formats), *itertools.chain.from_iterable(args))
+    if len(strings) == 1:
+        return _encode_string(strings[0])
+    return b"".join(map(_encode_string, strings))
@@ -3,7 +3,8 @@ from __future__ import annotations
 import struct
 from typing import Any, ClassVar, override
 
-from ...utils import read_string
+from ..._stats import lookup
+from ...utils import read_name
 from ._base import GVASPropertySerde
 from ._structs import GVASStructPropertySerde
 
@@ -37,12 +38,12 @@ class GVASArrayPropertySerde(GVASPropertySerde):
     @classmethod
     @override
     def _header_from_bytes(cls, data: bytes, offset: int) -> tuple[type[GVASArrayPropertySerde], int]:
-        element_type, bytes_read = read_string(data, offset)
+        element_type, bytes_read = read_name(data, offset)
         offset += bytes_read
         flag = struct.unpack_from("<B", data, offset)[0]
         if flag != 0:
             raise ValueError(f"Invalid flag at {offset}")
-        element_serde = _REGISTRY.get(element_type)
+        element_serde = lookup(_REGISTRY, element_type)
         if element_serde is None:
             element_serde = type(
                 f"GVAS{element_type}ArraySerde",
@@ -67,7 +68,7 @@ class GVASStructPropertyArraySerde(GVASArrayPropertySerde):
     def from_bytes(cls, data: bytes, offset: int) -> tuple[dict[str, Any], int]:
         count = struct.unpack_from("<I", data, offset)[0]
         offset += 4
-        name, bytes_read = read_string(data, offset)
+        name, bytes_read = read_name(data, offset)
         element_serde, size, offset = GVASStructPropertySerde.header_from_bytes(data, offset + bytes_read)
         start = offset
         expected_offset = offset + size
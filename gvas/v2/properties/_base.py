@@ -4,7 +4,8 @@ import struct
 from typing import Any, ClassVar, override
 
 from ..._base import GVASSerde
-from ...utils import read_string
+from ..._stats import lookup
+from ...utils import read_name
 
 
 _REGISTRY: dict[str, type[GVASPropertySerde]] = {}
@@ -17,17 +18,20 @@ class GVASPropertySerde(GVASSerde):
 
     @staticmethod
     def get_type(name: str) -> type[GVASPropertySerde]:
-        return _REGISTRY[name]
+        property_serde = lookup(_REGISTRY, name)
+        if property_serde is None:
+            raise KeyError(name)
+        return property_serde
 
     @staticmethod
     def header_from_bytes(data: bytes, offset: int) -> tuple[type[GVASPropertySerde], int, int]:
-        property_type, bytes_read = read_string(data, offset)
+        property_type, bytes_read = read_name(data, offset)
         offset += bytes_read
         size, padding = struct.unpack_from("<II", data, offset)
         offset += 4
         if padding != 0:
             raise ValueError(f"Invalid padding at {offset}")
-        property_serde, offset = _REGISTRY[property_type]._header_from_bytes(data, offset + 4)
+        property_serde, offset = GVASPropertySerde.get_type(property_type)._header_from_bytes(data, offset + 4)
         return property_serde, size, offset
 
     @override
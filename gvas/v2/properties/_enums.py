@@ -3,7 +3,8 @@ from __future__ import annotations
 import struct
 from typing import Any, ClassVar, override
 
-from ...utils import read_string
+from ..._stats import lookup
+from ...utils import read_name, read_string
 from ._base import GVASPropertySerde
 
 
@@ -45,12 +46,12 @@ class GVASEnumPropertySerde(GVASPropertySerde):
 
     @classmethod
     def _header_from_bytes(cls, data: bytes, offset: int) -> tuple[type[GVASPropertySerde], int]:
-        property_subtype, bytes_read = read_string(data, offset)
+        property_subtype, bytes_read = read_name(data, offset)
         offset += bytes_read
         flag = struct.unpack_from("<B", data, offset)[0]
         if flag != 0:
             raise ValueError(f"Invalid flag at {offset}")
-        property_serde = _REGISTRY.get(property_subtype)
+        property_serde = lookup(_REGISTRY, property_subtype)
         if property_serde is None:
             property_serde = type(
                 f"GVAS{cls._TYPE}PropertySerde@{property_subtype}",
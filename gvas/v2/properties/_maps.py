@@ -1,7 +1,8 @@
 import struct
 from typing import Any, ClassVar, override
 
-from ...utils import read_string
+from ..._stats import lookup
+from ...utils import read_name
 from ._base import GVASPropertySerde
 
 
@@ -44,14 +45,14 @@ class GVASMapPropertySerde(GVASPropertySerde):
     @classmethod
     @override
     def _header_from_bytes(cls, data: bytes, offset: int) -> tuple[type[GVASPropertySerde], int]:
-        key_type, bytes_read = read_string(data, offset)
+        key_type, bytes_read = read_name(data, offset)
         offset += bytes_read
-        value_type, bytes_read = read_string(data, offset)
+        value_type, bytes_read = read_name(data, offset)
         offset += bytes_read
         flag = struct.unpack_from("<B", data, offset)[0]
         if flag != 0:
             raise ValueError(f"Invalid flag at {offset}")
-        property_serde = _REGISTRY.get((key_type, value_type))
+        property_serde = lookup(_REGISTRY, (key_type, value_type))
         if property_serde is None:
             property_serde = type(
                 f"GVASMapPropertySerde@{key_type}->{value_type}",
@@ -2,12 +2,18 @@ from __future__ import annotations
 
 import struct
 import uuid
-from typing import Any, ClassVar, override
+from typing import TYPE_CHECKING, Any, ClassVar, override
 
-from ...utils import read_string
+from ..._stats import DECODED, lookup
+from ...utils import read_name
 from ._base import GVASPropertySerde
 
 
+if TYPE_CHECKING:
+    from ..._binary import GVASBinaryReader
+    from ..._json import GVASJSONWriter
+
+
 _REGISTRY: dict[str, type[GVASStructPropertySerde]] = {}
 
 
@@ -17,6 +23,11 @@ class GVASStructPropertySerde(GVASPropertySerde):
     _SUBTYPE: ClassVar[str]
     _TYPE: ClassVar[str] = "StructProperty"
 
+    @staticmethod
+    def _header_from_stream(data: bytes, offset: int) -> tuple[tuple[type[GVASPropertySerde], int], int]:
+        property_type, size, offset = GVASPropertySerde.header_from_bytes(data, offset)
+        return (property_type, size), offset
+
     @override
     def __init_subclass__(cls) -> None:
         if not hasattr(cls, "_SUBTYPE"):
@@ -29,7 +40,7 @@ class GVASStructPropertySerde(GVASPropertySerde):
     @override
     def from_bytes(cls, data: bytes, offset: int) -> tuple[Any, int]:
         result: dict[str, dict[str, Any]] = {}
-        name, bytes_read = read_string(data, offset)
+        name, bytes_read = read_name(data, offset)
         while name != "None":
             start = offset
             property_type, size, offset = GVASPropertySerde.header_from_bytes(data, offset + bytes_read)
@@ -38,13 +49,52 @@ class GVASStructPropertySerde(GVASPropertySerde):
             if offset != expected_offset:
                 raise ValueError(f"{property_type} in [{start}, {offset - 1}] expected ending at {expected_offset}")
             result[name] = property_type.header_to_dict() | {"value": value}
-            name, bytes_read = read_string(data, offset)
+            DECODED[property_type._TYPE] += 1
+            name, bytes_read = read_name(data, offset)
         return result, offset + bytes_read
 
+    @classmethod
+    @override
+    def from_stream(cls, reader: GVASBinaryReader) -> Any:
+        result: dict[str, dict[str, Any]] = {}
+        start = reader.tell()
+        name = reader.read_name()
+        while name != "None":
+            property_type, size = reader.decode_element(GVASStructPropertySerde._header_from_stream)
+            expected_offset = reader.tell() + size
+            value = reader.decode_element(property_type.from_bytes, expected_offset)
+            if reader.tell() != expected_offset:
+                raise ValueError(
+                    f"{property_type} in [{start}, {reader.tell() - 1}] expected ending at {expected_offset}",
+                )
+            result[name] = property_type.header_to_dict() | {"value": value}
+            DECODED[property_type._TYPE] += 1
+            start = reader.tell()
+            name = reader.read_name()
+        return result
+
+    @classmethod
+    @override
+    def json_from_bytes(cls, data: bytes, offset: int, writer: GVASJSONWriter) -> int:
+        writer.begin_object()
+        name, bytes_read = read_name(data, offset)
+        while name != "None":
+            start = offset
+            property_type, size, offset = GVASPropertySerde.header_from_bytes(data, offset + bytes_read)
+            expected_offset = offset + size
+            value, offset = property_type.from_bytes(data, offset)
+            if offset != expected_offset:
+                raise ValueError(f"{property_type} in [{start}, {offset - 1}] expected ending at {expected_offset}")
+            writer.key(name)
+            writer.value(property_type.header_to_dict() | {"value": value})
+            name, bytes_read = read_name(data, offset)
+        writer.end()
+        return offset + bytes_read
+
     @classmethod
     @override
     def _header_from_bytes(cls, data: bytes, offset: int) -> tuple[type[GVASStructPropertySerde], int]:
-        property_subtype, bytes_read = read_string(data, offset)
+        property_subtype, bytes_read = read_name(data, offset)
         offset += bytes_read
         padding, flag = struct.unpack_from("<16sB", data, offset)
         if any(padding):
@@ -52,7 +102,7 @@ class GVASStructPropertySerde(GVASPropertySerde):
         offset += 16
         if flag != 0:
             raise ValueError(f"Invalid flag at {offset}")
-        property_serde = _REGISTRY.get(property_subtype)
+        property_serde = lookup(_REGISTRY, property_subtype)
         if property_serde is None:
             property_serde = type(
                 f"GVAS{cls._TYPE}PropertySerde@{property_subtype}",
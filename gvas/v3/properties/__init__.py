@@ -1,5 +1,5 @@
 from ._arrays import GVASArrayPropertySerde
-from ._base import GVASPropertySerde
+from ._base import GVASPropertySerde, GVASTypeDescriptor
 from ._bools import GVASBoolPropertySerde
 from ._bytes import GVASBytePropertySerde
 from ._doubles import GVASDoublePropertySerde
@@ -7,8 +7,10 @@ from ._enums import GVASEnumPropertySerde
 from ._floats import GVASFloatPropertySerde
 from ._int64s import GVASInt64PropertySerde
 from ._ints import GVASIntPropertySerde
+from ._lazy import GVASLazyStruct
 from ._maps import GVASMapPropertySerde
 from ._names import GVASNamePropertySerde
+from ._nodes import GVASPropertyNode, GVASStructNode
 from ._objects import GVASObjectPropertySerde
 from ._sets import GVASSetPropertySerde
 from ._soft_objects import GVASSoftObjectPropertySerde
@@ -27,14 +29,18 @@ __all__ = [
     "GVASFloatPropertySerde",
     "GVASIntPropertySerde",
     "GVASInt64PropertySerde",
+    "GVASLazyStruct",
     "GVASMapPropertySerde",
     "GVASNamePropertySerde",
     "GVASObjectPropertySerde",
+    "GVASPropertyNode",
     "GVASPropertySerde",
     "GVASSetPropertySerde",
     "GVASSoftObjectPropertySerde",
     "GVASStrPropertySerde",
+    "GVASStructNode",
     "GVASStructPropertySerde",
     "GVASTextPropertySerde",
+    "GVASTypeDescriptor",
     "GVASUniqueStructPropertySerde",
 ]
@@ -1,27 +1,133 @@
 import struct
+from collections.abc import Iterator
+from fnmatch import fnmatchcase
 from typing import Any, ClassVar, final, override
 
-from ._base import GVASPropertySerde
+from ..._binary import GVASBinaryReader, GVASBinaryWriter
+from ..._json import GVASJSONReader, GVASJSONWriter
+from ..._options import PROFILER
+from ..._query import select
+from ._base import GVASPropertySerde, GVASTypeDescriptor
 
 
 class GVASArrayPropertySerde(GVASPropertySerde):
     __slots__ = ()
 
+    _PROJECTABLE: ClassVar[bool] = True
     _TYPE: ClassVar[str] = "Array"
 
+    @staticmethod
+    @final
+    def _element_type_from_bytes(data: bytes, offset: int) -> tuple[GVASTypeDescriptor, int]:
+        if struct.unpack_from("<I", data, offset)[0] != 1:
+            raise ValueError(f"Invalid category at {offset}")
+        return GVASPropertySerde.descriptor_from_bytes(data, offset + 4)
+
     @classmethod
     @final
     @override
     def from_bytes_full(cls, data: bytes, offset: int) -> tuple[dict[str, Any], int]:
-        if struct.unpack_from("<I", data, offset)[0] != 1:
-            raise ValueError(f"Invalid category at {offset}")
-        element_type, offset = GVASPropertySerde.type_from_bytes(data, offset + 4)
-        values, offset = element_type.from_bytes_array(data, offset)
-        return {"type": element_type.type_to_dict(), "values": values}, offset
+        element_type, offset = cls._element_type_from_bytes(data, offset)
+        profiler = PROFILER.get()
+        if profiler is None:
+            values, offset = element_type.serde.from_bytes_array(data, offset)
+        else:
+            start = profiler.begin()
+            values_offset = offset
+            values, offset = element_type.serde.from_bytes_array(data, offset)
+            profiler.end(start, "decode array", "values", element_type.label, values_offset, offset - values_offset)
+        return {"type": element_type.mapping.copy(), "values": values}, offset
+
+    @classmethod
+    @final
+    @override
+    def from_dict_full_into(cls, data: dict[str, Any], buffer: bytearray) -> None:
+        element_type = GVASPropertySerde.descriptor_from_dict(data["type"])
+        buffer += struct.pack("<I", 1)
+        buffer += element_type.encoded
+        profiler = PROFILER.get()
+        if profiler is None:
+            element_type.serde.from_dict_array_into(data["values"], buffer)
+        else:
+            start = profiler.begin()
+            offset = len(buffer)
+            element_type.serde.from_dict_array_into(data["values"], buffer)
+            profiler.end(start, "encode array", "values", element_type.label, offset, len(buffer) - offset)
+
+    @classmethod
+    @final
+    @override
+    def from_json_full_into(cls, reader: GVASJSONReader, writer: GVASBinaryWriter) -> None:
+        reader.begin_object()
+        data: dict[str, Any] = {}
+        streamed = False
+        while (key := reader.next_key()) is not None:
+            if key not in ("type", "values") or key in data or (key == "values" and streamed):
+                raise ValueError(f"Unexpected key {key} in array")
+            if key == "values" and "type" in data:
+                element_type = GVASPropertySerde.descriptor_from_dict(data["type"])
+                writer.buffer += struct.pack("<I", 1)
+                writer.buffer += element_type.encoded
+                element_type.serde.from_json_array_into(reader, writer)
+                streamed = True
+            else:
+                data[key] = reader.value()
+        if not streamed:
+            if "values" not in data:
+                raise ValueError("Missing values in array")
+            cls.from_dict_full_into(data, writer.buffer)
+            writer.flush()
+
+    @classmethod
+    @final
+    @override
+    def from_stream_full(cls, reader: GVASBinaryReader, end: int) -> dict[str, Any]:
+        element_type = reader.decode_element(cls._element_type_from_bytes, end)
+        return {"type": element_type.mapping.copy(), "values": element_type.serde.from_stream_array(reader, end)}
+
+    @classmethod
+    @final
+    @override
+    def json_from_bytes_full(cls, data: bytes, offset: int, writer: GVASJSONWriter) -> int:
+        element_type, offset = cls._element_type_from_bytes(data, offset)
+        writer.begin_object()
+        writer.key("type")
+        writer.value(element_type.mapping)
+        writer.key("values")
+        offset = element_type.serde.json_from_bytes_array(data, offset, writer)
+        writer.end()
+        return offset
+
+    @classmethod
+    @final
+    @override
+    def query_from_bytes_full(cls, data: bytes, offset: int, segments: tuple[str, ...]) -> Iterator[Any]:
+        if not segments:
+            value, _ = cls.from_bytes_full(data, offset)
+            yield value
+            return
+        element_type, offset = cls._element_type_from_bytes(data, offset)
+        if fnmatchcase("type", segments[0]):
+            yield from select(element_type.mapping.copy(), segments[1:])
+        if fnmatchcase("values", segments[0]):
+            yield from element_type.serde.query_from_bytes_array(data, offset, segments[1:])
+
+    @classmethod
+    @final
+    @override
+    def value_to_dict(cls, value: dict[str, Any]) -> dict[str, Any]:
+        element_type = GVASPropertySerde.descriptor_from_dict(value["type"])
+        values = value["values"]
+        if isinstance(values, list):
+            values = [element_type.serde.value_to_dict(element) for element in values]
+        return {"type": element_type.mapping.copy(), "values": values}
 
     @classmethod
     @final
     @override
-    def from_dict_full(cls, data: dict[str, Any]) -> bytes:
-        element_type = GVASPropertySerde.type_from_dict(data["type"])
-        return struct.pack("<I", 1) + element_type.type_to_bytes() + element_type.from_dict_array(data["values"])
+    def value_to_node(cls, value: dict[str, Any]) -> dict[str, Any]:
+        element_type = GVASPropertySerde.descriptor_from_dict(value["type"])
+        values = value["values"]
+        if isinstance(values, list):
+            values = [element_type.serde.value_to_node(element) for element in values]
+        return {"type": element_type.mapping.copy(), "values": values}
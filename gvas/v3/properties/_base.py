@@ -1,30 +1,170 @@
 from __future__ import annotations
 
+import array
+import struct
+import sys
 from abc import abstractmethod
-from typing import Any, ClassVar, Self, final, override
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, ClassVar, Self, final, override
 
 from ..._base import GVASSerde
-from ...utils import read_string, write_string
+from ..._query import select
+from ..._stats import COUNTERS, lookup
+from ...utils import read_name, write_name
 
 
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterator
+
+    from ..._binary import GVASBinaryReader, GVASBinaryWriter
+    from ..._json import GVASJSONReader, GVASJSONWriter
+
+
+_BYTES_DESCRIPTORS: dict[bytes, tuple[GVASTypeDescriptor, int]] = {}
+_DESCRIPTORS: dict[type[GVASPropertySerde], GVASTypeDescriptor] = {}
+_DICT_DESCRIPTORS: dict[tuple[tuple[str, str], ...], GVASTypeDescriptor] = {}
+_HEADER = struct.Struct("<IIB")
 _REGISTRY: dict[str, type[GVASPropertySerde]] = {}
+_UINT32 = struct.Struct("<I")
+
+
+@final
+class GVASTypeDescriptor:
+    __slots__ = ("encoded", "fixed", "label", "mapping", "serde")
+
+    encoded: bytes
+    fixed: tuple[struct.Struct, tuple[str, ...], int] | None
+    label: str
+    mapping: MappingProxyType[str, str]
+    serde: type[GVASPropertySerde]
+
+    def __init__(self, serde: type[GVASPropertySerde]) -> None:
+        self.encoded = serde.type_to_bytes()
+        fixed_layout = serde._FIXED_LAYOUT
+        if fixed_layout is None:
+            self.fixed = None
+        else:
+            self.fixed = (struct.Struct(f"<IIB{fixed_layout[1][1:]}"), fixed_layout[2], fixed_layout[0])
+        self.mapping = MappingProxyType(serde.type_to_dict())
+        self.label = " ".join(self.mapping.values())
+        self.serde = serde
+
+    @override
+    def __reduce__(self) -> tuple[Any, ...]:
+        return GVASPropertySerde.descriptor_from_dict, (dict(self.mapping),)
+
+    @override
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.serde.__name__})"
+
+    def value_from_bytes(self, data: bytes, offset: int, validation: str) -> tuple[Any, int]:
+        if validation == "strict":
+            return self.serde.from_bytes_full(data, offset)
+        trusted = validation == "trusted"
+        if self.fixed is not None:
+            full_struct, fields, unit_width = self.fixed
+            values = full_struct.unpack_from(data, offset)
+            if not trusted:
+                if values[0] != 0:
+                    raise ValueError(f"Invalid category at {offset}")
+                if values[1] != full_struct.size - 9:
+                    raise ValueError(f"Invalid size at {offset + 4}")
+                if values[2] != unit_width:
+                    raise ValueError(f"Invalid unit width at {offset + 8}")
+            return dict(zip(fields, values[3:], strict=True)) if fields else values[3], offset + full_struct.size
+        if self.serde._FRAMED:
+            category, size, unit_width = _HEADER.unpack_from(data, offset)
+            if not trusted:
+                if category != 0:
+                    raise ValueError(f"Invalid category at {offset}")
+                if unit_width != 0:
+                    raise ValueError(f"Invalid unit width at {offset + 8}")
+            end = offset + 9 + size
+            value, value_end = self.serde.from_bytes(data, offset + 9)
+            if not trusted and value_end != end:
+                raise ValueError(f"Invalid offset {value_end}")
+            return value, end
+        return self.serde.from_bytes_full(data, offset)
 
 
 class GVASPropertySerde(GVASSerde):
     __slots__ = ()
 
+    _FIXED_LAYOUT: ClassVar[tuple[int, str, tuple[str, ...]] | None] = None
+    _FRAMED: ClassVar[bool] = False
+    _PROJECTABLE: ClassVar[bool] = False
     _TYPE: ClassVar[str]
 
+    @staticmethod
+    @final
+    def descriptor_from_bytes(data: bytes, offset: int) -> tuple[GVASTypeDescriptor, int]:
+        key = bytes(data[offset : GVASPropertySerde._type_end(data, offset) - 4])
+        entry = _BYTES_DESCRIPTORS.get(key)
+        COUNTERS["descriptor_lookups"] += 1
+        if entry is None:
+            COUNTERS["descriptor_misses"] += 1
+            property_type_name, bytes_read = read_name(data, offset)
+            serde = lookup(_REGISTRY, property_type_name)
+            if serde is None:
+                raise KeyError(property_type_name)
+            property_type, end = serde._concrete_type_from_bytes(data, offset + bytes_read)
+            entry = _BYTES_DESCRIPTORS[key] = (property_type.descriptor(), end - offset)
+        return entry[0], offset + entry[1]
+
+    @staticmethod
+    @final
+    def descriptor_from_dict(data: dict[str, str]) -> GVASTypeDescriptor:
+        key = tuple(data.items())
+        descriptor = _DICT_DESCRIPTORS.get(key)
+        COUNTERS["descriptor_lookups"] += 1
+        if descriptor is None:
+            COUNTERS["descriptor_misses"] += 1
+            serde = lookup(_REGISTRY, data["type"])
+            if serde is None:
+                raise KeyError(data["type"])
+            property_type = serde._concrete_type_from_dict(data)
+            descriptor = _DICT_DESCRIPTORS[key] = property_type.descriptor()
+        return descriptor
+
+    @staticmethod
+    @final
+    def descriptor_from_stream(reader: GVASBinaryReader) -> tuple[GVASTypeDescriptor, int]:
+        size = 0
+        pending = 1
+        while pending > 0:
+            size += reader.peek_uint32(size) + 4
+            pending += reader.peek_uint32(size) - 1
+            size += 4
+        end = reader.tell() + size + 5 + reader.peek_uint32(size)
+        reader.ensure(min(size + 13, end - reader.tell()))
+        return reader.decode(GVASPropertySerde.descriptor_from_bytes, 0), end
+
+    @staticmethod
+    @final
+    def skip_from_bytes(data: bytes, offset: int) -> int:
+        offset = GVASPropertySerde._type_end(data, offset)
+        return offset + _UINT32.unpack_from(data, offset)[0] + 5
+
     @staticmethod
     @final
     def type_from_bytes(data: bytes, offset: int) -> tuple[type[GVASPropertySerde], int]:
-        property_type, bytes_read = read_string(data, offset)
-        return _REGISTRY[property_type]._concrete_type_from_bytes(data, offset + bytes_read)
+        descriptor, offset = GVASPropertySerde.descriptor_from_bytes(data, offset)
+        return descriptor.serde, offset
 
     @staticmethod
     @final
     def type_from_dict(data: dict[str, str]) -> type[GVASPropertySerde]:
-        return _REGISTRY[data["type"]]._concrete_type_from_dict(data)
+        return GVASPropertySerde.descriptor_from_dict(data).serde
+
+    @staticmethod
+    @final
+    def _type_end(data: bytes, offset: int) -> int:
+        pending = 1
+        while pending > 0:
+            offset += _UINT32.unpack_from(data, offset)[0] + 4
+            pending += _UINT32.unpack_from(data, offset)[0] - 1
+            offset += 4
+        return offset
 
     @override
     def __init_subclass__(cls) -> None:
@@ -37,6 +177,18 @@ class GVASPropertySerde(GVASSerde):
             raise ValueError(f"Invalid class name {cls.__name__} for type {cls._TYPE}")
         _REGISTRY[type_name] = cls
 
+    @classmethod
+    @final
+    def descriptor(cls) -> GVASTypeDescriptor:
+        descriptor = _DESCRIPTORS.get(cls)
+        if descriptor is None:
+            descriptor = _DESCRIPTORS[cls] = GVASTypeDescriptor(cls)
+        return descriptor
+
+    @classmethod
+    def element_from_stream(cls, reader: GVASBinaryReader, end: int) -> Any:
+        return reader.decode_element(cls.from_bytes, end)
+
     @classmethod
     @abstractmethod
     def from_bytes_array(cls, data: bytes, offset: int) -> tuple[list[Any], int]:
@@ -53,28 +205,138 @@ class GVASPropertySerde(GVASSerde):
         raise NotImplementedError(cls.__name__)
 
     @classmethod
-    @abstractmethod
+    @final
+    @override
+    def from_dict(cls, data: Any) -> bytes:
+        buffer = bytearray()
+        cls.from_dict_into(data, buffer)
+        return bytes(buffer)
+
+    @classmethod
+    @final
     def from_dict_array(cls, data: list[Any]) -> bytes:
-        raise NotImplementedError(cls.__name__)
+        buffer = bytearray()
+        cls.from_dict_array_into(data, buffer)
+        return bytes(buffer)
 
     @classmethod
     @abstractmethod
+    def from_dict_array_into(cls, data: list[Any], buffer: bytearray) -> None:
+        raise NotImplementedError(cls.__name__)
+
+    @classmethod
+    @final
     def from_dict_full(cls, data: Any) -> bytes:
+        buffer = bytearray()
+        cls.from_dict_full_into(data, buffer)
+        return bytes(buffer)
+
+    @classmethod
+    @abstractmethod
+    def from_dict_full_into(cls, data: Any, buffer: bytearray) -> None:
         raise NotImplementedError(cls.__name__)
 
     @classmethod
+    @override
     @abstractmethod
+    def from_dict_into(cls, data: Any, buffer: bytearray) -> None:
+        raise NotImplementedError(cls.__name__)
+
+    @classmethod
+    @final
     def from_dict_set(cls, data: list[Any]) -> bytes:
+        buffer = bytearray()
+        cls.from_dict_set_into(data, buffer)
+        return bytes(buffer)
+
+    @classmethod
+    @abstractmethod
+    def from_dict_set_into(cls, data: list[Any], buffer: bytearray) -> None:
         raise NotImplementedError(cls.__name__)
 
+    @classmethod
+    def from_json_array_into(cls, reader: GVASJSONReader, writer: GVASBinaryWriter) -> None:
+        cls.from_dict_array_into(reader.value(), writer.buffer)
+        writer.flush()
+
+    @classmethod
+    def from_json_full_into(cls, reader: GVASJSONReader, writer: GVASBinaryWriter) -> None:
+        cls.from_dict_full_into(reader.value(), writer.buffer)
+        writer.flush()
+
+    @classmethod
+    def from_stream_array(cls, reader: GVASBinaryReader, end: int) -> Any:
+        return reader.decode(cls.from_bytes_array, end - reader.tell())
+
+    @classmethod
+    def from_stream_full(cls, reader: GVASBinaryReader, end: int) -> Any:
+        return reader.decode(cls.from_bytes_full, end - reader.tell())
+
+    @classmethod
+    def json_from_bytes_array(cls, data: bytes, offset: int, writer: GVASJSONWriter) -> int:
+        values, offset = cls.from_bytes_array(data, offset)
+        writer.value(values)
+        return offset
+
+    @classmethod
+    def json_from_bytes_full(cls, data: bytes, offset: int, writer: GVASJSONWriter) -> int:
+        value, offset = cls.from_bytes_full(data, offset)
+        writer.value(value)
+        return offset
+
+    @classmethod
+    def query_from_bytes_array(
+        cls,
+        data: bytes,
+        offset: int,
+        segments: tuple[str, ...],
+    ) -> Generator[Any, None, int]:
+        values, offset = cls.from_bytes_array(data, offset)
+        yield from select(values, segments)
+        return offset
+
+    @classmethod
+    def query_from_bytes_full(cls, data: bytes, offset: int, segments: tuple[str, ...]) -> Iterator[Any]:
+        value, _ = cls.from_bytes_full(data, offset)
+        yield from select(value, segments)
+
+    @classmethod
+    def skip_element_from_bytes(cls, data: bytes, offset: int) -> int:
+        return cls.from_bytes(data, offset)[1]
+
     @classmethod
     def type_to_bytes(cls) -> bytes:
-        return write_string(f"{cls._TYPE}Property")
+        return write_name(f"{cls._TYPE}Property")
 
     @classmethod
     def type_to_dict(cls) -> dict[str, str]:
         return {"type": f"{cls._TYPE}Property"}
 
+    @classmethod
+    def value_to_dict(cls, value: Any) -> Any:
+        return value
+
+    @classmethod
+    def value_to_node(cls, value: Any) -> Any:
+        return value
+
+    @classmethod
+    @final
+    def _array_header_from_bytes(cls, data: bytes, offset: int, width: int, unit_width: int = 0) -> tuple[int, int]:
+        padding, size, actual_unit_width, count = struct.unpack_from("<IIBI", data, offset)
+        if padding != 0:
+            raise ValueError(f"Invalid padding at {offset}")
+        offset += 4
+        if size < 4:
+            raise ValueError(f"Invalid size at {offset}")
+        offset += 4
+        if actual_unit_width != unit_width:
+            raise ValueError(f"Invalid unit width at {offset}")
+        offset += 1
+        if count * width + 4 != size:
+            raise ValueError(f"Invalid count at {offset}")
+        return count, offset + 4
+
     @classmethod
     def _concrete_type_from_bytes(cls, data: bytes, offset: int) -> tuple[type[Self], int]:
         return cls, offset
@@ -82,3 +344,47 @@ class GVASPropertySerde(GVASSerde):
     @classmethod
     def _concrete_type_from_dict(cls, data: dict[str, str]) -> type[Self]:
         return cls
+
+    @classmethod
+    @final
+    def _matrix_from_bytes(cls, data: bytes, offset: int, count: int, fields: int) -> tuple[Any, int]:
+        import numpy
+
+        values = numpy.frombuffer(data, dtype="<f8", count=count * fields, offset=offset)
+        return values.reshape(count, fields).astype(numpy.float64), offset + count * fields * 8
+
+    @classmethod
+    @final
+    def _matrix_from_dict_into(cls, data: Any, buffer: bytearray, fields: int, unit_width: int) -> None:
+        import numpy
+
+        values = numpy.ascontiguousarray(data, dtype="<f8")
+        if values.ndim != 2 or values.shape[1] != fields:
+            raise ValueError(f"Invalid shape {values.shape}")
+        buffer += struct.pack("<IIBI", 0, values.size * 8 + 4, unit_width, len(values))
+        buffer += values.tobytes()
+
+    @classmethod
+    @final
+    def _typed_array_from_bytes(
+        cls,
+        data: bytes,
+        offset: int,
+        count: int,
+        typecode: str,
+    ) -> tuple[array.array[Any], int]:
+        values = array.array(typecode)
+        end = offset + count * values.itemsize
+        values.frombytes(data[offset:end])
+        if sys.byteorder == "big":
+            values.byteswap()
+        return values, end
+
+    @classmethod
+    @final
+    def _typed_array_from_dict_into(cls, data: array.array[Any], buffer: bytearray) -> None:
+        buffer += struct.pack("<IIBI", 0, len(data) * data.itemsize + 4, 0, len(data))
+        if sys.byteorder == "big":
+            data = array.array(data.typecode, data)
+            data.byteswap()
+        buffer += data
@@ -1,6 +1,8 @@
+import array
 import struct
-from typing import ClassVar, final, override
+from typing import Any, ClassVar, final, override
 
+from ..._options import OPTIONS
 from ._base import GVASPropertySerde
 
 
@@ -12,20 +14,13 @@ class GVASBoolPropertySerde(GVASPropertySerde):
     @classmethod
     @final
     @override
-    def from_bytes_array(cls, data: bytes, offset: int) -> tuple[list[bool], int]:
-        padding, size, unit_width, count = struct.unpack_from("<IIBI", data, offset)
-        if padding != 0:
-            raise ValueError(f"Invalid padding at {offset}")
-        offset += 4
-        if size < 4:
-            raise ValueError(f"Invalid size at {offset}")
-        offset += 4
-        if unit_width != 0:
-            raise ValueError(f"Invalid unit width at {offset}")
-        offset += 1
-        if count + 4 != size:
-            raise ValueError(f"Invalid count at {offset}")
-        offset += 4
+    def from_bytes_array(cls, data: bytes, offset: int) -> tuple[list[bool] | array.array[Any], int]:
+        count, offset = cls._array_header_from_bytes(data, offset, 1)
+        if OPTIONS.get().arrays:
+            typed_values, end = cls._typed_array_from_bytes(data, offset, count, "b")
+            if typed_values and (min(typed_values) < 0 or max(typed_values) > 1):
+                raise ValueError(f"Invalid value at {offset}")
+            return typed_values, end
         values: list[bool] = []
         for value in struct.unpack_from(f"<{count}B", data, offset):
             if value == 0:
@@ -55,11 +50,21 @@ class GVASBoolPropertySerde(GVASPropertySerde):
 
     @classmethod
     @override
-    def from_dict_array(cls, data: list[bool]) -> bytes:
-        return struct.pack(f"<IIBI{len(data)}B", 0, len(data) + 4, 0, len(data), *(1 if b else 0 for b in data))
+    def from_dict_array_into(cls, data: list[bool] | array.array[Any], buffer: bytearray) -> None:
+        if isinstance(data, array.array) and data.typecode == "b":
+            cls._typed_array_from_dict_into(data, buffer)
+        else:
+            buffer += struct.pack(
+                f"<IIBI{len(data)}B",
+                0,
+                len(data) + 4,
+                0,
+                len(data),
+                *(1 if b else 0 for b in data),
+            )
 
     @classmethod
     @final
     @override
-    def from_dict_full(cls, data: bool) -> bytes:
-        return struct.pack("<IIB", 0, 0, 0x10 if data else 0)
+    def from_dict_full_into(cls, data: bool, buffer: bytearray) -> None:
+        buffer += struct.pack("<IIB", 0, 0, 0x10 if data else 0)
@@ -3,7 +3,8 @@ from __future__ import annotations
 import struct
 from typing import ClassVar, final, override
 
-from ...utils import read_string, write_string
+from ..._stats import TYPES_CREATED, lookup
+from ...utils import read_name, read_string, write_name, write_string
 from ._base import GVASPropertySerde
 
 
@@ -52,9 +53,11 @@ class GVASBytePropertySerde(GVASPropertySerde):
     @classmethod
     @final
     @override
-    def from_dict_full(cls, data: str) -> bytes:
-        string_bytes = write_string(f"{cls._NAME}::{data}")
-        return struct.pack("<IIB", 0, len(string_bytes), 0) + string_bytes
+    def from_dict_full_into(cls, data: str, buffer: bytearray) -> None:
+        start = len(buffer)
+        buffer += struct.pack("<IIB", 0, 0, 0)
+        buffer += write_string(f"{cls._NAME}::{data}")
+        struct.pack_into("<I", buffer, start + 4, len(buffer) - start - 9)
 
     @classmethod
     @final
@@ -69,20 +72,21 @@ class GVASBytePropertySerde(GVASPropertySerde):
         if struct.unpack_from("<I", data, offset)[0] != 1:
             raise ValueError(f"Invalid category at {offset}")
         offset += 4
-        name, bytes_read = read_string(data, offset)
+        name, bytes_read = read_name(data, offset)
         if not name:
             raise ValueError(f"Invalid name at {offset}")
         offset += bytes_read
         if struct.unpack_from("<I", data, offset)[0] != 1:
             raise ValueError(f"Invalid index at {offset}")
         offset += 4
-        blueprint, bytes_read = read_string(data, offset)
+        blueprint, bytes_read = read_name(data, offset)
         if not blueprint:
             raise ValueError(f"Invalid blueprint at {offset}")
         offset += bytes_read
         fullpath = f"{blueprint}/{name}"
-        concrete_class = _REGISTRY.get(fullpath)
+        concrete_class = lookup(_REGISTRY, fullpath)
         if concrete_class is None:
+            TYPES_CREATED["byte"] += 1
             concrete_class = type(
                 f"GVASBytePropertySerde@{fullpath}",
                 (GVASBytePropertySerde,),
@@ -98,8 +102,9 @@ class GVASBytePropertySerde(GVASPropertySerde):
         blueprint = data["blueprint"]
         name = data["name"]
         fullpath = f"{blueprint}/{name}"
-        concrete_class = _REGISTRY.get(fullpath)
+        concrete_class = lookup(_REGISTRY, fullpath)
         if concrete_class is None:
+            TYPES_CREATED["byte"] += 1
             concrete_class = type(
                 f"GVASBytePropertySerde@{fullpath}",
                 (GVASBytePropertySerde,),
@@ -115,7 +120,7 @@ class GVASBytePropertySerde(GVASPropertySerde):
         return (
             super().type_to_bytes()
             + struct.pack("<I", 1)
-            + write_string(cls._NAME)
+            + write_name(cls._NAME)
             + struct.pack("<I", 1)
-            + write_string(cls._BLUEPRINT)
+            + write_name(cls._BLUEPRINT)
         )
@@ -0,0 +1,98 @@
+import struct
+from collections.abc import Callable, Mapping
+from typing import Any
+
+from ..._stats import COMPILED_DECODED, COMPILED_ENCODED
+from ...utils import write_name
+from ._base import GVASPropertySerde
+
+
+type StructDecoder = Callable[[bytes, int], tuple[dict[str, dict[str, Any]], int, bool]]
+type StructEncoder = Callable[[Mapping[str, dict[str, Any]], bytearray], bool]
+
+
+STRUCT_DECODERS: dict[type[GVASPropertySerde], StructDecoder] = {}
+STRUCT_ENCODERS: dict[type[GVASPropertySerde], StructEncoder] = {}
+
+
+def compile_struct(serde: type[GVASPropertySerde], layout: list[tuple[str, type[GVASPropertySerde]]]) -> None:
+    namespace: dict[str, Any] = {
+        "COMPILED_DECODED": COMPILED_DECODED,
+        "COMPILED_ENCODED": COMPILED_ENCODED,
+        "KEYS": tuple(name for name, _ in layout),
+        "LABELS": tuple(property_type.descriptor().label for _, property_type in layout),
+        "NONE": write_name("None"),
+    }
+    decoder = ["def decode(data, offset):", "    result = {}"]
+    encoder = [
+        "def encode(data, buffer):",
+        "    if len(data) != len(KEYS) or tuple(data) != KEYS:",
+        "        return False",
+        "    start = len(buffer)",
+    ]
+    for index, (name, property_type) in enumerate(layout):
+        descriptor = property_type.descriptor()
+        prefix = write_name(name) + descriptor.encoded
+        fixed_layout = property_type._FIXED_LAYOUT
+        namespace[f"K{index}"] = name
+        namespace[f"S{index}"] = property_type
+        namespace[f"T{index}"] = descriptor.mapping
+        encoder += [
+            f"    p = data[K{index}]",
+            f"    if p['type'] != T{index}:",
+            "        del buffer[start:]",
+            "        return False",
+        ]
+        if fixed_layout is None:
+            namespace[f"P{index}"] = prefix
+            decoder += [
+                f"    if data[offset : offset + {len(prefix)}] != P{index}:",
+                f"        COMPILED_DECODED[LABELS[:{index}]] += 1",
+                "        return result, offset, False",
+                f"    value, offset = S{index}.from_bytes_full(data, offset + {len(prefix)})",
+                f"    result[K{index}] = {{'type': T{index}.copy(), 'value': value}}",
+            ]
+            encoder += [
+                f"    buffer += P{index}",
+                f"    S{index}.from_dict_full_into(p['value'], buffer)",
+            ]
+            continue
+        unit_width, value_format, fields = fixed_layout
+        value_struct = struct.Struct(value_format)
+        prefix += struct.pack("<IIB", 0, value_struct.size, unit_width)
+        namespace[f"P{index}"] = prefix
+        namespace[f"U{index}"] = value_struct
+        decoder += [
+            f"    if data[offset : offset + {len(prefix)}] != P{index}:",
+            f"        COMPILED_DECODED[LABELS[:{index}]] += 1",
+            "        return result, offset, False",
+        ]
+        encoder.append(f"    buffer += P{index}")
+        if fields:
+            decoder += [
+                f"    values = U{index}.unpack_from(data, offset + {len(prefix)})",
+                f"    result[K{index}] = {{'type': T{index}.copy(), 'value': {{"
+                + ", ".join(f"{field!r}: values[{position}]" for position, field in enumerate(fields))
+                + "}}",
+            ]
+            encoder += [
+                "    value = p['value']",
+                f"    buffer += U{index}.pack(" + ", ".join(f"value[{field!r}]" for field in fields) + ")",
+            ]
+        else:
+            decoder += [
+                f"    value = U{index}.unpack_from(data, offset + {len(prefix)})[0]",
+                f"    result[K{index}] = {{'type': T{index}.copy(), 'value': value}}",
+            ]
+            encoder.append(f"    buffer += U{index}.pack(p['value'])")
+        decoder.append(f"    offset += {len(prefix) + value_struct.size}")
+    decoder += [
+        "    COMPILED_DECODED[LABELS] += 1",
+        "    if data[offset : offset + len(NONE)] != NONE:",
+        "        return result, offset, False",
+        "    return result, offset + len(NONE), True",
+    ]
+    encoder += ["    buffer += NONE", "    COMPILED_ENCODED[LABELS] += 1", "    return True"]
+    exec("\n".join(decoder + encoder), namespace)  # noqa: S102
+    STRUCT_DECODERS[serde] = namespace["decode"]
+    STRUCT_ENCODERS[serde] = namespace["encode"]
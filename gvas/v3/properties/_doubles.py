@@ -1,12 +1,15 @@
+import array
 import struct
-from typing import ClassVar, final, override
+from typing import Any, ClassVar, final, override
 
+from ..._options import OPTIONS
 from ._base import GVASPropertySerde
 
 
 class GVASDoublePropertySerde(GVASPropertySerde):
     __slots__ = ()
 
+    _FIXED_LAYOUT: ClassVar[tuple[int, str, tuple[str, ...]] | None] = (0, "<d", ())
     _TYPE: ClassVar[str] = "Double"
 
     @classmethod
@@ -18,26 +21,16 @@ class GVASDoublePropertySerde(GVASPropertySerde):
     @classmethod
     @final
     @override
-    def from_dict(cls, data: float) -> bytes:
-        return struct.pack("<d", data)
+    def from_dict_into(cls, data: float, buffer: bytearray) -> None:
+        buffer += struct.pack("<d", data)
 
     @classmethod
     @final
     @override
-    def from_bytes_array(cls, data: bytes, offset: int) -> tuple[list[float], int]:
-        padding, size, unit_width, count = struct.unpack_from("<IIBI", data, offset)
-        if padding != 0:
-            raise ValueError(f"Invalid padding at {offset}")
-        offset += 4
-        if size < 4:
-            raise ValueError(f"Invalid size at {offset}")
-        offset += 4
-        if unit_width != 0:
-            raise ValueError(f"Invalid unit width at {offset}")
-        offset += 1
-        if count * 8 + 4 != size:
-            raise ValueError(f"Invalid count at {offset}")
-        offset += 4
+    def from_bytes_array(cls, data: bytes, offset: int) -> tuple[list[float] | array.array[Any], int]:
+        count, offset = cls._array_header_from_bytes(data, offset, 8)
+        if OPTIONS.get().arrays:
+            return cls._typed_array_from_bytes(data, offset, count, "d")
         return list(struct.unpack_from(f"<{count}d", data, offset)), offset + count * 8
 
     @classmethod
@@ -58,11 +51,14 @@ class GVASDoublePropertySerde(GVASPropertySerde):
     @classmethod
     @final
     @override
-    def from_dict_full(cls, data: float) -> bytes:
-        return struct.pack("<IIBd", 0, 8, 0, data)
+    def from_dict_array_into(cls, data: list[float] | array.array[Any], buffer: bytearray) -> None:
+        if isinstance(data, array.array) and data.typecode == "d":
+            cls._typed_array_from_dict_into(data, buffer)
+        else:
+            buffer += struct.pack(f"<IIBI{len(data)}d", 0, len(data) * 8 + 4, 0, len(data), *data)
 
     @classmethod
     @final
     @override
-    def from_dict_array(cls, data: list[float]) -> bytes:
-        return struct.pack(f"<IIBI{len(data)}d", 0, len(data) * 8 + 4, 0, len(data), *data)
+    def from_dict_full_into(cls, data: float, buffer: bytearray) -> None:
+        buffer += struct.pack("<IIBd", 0, 8, 0, data)
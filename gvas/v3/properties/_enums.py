@@ -3,7 +3,8 @@ from __future__ import annotations
 import struct
 from typing import ClassVar, final, override
 
-from ...utils import read_string, write_string
+from ..._stats import TYPES_CREATED, lookup
+from ...utils import read_name, read_string, write_name, write_string
 from ._base import GVASPropertySerde
 
 
@@ -50,9 +51,11 @@ class GVASEnumPropertySerde(GVASPropertySerde):
     @classmethod
     @final
     @override
-    def from_dict_full(cls, data: str) -> bytes:
-        string_bytes = write_string(f"{cls._NAME}::{data}")
-        return struct.pack("<IIB", 0, len(string_bytes), 0) + string_bytes
+    def from_dict_full_into(cls, data: str, buffer: bytearray) -> None:
+        start = len(buffer)
+        buffer += struct.pack("<IIB", 0, 0, 0)
+        buffer += write_string(f"{cls._NAME}::{data}")
+        struct.pack_into("<I", buffer, start + 4, len(buffer) - start - 9)
 
     @classmethod
     @final
@@ -67,27 +70,28 @@ class GVASEnumPropertySerde(GVASPropertySerde):
         if struct.unpack_from("<I", data, offset)[0] != 2:
             raise ValueError(f"Invalid category at {offset}")
         offset += 4
-        name, bytes_read = read_string(data, offset)
+        name, bytes_read = read_name(data, offset)
         if not name:
             raise ValueError(f"Invalid name at {offset}")
         offset += bytes_read
         if struct.unpack_from("<I", data, offset)[0] != 1:
             raise ValueError(f"Invalid index at {offset}")
         offset += 4
-        blueprint, bytes_read = read_string(data, offset)
+        blueprint, bytes_read = read_name(data, offset)
         if not blueprint:
             raise ValueError(f"Invalid blueprint at {offset}")
         offset += bytes_read
         if struct.unpack_from("<I", data, offset)[0] != 0:
             raise ValueError(f"Invalid flag at {offset}")
         offset += 4
-        type_name, bytes_read = read_string(data, offset)
+        type_name, bytes_read = read_name(data, offset)
         if type_name != "ByteProperty":
             raise ValueError(f"Invalid type at {offset}")
         offset += bytes_read
         fullpath = f"{blueprint}/{name}"
-        concrete_class = _REGISTRY.get(fullpath)
+        concrete_class = lookup(_REGISTRY, fullpath)
         if concrete_class is None:
+            TYPES_CREATED["enum"] += 1
             concrete_class = type(
                 f"GVASEnumPropertySerde@{fullpath}",
                 (GVASEnumPropertySerde,),
@@ -103,8 +107,9 @@ class GVASEnumPropertySerde(GVASPropertySerde):
         blueprint = data["blueprint"]
         name = data["name"]
         fullpath = f"{blueprint}/{name}"
-        concrete_class = _REGISTRY.get(fullpath)
+        concrete_class = lookup(_REGISTRY, fullpath)
         if concrete_class is None:
+            TYPES_CREATED["enum"] += 1
             concrete_class = type(
                 f"GVASEnumPropertySerde@{fullpath}",
                 (GVASEnumPropertySerde,),
@@ -120,9 +125,9 @@ class GVASEnumPropertySerde(GVASPropertySerde):
         return (
             super().type_to_bytes()
             + struct.pack("<I", 2)
-            + write_string(cls._NAME)
+            + write_name(cls._NAME)
             + struct.pack("<I", 1)
-            + write_string(cls._BLUEPRINT)
+            + write_name(cls._BLUEPRINT)
             + struct.pack("<I", 0)
-            + write_string("ByteProperty")
+            + write_name("ByteProperty")
         )
@@ -1,14 +1,26 @@
+import array
 import struct
-from typing import ClassVar, final, override
+from typing import Any, ClassVar, final, override
 
+from ..._options import OPTIONS
 from ._base import GVASPropertySerde
 
 
 class GVASFloatPropertySerde(GVASPropertySerde):
     __slots__ = ()
 
+    _FIXED_LAYOUT: ClassVar[tuple[int, str, tuple[str, ...]] | None] = (0, "<f", ())
     _TYPE: ClassVar[str] = "Float"
 
+    @classmethod
+    @final
+    @override
+    def from_bytes_array(cls, data: bytes, offset: int) -> tuple[list[float] | array.array[Any], int]:
+        count, offset = cls._array_header_from_bytes(data, offset, 4)
+        if OPTIONS.get().arrays:
+            return cls._typed_array_from_bytes(data, offset, count, "f")
+        return list(struct.unpack_from(f"<{count}f", data, offset)), offset + count * 4
+
     @classmethod
     @final
     @override
@@ -27,5 +39,14 @@ class GVASFloatPropertySerde(GVASPropertySerde):
     @classmethod
     @final
     @override
-    def from_dict_full(cls, data: float) -> bytes:
-        return struct.pack("<IIBf", 0, 4, 0, data)
+    def from_dict_array_into(cls, data: list[float] | array.array[Any], buffer: bytearray) -> None:
+        if isinstance(data, array.array) and data.typecode == "f":
+            cls._typed_array_from_dict_into(data, buffer)
+        else:
+            buffer += struct.pack(f"<IIBI{len(data)}f", 0, len(data) * 4 + 4, 0, len(data), *data)
+
+    @classmethod
+    @final
+    @override
+    def from_dict_full_into(cls, data: float, buffer: bytearray) -> None:
+        buffer += struct.pack("<IIBf", 0, 4, 0, data)
@@ -1,14 +1,26 @@
+import array
 import struct
-from typing import ClassVar, final, override
+from typing import Any, ClassVar, final, override
 
+from ..._options import OPTIONS
 from ._base import GVASPropertySerde
 
 
 class GVASInt64PropertySerde(GVASPropertySerde):
     __slots__ = ()
 
+    _FIXED_LAYOUT: ClassVar[tuple[int, str, tuple[str, ...]] | None] = (0, "<q", ())
     _TYPE: ClassVar[str] = "Int64"
 
+    @classmethod
+    @final
+    @override
+    def from_bytes_array(cls, data: bytes, offset: int) -> tuple[list[int] | array.array[Any], int]:
+        count, offset = cls._array_header_from_bytes(data, offset, 8)
+        if OPTIONS.get().arrays:
+            return cls._typed_array_from_bytes(data, offset, count, "q")
+        return list(struct.unpack_from(f"<{count}q", data, offset)), offset + count * 8
+
     @classmethod
     @final
     @override
@@ -27,5 +39,14 @@ class GVASInt64PropertySerde(GVASPropertySerde):
     @classmethod
     @final
     @override
-    def from_dict_full(cls, data: int) -> bytes:
-        return struct.pack("<IIBq", 0, 8, 0, data)
+    def from_dict_array_into(cls, data: list[int] | array.array[Any], buffer: bytearray) -> None:
+        if isinstance(data, array.array) and data.typecode == "q":
+            cls._typed_array_from_dict_into(data, buffer)
+        else:
+            buffer += struct.pack(f"<IIBI{len(data)}q", 0, len(data) * 8 + 4, 0, len(data), *data)
+
+    @classmethod
+    @final
+    @override
+    def from_dict_full_into(cls, data: int, buffer: bytearray) -> None:
+        buffer += struct.pack("<IIBq", 0, 8, 0, data)
@@ -1,12 +1,15 @@
+import array
 import struct
-from typing import ClassVar, final, override
+from typing import Any, ClassVar, final, override
 
+from ..._options import OPTIONS
 from ._base import GVASPropertySerde
 
 
 class GVASIntPropertySerde(GVASPropertySerde):
     __slots__ = ()
 
+    _FIXED_LAYOUT: ClassVar[tuple[int, str, tuple[str, ...]] | None] = (0, "<i", ())
     _TYPE: ClassVar[str] = "Int"
 
     @classmethod
@@ -18,8 +21,17 @@ class GVASIntPropertySerde(GVASPropertySerde):
     @classmethod
     @final
     @override
-    def from_dict(cls, data: int) -> bytes:
-        return struct.pack("<i", data)
+    def from_dict_into(cls, data: int, buffer: bytearray) -> None:
+        buffer += struct.pack("<i", data)
+
+    @classmethod
+    @final
+    @override
+    def from_bytes_array(cls, data: bytes, offset: int) -> tuple[list[int] | array.array[Any], int]:
+        count, offset = cls._array_header_from_bytes(data, offset, 4)
+        if OPTIONS.get().arrays:
+            return cls._typed_array_from_bytes(data, offset, count, "i")
+        return list(struct.unpack_from(f"<{count}i", data, offset)), offset + count * 4
 
     @classmethod
     @final
@@ -39,5 +51,14 @@ class GVASIntPropertySerde(GVASPropertySerde):
     @classmethod
     @final
     @override
-    def from_dict_full(cls, data: int) -> bytes:
-        return struct.pack("<IIBi", 0, 4, 0, data)
+    def from_dict_array_into(cls, data: list[int] | array.array[Any], buffer: bytearray) -> None:
+        if isinstance(data, array.array) and data.typecode == "i":
+            cls._typed_array_from_dict_into(data, buffer)
+        else:
+            buffer += struct.pack(f"<IIBI{len(data)}i", 0, len(data) * 4 + 4, 0, len(data), *data)
+
+    @classmethod
+    @final
+    @override
+    def from_dict_full_into(cls, data: int, buffer: bytearray) -> None:
+        buffer += struct.pack("<IIBi", 0, 4, 0, data)
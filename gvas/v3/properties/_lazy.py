@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import array
+import struct
+from collections.abc import Iterator, MutableMapping
+from typing import Any, final, override
+
+from ..._options import OPTIONS, GVASOptions
+from ..._stats import DECODED
+from ...utils import read_name
+from ._base import GVASPropertySerde
+from ._nodes import GVASPropertyNode
+
+
+_SCALARS = (bool, bytes, float, int, str, type(None))
+_UNKNOWN = object()
+
+
+def _snapshot(value: Any, children: list[GVASLazyStruct]) -> Any:
+    if isinstance(value, _SCALARS):
+        return value
+    if isinstance(value, GVASLazyStruct):
+        children.append(value)
+        return value
+    if isinstance(value, dict):
+        return {key: _snapshot(item, children) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_snapshot(item, children) for item in value]
+    if isinstance(value, tuple):
+        return tuple(_snapshot(item, children) for item in value)
+    if isinstance(value, array.array):
+        return array.array(value.typecode, value)
+    if isinstance(value, GVASPropertyNode):
+        return GVASPropertyNode(value.descriptor, _snapshot(value.value, children))
+    return _UNKNOWN
+
+
+@final
+class GVASLazyStruct(MutableMapping[str, MutableMapping[str, Any]]):
+    __slots__ = ("_count", "_data", "_end", "_entries", "_modified", "_options", "_snapshots", "_start", "_values")
+
+    _count: int
+    _data: bytes
+    _end: int
+    _entries: dict[str, tuple[int, int, int] | None]
+    _modified: set[str]
+    _options: GVASOptions
+    _snapshots: dict[str, tuple[Any, list[GVASLazyStruct]]]
+    _start: int
+    _values: dict[str, MutableMapping[str, Any]]
+
+    @classmethod
+    def from_bytes(cls, data: bytes, offset: int) -> tuple[GVASLazyStruct, int]:
+        self = cls.__new__(cls)
+        self._data = data
+        self._start = offset
+        entries: dict[str, tuple[int, int, int] | None] = {}
+        name, bytes_read = read_name(data, offset)
+        while name != "None":
+            start = offset
+            offset += bytes_read
+            end = GVASPropertySerde.skip_from_bytes(data, offset)
+            entries[name] = (start, offset, end)
+            offset = end
+            name, bytes_read = read_name(data, offset)
+        offset += bytes_read
+        self._count = len(entries)
+        self._end = offset
+        self._entries = entries
+        self._modified = set()
+        self._options = OPTIONS.get()
+        self._snapshots = {}
+        self._values = {}
+        return self, offset
+
+    @classmethod
+    def from_index(cls, data: bytes, index: dict[str, Any]) -> tuple[GVASLazyStruct, int]:
+        self = cls.__new__(cls)
+        self._data = data
+        self._start = index["offset"]
+        self._end = index["end"]
+        entries: dict[str, tuple[int, int, int] | None] = {}
+        for name, entry in index["properties"].items():
+            start = entry["offset"]
+            entries[name] = (start, start + struct.unpack_from("<I", data, start)[0] + 4, start + entry["size"])
+        self._count = len(entries)
+        self._entries = entries
+        self._modified = set()
+        self._options = OPTIONS.get()
+        self._snapshots = {}
+        self._values = {}
+        return self, self._end
+
+    @classmethod
+    def _from_state(cls, data: bytes, state: tuple[Any, ...]) -> GVASLazyStruct:
+        self = cls.__new__(cls)
+        self._data = data
+        self._start = 0
+        self._end = len(data)
+        self._count, self._entries, self._modified, self._options, self._snapshots, self._values = state
+        return self
+
+    @override
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    @override
+    def __delitem__(self, key: str) -> None:
+        del self._entries[key]
+        self._modified.add(key)
+        self._snapshots.pop(key, None)
+        self._values.pop(key, None)
+
+    @override
+    def __getitem__(self, key: str) -> MutableMapping[str, Any]:
+        value = self._values.get(key)
+        if value is not None:
+            return value
+        span = self._entries[key]
+        if span is None:
+            raise KeyError(key)
+        _, offset, end = span
+        token = OPTIONS.set(self._options)
+        try:
+            descriptor, offset = GVASPropertySerde.descriptor_from_bytes(self._data, offset)
+            result, offset = descriptor.value_from_bytes(self._data, offset, self._options.validation)
+        finally:
+            OPTIONS.reset(token)
+        DECODED[descriptor.label] += 1
+        if offset != end:
+            raise ValueError(f"Invalid offset {offset}")
+        if self._options.nodes:
+            value = self._values[key] = GVASPropertyNode(descriptor, result)
+        else:
+            value = self._values[key] = {"type": descriptor.mapping.copy(), "value": result}
+        children: list[GVASLazyStruct] = []
+        self._snapshots[key] = (_snapshot(value, children), children)
+        return value
+
+    @override
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    @override
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @override
+    def __reduce__(self) -> tuple[Any, ...]:
+        start = self._start
+        entries = {
+            name: None if span is None else (span[0] - start, span[1] - start, span[2] - start)
+            for name, span in self._entries.items()
+        }
+        state = (self._count, entries, self._modified, self._options, self._snapshots, self._values)
+        return self._from_state, (bytes(self._data[start : self._end]), state)
+
+    @override
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({', '.join(self._entries)})"
+
+    @override
+    def __setitem__(self, key: str, value: MutableMapping[str, Any]) -> None:
+        self._entries.setdefault(key, None)
+        self._modified.add(key)
+        self._snapshots.pop(key, None)
+        self._values[key] = value
+
+    def index(self) -> dict[str, Any]:
+        if self.source() is None:
+            raise ValueError("Modified struct cannot be indexed")
+        properties: dict[str, dict[str, Any]] = {}
+        for name, span in self._entries.items():
+            if span is None:
+                raise ValueError(f"Missing source of {name}")
+            start, offset, end = span
+            properties[name] = {"type": read_name(self._data, offset)[0], "offset": start, "size": end - start}
+        return {"offset": self._start, "end": self._end, "properties": properties}
+
+    def property_source(self, key: str) -> memoryview | None:
+        span = self._entries[key]
+        if span is None or not self._unmodified(key):
+            return None
+        start, _, end = span
+        return memoryview(self._data)[start:end]
+
+    def source(self) -> memoryview | None:
+        if self._modified or len(self._entries) != self._count or not all(map(self._unmodified, self._values)):
+            return None
+        return memoryview(self._data)[self._start : self._end]
+
+    def _unmodified(self, key: str) -> bool:
+        if key in self._modified:
+            return False
+        entry = self._snapshots.get(key)
+        if entry is None:
+            return key not in self._values
+        snapshot, children = entry
+        return self._values[key] == snapshot and all(child.source() is not None for child in children)
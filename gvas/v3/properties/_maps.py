@@ -1,24 +1,209 @@
 import struct
+from collections.abc import Iterator
+from fnmatch import fnmatchcase
 from typing import Any, ClassVar, final, override
 
-from ._base import GVASPropertySerde
+from ..._binary import GVASBinaryReader, GVASBinaryWriter
+from ..._json import GVASJSONReader, GVASJSONWriter
+from ..._options import PROJECTION
+from ..._query import select
+from ._base import GVASPropertySerde, GVASTypeDescriptor
+from ._parallel import elements_from_bytes, elements_from_pool
+from ._projection import elements_from_projection
 
 
 class GVASMapPropertySerde(GVASPropertySerde):
     __slots__ = ()
 
+    _PROJECTABLE: ClassVar[bool] = True
     _TYPE: ClassVar[str] = "Map"
 
     @classmethod
     @final
     @override
     def from_bytes_full(cls, data: bytes, offset: int) -> tuple[dict[str, Any], int]:
+        key_type, value_type, count, expected_offset, offset = cls._header_from_bytes(data, offset)
+        patterns = PROJECTION.get()
+        if patterns is None:
+            values, offset = elements_from_pool(data, offset, count, expected_offset, (key_type, value_type))
+        else:
+            values, offset = elements_from_projection(data, offset, count, (key_type, value_type), patterns)
+        if offset != expected_offset:
+            raise ValueError(f"Invalid offset {offset}")
+        return {
+            "key_type": key_type.mapping.copy(),
+            "value_type": value_type.mapping.copy(),
+            "values": values,
+        }, offset
+
+    @classmethod
+    @final
+    @override
+    def from_dict_full_into(cls, data: dict[str, Any], buffer: bytearray) -> None:
+        key_type = GVASPropertySerde.descriptor_from_dict(data["key_type"])
+        value_type = GVASPropertySerde.descriptor_from_dict(data["value_type"])
+        values = data["values"]
+        buffer += struct.pack("<I", 2)
+        buffer += key_type.encoded
+        buffer += struct.pack("<I", 0)
+        buffer += value_type.encoded
+        start = len(buffer)
+        buffer += struct.pack("<IIBII", 0, 0, 0, 0, len(values))
+        key_serde = key_type.serde
+        value_serde = value_type.serde
+        for key, value in values:
+            key_serde.from_dict_into(key, buffer)
+            value_serde.from_dict_into(value, buffer)
+        struct.pack_into("<I", buffer, start + 4, len(buffer) - start - 9)
+
+    @classmethod
+    @final
+    @override
+    def from_json_full_into(cls, reader: GVASJSONReader, writer: GVASBinaryWriter) -> None:
+        reader.begin_object()
+        data: dict[str, Any] = {}
+        streamed = False
+        while (key := reader.next_key()) is not None:
+            if key not in ("key_type", "value_type", "values") or key in data or (key == "values" and streamed):
+                raise ValueError(f"Unexpected key {key} in map")
+            if key == "values" and "key_type" in data and "value_type" in data:
+                cls._values_from_json_into(data, reader, writer)
+                streamed = True
+            else:
+                data[key] = reader.value()
+        if not streamed:
+            if "values" not in data:
+                raise ValueError("Missing values in map")
+            cls.from_dict_full_into(data, writer.buffer)
+            writer.flush()
+
+    @classmethod
+    @final
+    @override
+    def from_stream_full(cls, reader: GVASBinaryReader, end: int) -> dict[str, Any]:
+        start = reader.tell()
+        key_type, value_type, count, size = reader.decode_element(cls._header_from_stream, end)
+        if reader.tell() + size != end:
+            raise ValueError(f"Invalid size at {start + 4}")
+        key_serde = key_type.serde
+        value_serde = value_type.serde
+        values: list[Any] = []
+        for _ in range(count):
+            key = key_serde.element_from_stream(reader, end)
+            values.append((key, value_serde.element_from_stream(reader, end)))
+        return {
+            "key_type": key_type.mapping.copy(),
+            "value_type": value_type.mapping.copy(),
+            "values": values,
+        }
+
+    @classmethod
+    @final
+    @override
+    def json_from_bytes_full(cls, data: bytes, offset: int, writer: GVASJSONWriter) -> int:
+        key_type, value_type, count, expected_offset, offset = cls._header_from_bytes(data, offset)
+        writer.begin_object()
+        writer.key("key_type")
+        writer.value(key_type.mapping)
+        writer.key("value_type")
+        writer.value(value_type.mapping)
+        writer.key("values")
+        writer.begin_array()
+        key_serde = key_type.serde
+        value_serde = value_type.serde
+        for _ in range(count):
+            writer.item()
+            writer.begin_array()
+            writer.item()
+            offset = key_serde.json_from_bytes(data, offset, writer)
+            writer.item()
+            offset = value_serde.json_from_bytes(data, offset, writer)
+            writer.end()
+        writer.end()
+        writer.end()
+        if offset != expected_offset:
+            raise ValueError(f"Invalid offset {offset}")
+        return offset
+
+    @classmethod
+    @final
+    @override
+    def query_from_bytes_full(cls, data: bytes, offset: int, segments: tuple[str, ...]) -> Iterator[Any]:
+        if not segments:
+            value, _ = cls.from_bytes_full(data, offset)
+            yield value
+            return
+        key_type, value_type, count, _, offset = cls._header_from_bytes(data, offset)
+        if fnmatchcase("key_type", segments[0]):
+            yield from select(key_type.mapping.copy(), segments[1:])
+        if fnmatchcase("value_type", segments[0]):
+            yield from select(value_type.mapping.copy(), segments[1:])
+        if not fnmatchcase("values", segments[0]):
+            return
+        if len(segments) == 1:
+            values, _ = elements_from_bytes(data, offset, count, (key_type, value_type))
+            yield values
+            return
+        key_serde = key_type.serde
+        value_serde = value_type.serde
+        for index in range(count):
+            key, offset = key_serde.from_bytes(data, offset)
+            if not fnmatchcase(str(index), segments[1]):
+                offset = value_serde.skip_element_from_bytes(data, offset)
+            elif len(segments) == 2:
+                value, offset = value_serde.from_bytes(data, offset)
+                yield key, value
+            else:
+                if fnmatchcase("0", segments[2]):
+                    yield from select(key, segments[3:])
+                if fnmatchcase("1", segments[2]):
+                    offset = yield from value_serde.query_from_bytes(data, offset, segments[3:])
+                else:
+                    offset = value_serde.skip_element_from_bytes(data, offset)
+
+    @classmethod
+    @final
+    @override
+    def value_to_dict(cls, value: dict[str, Any]) -> dict[str, Any]:
+        key_type = GVASPropertySerde.descriptor_from_dict(value["key_type"])
+        value_type = GVASPropertySerde.descriptor_from_dict(value["value_type"])
+        return {
+            "key_type": key_type.mapping.copy(),
+            "value_type": value_type.mapping.copy(),
+            "values": [
+                (key_type.serde.value_to_dict(key), value_type.serde.value_to_dict(item))
+                for key, item in value["values"]
+            ],
+        }
+
+    @classmethod
+    @final
+    @override
+    def value_to_node(cls, value: dict[str, Any]) -> dict[str, Any]:
+        key_type = GVASPropertySerde.descriptor_from_dict(value["key_type"])
+        value_type = GVASPropertySerde.descriptor_from_dict(value["value_type"])
+        return {
+            "key_type": key_type.mapping.copy(),
+            "value_type": value_type.mapping.copy(),
+            "values": [
+                (key_type.serde.value_to_node(key), value_type.serde.value_to_node(item))
+                for key, item in value["values"]
+            ],
+        }
+
+    @classmethod
+    @final
+    def _header_from_bytes(
+        cls,
+        data: bytes,
+        offset: int,
+    ) -> tuple[GVASTypeDescriptor, GVASTypeDescriptor, int, int, int]:
         if struct.unpack_from("<I", data, offset)[0] != 2:
             raise ValueError(f"Invalid category at {offset}")
-        key_type, offset = GVASPropertySerde.type_from_bytes(data, offset + 4)
+        key_type, offset = GVASPropertySerde.descriptor_from_bytes(data, offset + 4)
         if struct.unpack_from("<I", data, offset)[0] != 0:
             raise ValueError(f"Invalid padding at {offset}")
-        value_type, offset = GVASPropertySerde.type_from_bytes(data, offset + 4)
+        value_type, offset = GVASPropertySerde.descriptor_from_bytes(data, offset + 4)
         flag, size, unit_width, padding, count = struct.unpack_from("<IIBII", data, offset)
         if flag != 0:
             raise ValueError(f"Invalid flag at {offset}")
@@ -33,32 +218,43 @@ class GVASMapPropertySerde(GVASPropertySerde):
         if padding != 0:
             raise ValueError(f"Invalid padding at {offset}")
         offset += 8
-        values: list[tuple[Any, Any]] = []
-        for _ in range(count):
-            key, offset = key_type.from_bytes(data, offset)
-            value, offset = value_type.from_bytes(data, offset)
-            values.append((key, value))
-        if offset != expected_offset:
-            raise ValueError(f"Invalid offset {offset}")
-        return {
-            "key_type": key_type.type_to_dict(),
-            "value_type": value_type.type_to_dict(),
-            "values": values,
-        }, offset
+        return key_type, value_type, count, expected_offset, offset
 
     @classmethod
     @final
-    @override
-    def from_dict_full(cls, data: dict[str, Any]) -> bytes:
-        key_type = GVASPropertySerde.type_from_dict(data["key_type"])
-        value_type = GVASPropertySerde.type_from_dict(data["value_type"])
-        values = data["values"]
-        body = b"".join(key_type.from_dict(key) + value_type.from_dict(value) for key, value in values)
-        return (
-            struct.pack("<I", 2)
-            + key_type.type_to_bytes()
-            + struct.pack("<I", 0)
-            + value_type.type_to_bytes()
-            + struct.pack("<IIBII", 0, len(body) + 8, 0, 0, len(values))
-            + body
-        )
+    def _header_from_stream(
+        cls,
+        data: bytes,
+        offset: int,
+    ) -> tuple[tuple[GVASTypeDescriptor, GVASTypeDescriptor, int, int], int]:
+        key_type, value_type, count, expected_offset, offset = cls._header_from_bytes(data, offset)
+        return (key_type, value_type, count, expected_offset - offset), offset
+
+    @classmethod
+    @final
+    def _values_from_json_into(cls, data: dict[str, Any], reader: GVASJSONReader, writer: GVASBinaryWriter) -> None:
+        key_type = GVASPropertySerde.descriptor_from_dict(data["key_type"])
+        value_type = GVASPropertySerde.descriptor_from_dict(data["value_type"])
+        writer.buffer += struct.pack("<I", 2)
+        writer.buffer += key_type.encoded
+        writer.buffer += struct.pack("<I", 0)
+        writer.buffer += value_type.encoded
+        start = writer.tell()
+        writer.buffer += struct.pack("<IIBII", 0, 0, 0, 0, 0)
+        reader.begin_array()
+        key_serde = key_type.serde
+        value_serde = value_type.serde
+        count = 0
+        while reader.next_item():
+            reader.begin_array()
+            if not reader.next_item():
+                raise ValueError(f"Missing key of entry {count}")
+            key_serde.from_json_into(reader, writer)
+            if not reader.next_item():
+                raise ValueError(f"Missing value of entry {count}")
+            value_serde.from_json_into(reader, writer)
+            if reader.next_item():
+                raise ValueError(f"Unexpected data in entry {count}")
+            count += 1
+        writer.patch(start + 4, struct.pack("<I", writer.tell() - start - 9))
+        writer.patch(start + 13, struct.pack("<I", count))
@@ -20,8 +20,8 @@ class GVASNamePropertySerde(GVASPropertySerde):
     @classmethod
     @final
     @override
-    def from_dict(cls, data: str) -> bytes:
-        return write_string(data)
+    def from_dict_into(cls, data: str, buffer: bytearray) -> None:
+        buffer += write_string(data)
 
     @classmethod
     @final
@@ -99,19 +99,26 @@ class GVASNamePropertySerde(GVASPropertySerde):
     @classmethod
     @final
     @override
-    def from_dict_full(cls, data: str) -> bytes:
-        string_bytes = write_string(data)
-        return struct.pack("<IIB", 0, len(string_bytes), 0) + string_bytes
+    def from_dict_full_into(cls, data: str, buffer: bytearray) -> None:
+        start = len(buffer)
+        buffer += struct.pack("<IIB", 0, 0, 0)
+        buffer += write_string(data)
+        struct.pack_into("<I", buffer, start + 4, len(buffer) - start - 9)
 
     @classmethod
     @override
-    def from_dict_array(cls, data: list[str]) -> bytes:
-        string_bytes = write_string(*data)
-        return struct.pack("<IIBI", 0, len(string_bytes) + 4, 0, len(data)) + string_bytes
+    def from_dict_array_into(cls, data: list[str], buffer: bytearray) -> None:
+        start = len(buffer)
+        buffer += struct.pack("<IIBI", 0, 0, 0, len(data))
+        buffer += write_string(*data)
+        struct.pack_into("<I", buffer, start + 4, len(buffer) - start - 9)
 
     @classmethod
     @final
     @override
-    def from_dict_set(cls, data: list[str]) -> bytes:
-        string_data = write_string(*dict.fromkeys(data).keys())
-        return struct.pack("<IIBII", 0, len(string_data) + 8, 0, 0, len(dict.fromkeys(data))) + string_data
+    def from_dict_set_into(cls, data: list[str], buffer: bytearray) -> None:
+        values = dict.fromkeys(data).keys()
+        start = len(buffer)
+        buffer += struct.pack("<IIBII", 0, 0, 0, 0, len(values))
+        buffer += write_string(*values)
+        struct.pack_into("<I", buffer, start + 4, len(buffer) - start - 9)
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import itertools
+from collections.abc import Iterator, Mapping, MutableMapping
+from typing import Any, final, override
+
+from ..._stats import TYPES_CREATED
+from ._base import GVASPropertySerde, GVASTypeDescriptor
+
+
+_KEYS = ("type", "value")
+_LAYOUTS: dict[tuple[str, ...], dict[str, int]] = {}
+
+
+def _layout(names: tuple[str, ...]) -> dict[str, int]:
+    layout = _LAYOUTS.get(names)
+    if layout is None:
+        layout = _LAYOUTS[names] = {name: index for index, name in enumerate(names)}
+        TYPES_CREATED["layout"] += 1
+    return layout
+
+
+@final
+class GVASPropertyNode(MutableMapping[str, Any]):
+    __slots__ = ("descriptor", "value")
+
+    descriptor: GVASTypeDescriptor
+    value: Any
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> GVASPropertyNode:
+        if isinstance(data, GVASPropertyNode):
+            return data
+        descriptor = GVASPropertySerde.descriptor_from_dict(data["type"])
+        return cls(descriptor, descriptor.serde.value_to_node(data["value"]))
+
+    def __init__(self, descriptor: GVASTypeDescriptor, value: Any) -> None:
+        self.descriptor = descriptor
+        self.value = value
+
+    @override
+    def __delitem__(self, key: str) -> None:
+        raise TypeError(f"Cannot delete {key} from {self.__class__.__name__}")
+
+    @override
+    def __getitem__(self, key: str) -> Any:
+        if key == "value":
+            return self.value
+        if key == "type":
+            return self.descriptor.mapping.copy()
+        raise KeyError(key)
+
+    @override
+    def __iter__(self) -> Iterator[str]:
+        return iter(_KEYS)
+
+    @override
+    def __len__(self) -> int:
+        return 2
+
+    @override
+    def __reduce__(self) -> tuple[Any, ...]:
+        return self.__class__, (self.descriptor, self.value)
+
+    @override
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.descriptor.serde.__name__}, {self.value!r})"
+
+    @override
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key == "value":
+            self.value = value
+        elif key == "type":
+            self.descriptor = GVASPropertySerde.descriptor_from_dict(value)
+        else:
+            raise KeyError(key)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"type": self.descriptor.mapping.copy(), "value": self.descriptor.serde.value_to_dict(self.value)}
+
+
+@final
+class GVASStructNode(MutableMapping[str, MutableMapping[str, Any]]):
+    __slots__ = ("_layout", "_nodes", "_owned")
+
+    _layout: dict[str, int]
+    _nodes: list[MutableMapping[str, Any]]
+    _owned: bool
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Mapping[str, Any]]) -> GVASStructNode:
+        if isinstance(data, GVASStructNode):
+            return data
+        return cls({name: GVASPropertyNode.from_dict(property_data) for name, property_data in data.items()})
+
+    def __init__(self, properties: Mapping[str, MutableMapping[str, Any]]) -> None:
+        self._layout = _layout(tuple(properties))
+        self._nodes = list(properties.values())
+        self._owned = False
+
+    @override
+    def __contains__(self, key: object) -> bool:
+        return key in self._layout
+
+    @override
+    def __delitem__(self, key: str) -> None:
+        index = self._layout[key]
+        layout = self._own_layout()
+        del self._nodes[index]
+        del layout[key]
+        for name in itertools.islice(layout, index, None):
+            layout[name] -= 1
+
+    @override
+    def __getitem__(self, key: str) -> MutableMapping[str, Any]:
+        return self._nodes[self._layout[key]]
+
+    @override
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._layout)
+
+    @override
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    @override
+    def __reduce__(self) -> tuple[Any, ...]:
+        return self.__class__, (dict(zip(self._layout, self._nodes, strict=True)),)
+
+    @override
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({', '.join(self._layout)})"
+
+    @override
+    def __setitem__(self, key: str, value: MutableMapping[str, Any]) -> None:
+        index = self._layout.get(key)
+        if index is None:
+            self._own_layout()[key] = len(self._nodes)
+            self._nodes.append(value)
+        else:
+            self._nodes[index] = value
+
+    def to_dict(self) -> dict[str, dict[str, Any]]:
+        result: dict[str, dict[str, Any]] = {}
+        for name, node in zip(self._layout, self._nodes, strict=True):
+            if isinstance(node, GVASPropertyNode):
+                result[name] = node.to_dict()
+            else:
+                result[name] = GVASPropertyNode.from_dict(node).to_dict()
+        return result
+
+    def _own_layout(self) -> dict[str, int]:
+        if not self._owned:
+            self._layout = dict(self._layout)
+            self._owned = True
+        return self._layout
@@ -34,6 +34,8 @@ class GVASObjectPropertySerde(GVASPropertySerde):
     @classmethod
     @final
     @override
-    def from_dict_full(cls, data: str) -> bytes:
-        string_bytes = write_string(data)
-        return struct.pack("<IIB", 0, len(string_bytes), 0) + string_bytes
+    def from_dict_full_into(cls, data: str, buffer: bytearray) -> None:
+        start = len(buffer)
+        buffer += struct.pack("<IIB", 0, 0, 0)
+        buffer += write_string(data)
+        struct.pack_into("<I", buffer, start + 4, len(buffer) - start - 9)
@@ -0,0 +1,91 @@
+import mmap
+from pathlib import Path
+from typing import Any
+
+from ..._options import OPTIONS, POOL, PROFILER, GVASOptions
+from ..._stats import counted, merge
+from ._base import GVASTypeDescriptor
+
+
+_CHUNKS_PER_WORKER = 4
+
+
+def _elements_from_file(
+    filepath: Path,
+    options: GVASOptions,
+    element_types: tuple[GVASTypeDescriptor] | tuple[GVASTypeDescriptor, GVASTypeDescriptor],
+    offset: int,
+    count: int,
+) -> tuple[list[Any], int]:
+    with (
+        filepath.open("rb") as f,
+        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+        memoryview(mapped) as data,
+    ):
+        token = OPTIONS.set(options)
+        try:
+            return elements_from_bytes(data, offset, count, element_types)
+        finally:
+            OPTIONS.reset(token)
+
+
+def elements_from_bytes(
+    data: bytes,
+    offset: int,
+    count: int,
+    element_types: tuple[GVASTypeDescriptor] | tuple[GVASTypeDescriptor, GVASTypeDescriptor],
+) -> tuple[list[Any], int]:
+    values: list[Any] = []
+    if len(element_types) == 1:
+        serde = element_types[0].serde
+        for _ in range(count):
+            value, offset = serde.from_bytes(data, offset)
+            values.append(value)
+        return values, offset
+    key_type, value_type = element_types
+    key_serde = key_type.serde
+    value_serde = value_type.serde
+    for _ in range(count):
+        key, offset = key_serde.from_bytes(data, offset)
+        value, offset = value_serde.from_bytes(data, offset)
+        values.append((key, value))
+    return values, offset
+
+
+def elements_from_pool(
+    data: bytes,
+    offset: int,
+    count: int,
+    expected_offset: int,
+    element_types: tuple[GVASTypeDescriptor] | tuple[GVASTypeDescriptor, GVASTypeDescriptor],
+) -> tuple[list[Any], int]:
+    pool = POOL.get()
+    options = OPTIONS.get()
+    if (
+        pool is None
+        or options.lazy
+        or count < 2
+        or expected_offset - offset < pool.threshold
+        or PROFILER.get() is not None
+    ):
+        return elements_from_bytes(data, offset, count, element_types)
+    chunk_size = -(-count // (pool.workers * _CHUNKS_PER_WORKER))
+    serdes = tuple(element_type.serde for element_type in element_types)
+    ranges: list[tuple[int, int]] = []
+    for index in range(count):
+        if index % chunk_size == 0:
+            ranges.append((offset, min(chunk_size, count - index)))
+        for serde in serdes:
+            offset = serde.skip_element_from_bytes(data, offset)
+    futures = [
+        pool.submit(counted, _elements_from_file, pool.filepath, options, element_types, start, chunk_count)
+        for start, chunk_count in ranges
+    ]
+    values: list[Any] = []
+    for future, end in zip(futures, [start for start, _ in ranges[1:]] + [offset], strict=True):
+        (chunk, chunk_end), counts = future.result()
+        merge(counts)
+        if chunk_end != end:
+            raise ValueError(f"Invalid offset {chunk_end}")
+        values.extend(chunk)
+    return values, offset
@@ -0,0 +1,56 @@
+import functools
+from fnmatch import fnmatchcase
+from typing import Any
+
+from ..._options import PROJECTION
+from ._base import GVASTypeDescriptor
+
+
+def elements_from_projection(
+    data: bytes,
+    offset: int,
+    count: int,
+    element_types: tuple[GVASTypeDescriptor] | tuple[GVASTypeDescriptor, GVASTypeDescriptor],
+    patterns: tuple[tuple[str, ...], ...],
+) -> tuple[list[Any], int]:
+    values: list[Any] = []
+    token = PROJECTION.set(None)
+    try:
+        if len(element_types) == 1:
+            serde = element_types[0].serde
+            for index in range(count):
+                children = project(patterns, str(index))
+                if children == ():
+                    offset = serde.skip_element_from_bytes(data, offset)
+                    continue
+                PROJECTION.set(children if serde._PROJECTABLE else None)
+                value, offset = serde.from_bytes(data, offset)
+                values.append(value)
+            return values, offset
+        key_type, value_type = element_types
+        key_serde = key_type.serde
+        value_serde = value_type.serde
+        for _ in range(count):
+            PROJECTION.set(None)
+            key, offset = key_serde.from_bytes(data, offset)
+            children = project(patterns, str(key))
+            if children == ():
+                offset = value_serde.skip_element_from_bytes(data, offset)
+                continue
+            PROJECTION.set(children if value_serde._PROJECTABLE else None)
+            value, offset = value_serde.from_bytes(data, offset)
+            values.append((key, value))
+        return values, offset
+    finally:
+        PROJECTION.reset(token)
+
+
+@functools.lru_cache(maxsize=65536)
+def project(patterns: tuple[tuple[str, ...], ...], name: str) -> tuple[tuple[str, ...], ...] | None:
+    children: list[tuple[str, ...]] = []
+    for pattern in patterns:
+        if fnmatchcase(name, pattern[0]):
+            if len(pattern) == 1:
+                return None
+            children.append(pattern[1:])
+    return tuple(children)
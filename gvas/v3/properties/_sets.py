@@ -1,6 +1,7 @@
 import struct
 from typing import Any, ClassVar, final, override
 
+from ..._options import PROFILER
 from ._base import GVASPropertySerde
 
 
@@ -15,13 +16,49 @@ class GVASSetPropertySerde(GVASPropertySerde):
     def from_bytes_full(cls, data: bytes, offset: int) -> tuple[dict[str, Any], int]:
         if struct.unpack_from("<I", data, offset)[0] != 1:
             raise ValueError(f"Invalid category at {offset}")
-        element_type, offset = GVASPropertySerde.type_from_bytes(data, offset + 4)
-        values, offset = element_type.from_bytes_set(data, offset)
-        return {"type": element_type.type_to_dict(), "values": values}, offset
+        element_type, offset = GVASPropertySerde.descriptor_from_bytes(data, offset + 4)
+        profiler = PROFILER.get()
+        if profiler is None:
+            values, offset = element_type.serde.from_bytes_set(data, offset)
+        else:
+            start = profiler.begin()
+            values_offset = offset
+            values, offset = element_type.serde.from_bytes_set(data, offset)
+            profiler.end(start, "decode set", "values", element_type.label, values_offset, offset - values_offset)
+        return {"type": element_type.mapping.copy(), "values": values}, offset
 
     @classmethod
     @final
     @override
-    def from_dict_full(cls, data: dict[str, Any]) -> bytes:
-        element_type = GVASPropertySerde.type_from_dict(data["type"])
-        return struct.pack("<I", 1) + element_type.type_to_bytes() + element_type.from_dict_set(data["values"])
+    def from_dict_full_into(cls, data: dict[str, Any], buffer: bytearray) -> None:
+        element_type = GVASPropertySerde.descriptor_from_dict(data["type"])
+        buffer += struct.pack("<I", 1)
+        buffer += element_type.encoded
+        profiler = PROFILER.get()
+        if profiler is None:
+            element_type.serde.from_dict_set_into(data["values"], buffer)
+        else:
+            start = profiler.begin()
+            offset = len(buffer)
+            element_type.serde.from_dict_set_into(data["values"], buffer)
+            profiler.end(start, "encode set", "values", element_type.label, offset, len(buffer) - offset)
+
+    @classmethod
+    @final
+    @override
+    def value_to_dict(cls, value: dict[str, Any]) -> dict[str, Any]:
+        element_type = GVASPropertySerde.descriptor_from_dict(value["type"])
+        return {
+            "type": element_type.mapping.copy(),
+            "values": [element_type.serde.value_to_dict(element) for element in value["values"]],
+        }
+
+    @classmethod
+    @final
+    @override
+    def value_to_node(cls, value: dict[str, Any]) -> dict[str, Any]:
+        element_type = GVASPropertySerde.descriptor_from_dict(value["type"])
+        return {
+            "type": element_type.mapping.copy(),
+            "values": [element_type.serde.value_to_node(element) for element in value["values"]],
+        }
@@ -8,6 +8,7 @@ from ._base import GVASPropertySerde
 class GVASSoftObjectPropertySerde(GVASPropertySerde):
     __slots__ = ()
 
+    _FRAMED: ClassVar[bool] = True
     _TYPE: ClassVar[str] = "SoftObject"
 
     @classmethod
@@ -71,19 +72,25 @@ class GVASSoftObjectPropertySerde(GVASPropertySerde):
     @classmethod
     @final
     @override
-    def from_dict(cls, data: dict[str, str]) -> bytes:
-        return write_string(data["blueprint"], data["reference"]) + struct.pack("<I", 0)
+    def from_dict_into(cls, data: dict[str, str], buffer: bytearray) -> None:
+        buffer += write_string(data["blueprint"], data["reference"])
+        buffer += struct.pack("<I", 0)
 
     @classmethod
     @final
     @override
-    def from_dict_full(cls, data: dict[str, str]) -> bytes:
-        body = cls.from_dict(data)
-        return struct.pack("<IIB", 0, len(body), 0) + body
+    def from_dict_full_into(cls, data: dict[str, str], buffer: bytearray) -> None:
+        start = len(buffer)
+        buffer += struct.pack("<IIB", 0, 0, 0)
+        cls.from_dict_into(data, buffer)
+        struct.pack_into("<I", buffer, start + 4, len(buffer) - start - 9)
 
     @classmethod
     @final
     @override
-    def from_dict_set(cls, data: list[dict[str, str]]) -> bytes:
-        body = b"".join(cls.from_dict(item) for item in data)
-        return struct.pack("<IIBII", 0, len(body) + 8, 0, 0, len(data)) + body
+    def from_dict_set_into(cls, data: list[dict[str, str]], buffer: bytearray) -> None:
+        start = len(buffer)
+        buffer += struct.pack("<IIBII", 0, 0, 0, 0, len(data))
+        for item in data:
+            cls.from_dict_into(item, buffer)
+        struct.pack_into("<I", buffer, start + 4, len(buffer) - start - 9)
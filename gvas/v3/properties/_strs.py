@@ -8,6 +8,7 @@ from ._base import GVASPropertySerde
 class GVASStrPropertySerde(GVASPropertySerde):
     __slots__ = ()
 
+    _FRAMED: ClassVar[bool] = True
     _TYPE: ClassVar[str] = "Str"
 
     @classmethod
@@ -20,8 +21,8 @@ class GVASStrPropertySerde(GVASPropertySerde):
     @classmethod
     @final
     @override
-    def from_dict(cls, data: str) -> bytes:
-        return write_string(data)
+    def from_dict_into(cls, data: str, buffer: bytearray) -> None:
+        buffer += write_string(data)
 
     @classmethod
     @final
@@ -71,13 +72,17 @@ class GVASStrPropertySerde(GVASPropertySerde):
     @classmethod
     @final
     @override
-    def from_dict_full(cls, data: str) -> bytes:
-        string_bytes = write_string(data)
-        return struct.pack("<IIB", 0, len(string_bytes), 0) + string_bytes
+    def from_dict_full_into(cls, data: str, buffer: bytearray) -> None:
+        start = len(buffer)
+        buffer += struct.pack("<IIB", 0, 0, 0)
+        buffer += write_string(data)
+        struct.pack_into("<I", buffer, start + 4, len(buffer) - start - 9)
 
     @classmethod
     @final
     @override
-    def from_dict_array(cls, data: list[str]) -> bytes:
-        string_data = write_string(*data)
-        return struct.pack("<IIBI", 0, len(string_data) + 4, 0, len(data)) + string_data
+    def from_dict_array_into(cls, data: list[str], buffer: bytearray) -> None:
+        start = len(buffer)
+        buffer += struct.pack("<IIBI", 0, 0, 0, len(data))
+        buffer += write_string(*data)
+        struct.pack_into("<I", buffer, start + 4, len(buffer) - start - 9)
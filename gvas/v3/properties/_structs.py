@@ -1,16 +1,36 @@
 from __future__ import annotations
 
+import functools
 import itertools
 import struct
 import uuid
 from abc import abstractmethod
-from typing import Any, ClassVar, final, override
+from fnmatch import fnmatchcase
+from typing import TYPE_CHECKING, Any, ClassVar, final, override
 
-from ...utils import read_string, write_string
+from ..._options import OPTIONS, PROFILER, PROJECTION
+from ..._query import select
+from ..._stats import DECODED, ENCODED, TYPES_CREATED, lookup
+from ...utils import read_name, read_string, write_name, write_string
 from ._base import GVASPropertySerde
+from ._compiler import STRUCT_DECODERS, STRUCT_ENCODERS, compile_struct
+from ._lazy import GVASLazyStruct
+from ._nodes import GVASPropertyNode, GVASStructNode
+from ._parallel import elements_from_pool
+from ._projection import elements_from_projection, project
+
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterator, Mapping, MutableMapping
+
+    from ..._binary import GVASBinaryReader, GVASBinaryWriter
+    from ..._json import GVASJSONReader, GVASJSONWriter
+    from ..._profiler import GVASProfiler
+    from ._base import GVASTypeDescriptor
 
 
 _REGISTRY: dict[str, type[GVASStructPropertySerde]] = {}
+_UINT32 = struct.Struct("<I")
 
 
 class GVASStructPropertySerde(GVASPropertySerde):
@@ -34,7 +54,7 @@ class GVASStructPropertySerde(GVASPropertySerde):
         else:
             raise ValueError(f"Invalid category at {offset}")
         offset += 4
-        name, bytes_read = read_string(data, offset)
+        name, bytes_read = read_name(data, offset)
         if not name:
             raise ValueError(f"Invalid name at {offset}")
         offset += bytes_read
@@ -42,23 +62,24 @@ class GVASStructPropertySerde(GVASPropertySerde):
         if index != 1:
             raise ValueError(f"Invalid index at {offset}")
         offset += 4
-        blueprint, bytes_read = read_string(data, offset)
+        blueprint, bytes_read = read_name(data, offset)
         if not blueprint:
             raise ValueError(f"Invalid blueprint at {offset}")
         offset += bytes_read
         fullpath = f"{blueprint}/{name}"
-        concrete_class = _REGISTRY.get(fullpath)
+        concrete_class = lookup(_REGISTRY, fullpath)
         if singleton:
             guid = ""
         else:
             if struct.unpack_from("<I", data, offset)[0] != 0:
                 raise ValueError(f"Invalid index at {offset}")
             offset += 4
-            guid, bytes_read = read_string(data, offset)
+            guid, bytes_read = read_name(data, offset)
             if not guid:
                 raise ValueError(f"Missing guid at {offset}")
             offset += bytes_read
         if concrete_class is None:
+            TYPES_CREATED["struct"] += 1
             concrete_class = type(
                 f"GVASStructProperty@{fullpath}",
                 (GVASBlueprintStructPropertySerde,),
@@ -77,8 +98,9 @@ class GVASStructPropertySerde(GVASPropertySerde):
         name = data["name"]
         guid = data.get("guid", "")
         fullpath = f"{blueprint}/{name}"
-        concrete_class = _REGISTRY.get(fullpath)
+        concrete_class = lookup(_REGISTRY, fullpath)
         if concrete_class is None:
+            TYPES_CREATED["struct"] += 1
             concrete_class = type(
                 f"GVASStructProperty@{fullpath}",
                 (GVASBlueprintStructPropertySerde,),
@@ -126,9 +148,9 @@ class GVASUniqueStructPropertySerde(GVASStructPropertySerde):
         return (
             super().type_to_bytes()
             + struct.pack("<I", 1)
-            + write_string(cls._NAME)
+            + write_name(cls._NAME)
             + struct.pack("<I", 1)
-            + write_string(cls._BLUEPRINT)
+            + write_name(cls._BLUEPRINT)
         )
 
     @classmethod
@@ -142,6 +164,7 @@ class GVASCoreDateTimeSerde(GVASUniqueStructPropertySerde):
     __slots__ = ()
 
     _BLUEPRINT: ClassVar[str] = "/Script/CoreUObject"
+    _FIXED_LAYOUT: ClassVar[tuple[int, str, tuple[str, ...]] | None] = (8, "<Q", ())
     _NAME: ClassVar[str] = "DateTime"
 
     @classmethod
@@ -162,8 +185,8 @@ class GVASCoreDateTimeSerde(GVASUniqueStructPropertySerde):
     @classmethod
     @final
     @override
-    def from_dict_full(cls, data: int) -> bytes:
-        return struct.pack("<IIBQ", 0, 8, 8, data)
+    def from_dict_full_into(cls, data: int, buffer: bytearray) -> None:
+        buffer += struct.pack("<IIBQ", 0, 8, 8, data)
 
 
 class GVASCoreGameplayTagContainerSerde(GVASUniqueStructPropertySerde):
@@ -200,9 +223,11 @@ class GVASCoreGameplayTagContainerSerde(GVASUniqueStructPropertySerde):
     @classmethod
     @final
     @override
-    def from_dict_full(cls, data: list[str]) -> bytes:
-        tag_bytes = write_string(*data)
-        return struct.pack("<IIBI", 0, len(tag_bytes) + 4, 8, len(data)) + tag_bytes
+    def from_dict_full_into(cls, data: list[str], buffer: bytearray) -> None:
+        start = len(buffer)
+        buffer += struct.pack("<IIBI", 0, 0, 8, len(data))
+        buffer += write_string(*data)
+        struct.pack_into("<I", buffer, start + 4, len(buffer) - start - 9)
 
 
 class GVASCoreGUIDSerde(GVASUniqueStructPropertySerde):
@@ -252,14 +277,14 @@ class GVASCoreGUIDSerde(GVASUniqueStructPropertySerde):
     @classmethod
     @final
     @override
-    def from_dict_full(cls, data: str) -> bytes:
-        return struct.pack("<IIB16s", 0, 16, 8, uuid.UUID(data).bytes_le)
+    def from_dict_full_into(cls, data: str, buffer: bytearray) -> None:
+        buffer += struct.pack("<IIB16s", 0, 16, 8, uuid.UUID(data).bytes_le)
 
     @classmethod
     @final
     @override
-    def from_dict_array(cls, data: list[str]) -> bytes:
-        return struct.pack(
+    def from_dict_array_into(cls, data: list[str], buffer: bytearray) -> None:
+        buffer += struct.pack(
             "<IIBI" + "16s" * len(data),
             0,
             len(data) * 16 + 4,
@@ -303,15 +328,18 @@ class GVASCoreSoftObjectPathSerde(GVASUniqueStructPropertySerde):
     @classmethod
     @final
     @override
-    def from_dict_full(cls, data: dict[str, str]) -> bytes:
-        body = write_string(data["blueprint"], data["name"], data["value"])
-        return struct.pack("<IIB", 0, len(body), 8) + body
+    def from_dict_full_into(cls, data: dict[str, str], buffer: bytearray) -> None:
+        start = len(buffer)
+        buffer += struct.pack("<IIB", 0, 0, 8)
+        buffer += write_string(data["blueprint"], data["name"], data["value"])
+        struct.pack_into("<I", buffer, start + 4, len(buffer) - start - 9)
 
 
 class GVASCoreTimespanSerde(GVASUniqueStructPropertySerde):
     __slots__ = ()
 
     _BLUEPRINT: ClassVar[str] = "/Script/CoreUObject"
+    _FIXED_LAYOUT: ClassVar[tuple[int, str, tuple[str, ...]] | None] = (8, "<Q", ())
     _NAME: ClassVar[str] = "Timespan"
 
     @classmethod
@@ -332,8 +360,8 @@ class GVASCoreTimespanSerde(GVASUniqueStructPropertySerde):
     @classmethod
     @final
     @override
-    def from_dict_full(cls, data: int) -> bytes:
-        return struct.pack("<IIBQ", 0, 8, 8, data)
+    def from_dict_full_into(cls, data: int, buffer: bytearray) -> None:
+        buffer += struct.pack("<IIBQ", 0, 8, 8, data)
 
 
 class GVASCoreUniqueNetIDSerde(GVASUniqueStructPropertySerde):
@@ -371,35 +399,28 @@ class GVASCoreUniqueNetIDSerde(GVASUniqueStructPropertySerde):
     @classmethod
     @final
     @override
-    def from_dict_full(cls, data: dict[str, str]) -> bytes:
+    def from_dict_full_into(cls, data: dict[str, str], buffer: bytearray) -> None:
         identifier = data["identifier"]
-        body = struct.pack("<I", len(identifier) + 1) + write_string(data["source"], identifier)
-        return struct.pack("<IIB", 0, len(body), 8) + body
+        start = len(buffer)
+        buffer += struct.pack("<IIBI", 0, 0, 8, len(identifier) + 1)
+        buffer += write_string(data["source"], identifier)
+        struct.pack_into("<I", buffer, start + 4, len(buffer) - start - 9)
 
 
 class GVASCoreVectorSerde(GVASUniqueStructPropertySerde):
     __slots__ = ()
 
     _BLUEPRINT: ClassVar[str] = "/Script/CoreUObject"
+    _FIXED_LAYOUT: ClassVar[tuple[int, str, tuple[str, ...]] | None] = (8, "<3d", ("x", "y", "z"))
     _NAME: ClassVar[str] = "Vector"
 
     @classmethod
     @final
     @override
-    def from_bytes_array(cls, data: bytes, offset: int) -> tuple[list[dict[str, float]], int]:
-        padding, size, unit_width, count = struct.unpack_from("<IIBI", data, offset)
-        if padding != 0:
-            raise ValueError(f"Invalid padding at {offset}")
-        offset += 4
-        if size < 4:
-            raise ValueError(f"Invalid size at {offset}")
-        offset += 4
-        if unit_width != 8:
-            raise ValueError(f"Invalid unit width at {offset}")
-        offset += 1
-        if count * 24 + 4 != size:
-            raise ValueError(f"Invalid count at {offset}")
-        offset += 4
+    def from_bytes_array(cls, data: bytes, offset: int) -> tuple[list[dict[str, float]] | Any, int]:
+        count, offset = cls._array_header_from_bytes(data, offset, 24, 8)
+        if OPTIONS.get().numpy:
+            return cls._matrix_from_bytes(data, offset, count, 3)
         values: list[dict[str, float]] = []
         for x, y, z in itertools.batched(struct.unpack_from(f"<{count * 3}d", data, offset), 3):
             values.append({"x": x, "y": y, "z": z})
@@ -425,14 +446,17 @@ class GVASCoreVectorSerde(GVASUniqueStructPropertySerde):
     @classmethod
     @final
     @override
-    def from_dict_full(cls, data: dict[str, float]) -> bytes:
-        return struct.pack("<IIB3d", 0, 24, 8, data["x"], data["y"], data["z"])
+    def from_dict_full_into(cls, data: dict[str, float], buffer: bytearray) -> None:
+        buffer += struct.pack("<IIB3d", 0, 24, 8, data["x"], data["y"], data["z"])
 
     @classmethod
     @final
     @override
-    def from_dict_array(cls, data: list[dict[str, float]]) -> bytes:
-        return struct.pack(
+    def from_dict_array_into(cls, data: list[dict[str, float]] | Any, buffer: bytearray) -> None:
+        if not isinstance(data, list):
+            cls._matrix_from_dict_into(data, buffer, 3, 8)
+            return
+        buffer += struct.pack(
             f"<IIBI{len(data) * 3}d",
             0,
             len(data) * 24 + 4,
@@ -446,8 +470,21 @@ class GVASCoreRotatorSerde(GVASUniqueStructPropertySerde):
     __slots__ = ()
 
     _BLUEPRINT: ClassVar[str] = "/Script/CoreUObject"
+    _FIXED_LAYOUT: ClassVar[tuple[int, str, tuple[str, ...]] | None] = (8, "<3d", ("x", "y", "z"))
     _NAME: ClassVar[str] = "Rotator"
 
+    @classmethod
+    @final
+    @override
+    def from_bytes_array(cls, data: bytes, offset: int) -> tuple[list[dict[str, float]] | Any, int]:
+        count, offset = cls._array_header_from_bytes(data, offset, 24, 8)
+        if OPTIONS.get().numpy:
+            return cls._matrix_from_bytes(data, offset, count, 3)
+        values: list[dict[str, float]] = []
+        for x, y, z in itertools.batched(struct.unpack_from(f"<{count * 3}d", data, offset), 3):
+            values.append({"x": x, "y": y, "z": z})
+        return values, offset + count * 24
+
     @classmethod
     @final
     @override
@@ -468,16 +505,45 @@ class GVASCoreRotatorSerde(GVASUniqueStructPropertySerde):
     @classmethod
     @final
     @override
-    def from_dict_full(cls, data: dict[str, float]) -> bytes:
-        return struct.pack("<IIB3d", 0, 24, 8, data["x"], data["y"], data["z"])
+    def from_dict_full_into(cls, data: dict[str, float], buffer: bytearray) -> None:
+        buffer += struct.pack("<IIB3d", 0, 24, 8, data["x"], data["y"], data["z"])
+
+    @classmethod
+    @final
+    @override
+    def from_dict_array_into(cls, data: list[dict[str, float]] | Any, buffer: bytearray) -> None:
+        if not isinstance(data, list):
+            cls._matrix_from_dict_into(data, buffer, 3, 8)
+            return
+        buffer += struct.pack(
+            f"<IIBI{len(data) * 3}d",
+            0,
+            len(data) * 24 + 4,
+            8,
+            len(data),
+            *itertools.chain.from_iterable((item["x"], item["y"], item["z"]) for item in data),
+        )
 
 
 class GVASCoreQuatSerde(GVASUniqueStructPropertySerde):
     __slots__ = ()
 
     _BLUEPRINT: ClassVar[str] = "/Script/CoreUObject"
+    _FIXED_LAYOUT: ClassVar[tuple[int, str, tuple[str, ...]] | None] = (8, "<4d", ("x", "y", "z", "w"))
     _NAME: ClassVar[str] = "Quat"
 
+    @classmethod
+    @final
+    @override
+    def from_bytes_array(cls, data: bytes, offset: int) -> tuple[list[dict[str, float]] | Any, int]:
+        count, offset = cls._array_header_from_bytes(data, offset, 32, 8)
+        if OPTIONS.get().numpy:
+            return cls._matrix_from_bytes(data, offset, count, 4)
+        values: list[dict[str, float]] = []
+        for x, y, z, w in itertools.batched(struct.unpack_from(f"<{count * 4}d", data, offset), 4):
+            values.append({"x": x, "y": y, "z": z, "w": w})
+        return values, offset + count * 32
+
     @classmethod
     @final
     @override
@@ -498,16 +564,52 @@ class GVASCoreQuatSerde(GVASUniqueStructPropertySerde):
     @classmethod
     @final
     @override
-    def from_dict_full(cls, data: dict[str, float]) -> bytes:
-        return struct.pack("<IIB4d", 0, 32, 8, data["x"], data["y"], data["z"], data["w"])
+    def from_dict_full_into(cls, data: dict[str, float], buffer: bytearray) -> None:
+        buffer += struct.pack("<IIB4d", 0, 32, 8, data["x"], data["y"], data["z"], data["w"])
+
+    @classmethod
+    @final
+    @override
+    def from_dict_array_into(cls, data: list[dict[str, float]] | Any, buffer: bytearray) -> None:
+        if not isinstance(data, list):
+            cls._matrix_from_dict_into(data, buffer, 4, 8)
+            return
+        buffer += struct.pack(
+            f"<IIBI{len(data) * 4}d",
+            0,
+            len(data) * 32 + 4,
+            8,
+            len(data),
+            *itertools.chain.from_iterable((item["x"], item["y"], item["z"], item["w"]) for item in data),
+        )
 
 
 class GVASBlueprintStructPropertySerde(GVASStructPropertySerde):
     __slots__ = ()
 
     _BLUEPRINT: ClassVar[str]
+    _FRAMED: ClassVar[bool] = True
     _GUID: ClassVar[str]
     _NAME: ClassVar[str]
+    _PROJECTABLE: ClassVar[bool] = True
+
+    @staticmethod
+    @final
+    def _query_property(
+        descriptor: GVASTypeDescriptor,
+        data: bytes,
+        offset: int,
+        segments: tuple[str, ...],
+    ) -> Iterator[Any]:
+        if not segments:
+            value, _ = descriptor.serde.from_bytes_full(data, offset)
+            yield {"type": descriptor.mapping.copy(), "value": value}
+        elif segments[0] == "type":
+            yield from select(descriptor.mapping.copy(), segments[1:])
+        elif segments[0] == "value":
+            yield from descriptor.serde.query_from_bytes_full(data, offset, segments[1:])
+        else:
+            yield from descriptor.serde.query_from_bytes_full(data, offset, segments)
 
     @final
     @override
@@ -524,55 +626,292 @@ class GVASBlueprintStructPropertySerde(GVASStructPropertySerde):
     @classmethod
     @final
     @override
-    def from_bytes(cls, data: bytes, offset: int) -> tuple[dict[str, dict[str, Any]], int]:
+    def from_bytes(cls, data: bytes, offset: int) -> tuple[MutableMapping[str, dict[str, Any]], int]:
+        options = OPTIONS.get()
+        patterns = PROJECTION.get()
+        if patterns is not None:
+            return cls._projected_from_bytes(data, offset, patterns, options.validation, options.nodes)
+        if options.lazy:
+            return GVASLazyStruct.from_bytes(data, offset)
+        profiler = PROFILER.get()
+        if profiler is not None:
+            return cls._profiled_from_bytes(data, offset, profiler, options.validation, options.nodes)
+        if options.validation != "strict":
+            return cls._relaxed_from_bytes(data, offset, options.validation, options.nodes)
+        if options.nodes:
+            return cls._nodes_from_bytes(data, offset)
         result: dict[str, dict[str, Any]] = {}
-        name, bytes_read = read_string(data, offset)
+        layout: list[tuple[str, type[GVASPropertySerde]]] | None = None
+        if options.compiled:
+            decoder = STRUCT_DECODERS.get(cls)
+            if decoder is None:
+                layout = []
+            else:
+                result, offset, complete = decoder(data, offset)
+                if complete:
+                    return result, offset
+        name, bytes_read = read_name(data, offset)
         while name != "None":
-            property_type, offset = GVASPropertySerde.type_from_bytes(data, offset + bytes_read)
-            value, offset = property_type.from_bytes_full(data, offset)
-            result[name] = {"type": property_type.type_to_dict(), "value": value}
-            name, bytes_read = read_string(data, offset)
+            descriptor, offset = GVASPropertySerde.descriptor_from_bytes(data, offset + bytes_read)
+            value, offset = descriptor.serde.from_bytes_full(data, offset)
+            DECODED[descriptor.label] += 1
+            result[name] = {"type": descriptor.mapping.copy(), "value": value}
+            if layout is not None:
+                layout.append((name, descriptor.serde))
+            name, bytes_read = read_name(data, offset)
+        if layout is not None:
+            compile_struct(cls, layout)
         return result, offset + bytes_read
 
     @classmethod
     @override
-    def from_bytes_array(cls, data: bytes, offset: int) -> tuple[list[dict[str, dict[str, Any]]], int]:
-        padding, size, unit_width, count = struct.unpack_from("<IIBI", data, offset)
-        if padding != 0:
-            raise ValueError(f"Invalid padding at {offset}")
-        offset += 4
-        if size < 4:
-            raise ValueError(f"Invalid size at {offset}")
-        offset += 4
-        if unit_width != 0:
-            raise ValueError(f"Invalid unit width at {offset}")
-        offset += 1
-        expected_offset = offset + size
-        offset += 4
-        values: list[dict[str, dict[str, Any]]] = []
-        for _ in range(count):
-            value, offset = cls.from_bytes(data, offset)
-            values.append(value)
+    def from_bytes_array(cls, data: bytes, offset: int) -> tuple[list[MutableMapping[str, dict[str, Any]]], int]:
+        count, expected_offset, offset = cls._array_span_from_bytes(data, offset)
+        patterns = PROJECTION.get()
+        if patterns is None:
+            values, offset = elements_from_pool(data, offset, count, expected_offset, (cls.descriptor(),))
+        else:
+            values, offset = elements_from_projection(data, offset, count, (cls.descriptor(),), patterns)
         if offset != expected_offset:
             raise ValueError(f"Invalid offset {offset}")
         return values, offset
 
     @classmethod
     @override
-    def from_bytes_full(cls, data: bytes, offset: int) -> tuple[dict[str, dict[str, Any]], int]:
-        padding, size, unit_width = struct.unpack_from("<IIB", data, offset)
-        if padding != 0:
-            raise ValueError(f"Invalid padding at {offset}")
-        offset += 8
-        if unit_width != 0:
-            raise ValueError(f"Invalid unit width at {offset}")
-        offset += 1
-        expected_offset = offset + size
+    def from_bytes_full(cls, data: bytes, offset: int) -> tuple[MutableMapping[str, dict[str, Any]], int]:
+        expected_offset, offset = cls._full_span_from_bytes(data, offset)
         result, offset = cls.from_bytes(data, offset)
         if offset != expected_offset:
             raise ValueError(f"Invalid offset {offset}")
         return result, offset
 
+    @classmethod
+    @final
+    @override
+    def from_index(cls, data: bytes, index: dict[str, Any]) -> tuple[GVASLazyStruct, int]:
+        return GVASLazyStruct.from_index(data, index)
+
+    @classmethod
+    @final
+    @override
+    def element_from_stream(cls, reader: GVASBinaryReader, end: int) -> MutableMapping[str, Any]:
+        return cls.from_stream(reader)
+
+    @classmethod
+    @final
+    @override
+    def from_stream(cls, reader: GVASBinaryReader) -> MutableMapping[str, Any]:
+        options = OPTIONS.get()
+        nodes = options.nodes
+        result: dict[str, Any] = {}
+        name = reader.read_name()
+        while name != "None":
+            descriptor, end = GVASPropertySerde.descriptor_from_stream(reader)
+            if end - reader.tell() > reader.window:
+                value = descriptor.serde.from_stream_full(reader, end)
+            else:
+                decode = functools.partial(descriptor.value_from_bytes, validation=options.validation)
+                value = reader.decode(decode, end - reader.tell())
+            if reader.tell() != end:
+                raise ValueError(f"Invalid offset {reader.tell()}")
+            DECODED[descriptor.label] += 1
+            if nodes:
+                result[name] = GVASPropertyNode(descriptor, value)
+            else:
+                result[name] = {"type": descriptor.mapping.copy(), "value": value}
+            name = reader.read_name()
+        if nodes:
+            return GVASStructNode(result)
+        return result
+
+    @classmethod
+    @final
+    @override
+    def from_stream_array(cls, reader: GVASBinaryReader, end: int) -> list[MutableMapping[str, Any]]:
+        data, offset = reader.peek(13)
+        count, expected_offset, values_offset = cls._array_span_from_bytes(data, offset)
+        if reader.tell() + expected_offset - offset != end:
+            raise ValueError(f"Invalid size at {reader.tell() + 4}")
+        reader.skip(values_offset - offset)
+        return [cls.from_stream(reader) for _ in range(count)]
+
+    @classmethod
+    @final
+    @override
+    def from_stream_full(cls, reader: GVASBinaryReader, end: int) -> MutableMapping[str, Any]:
+        data, offset = reader.peek(9)
+        expected_offset, value_offset = cls._full_span_from_bytes(data, offset)
+        if reader.tell() + expected_offset - offset != end:
+            raise ValueError(f"Invalid size at {reader.tell() + 4}")
+        reader.skip(value_offset - offset)
+        return cls.from_stream(reader)
+
+    @classmethod
+    @final
+    @override
+    def index_from_bytes(cls, data: bytes, offset: int) -> tuple[dict[str, Any], int]:
+        result, offset = GVASLazyStruct.from_bytes(data, offset)
+        return result.index(), offset
+
+    @classmethod
+    @final
+    @override
+    def from_json_array_into(cls, reader: GVASJSONReader, writer: GVASBinaryWriter) -> None:
+        start = writer.tell()
+        writer.buffer += struct.pack("<IIBI", 0, 0, 0, 0)
+        reader.begin_array()
+        count = 0
+        while reader.next_item():
+            cls.from_json_into(reader, writer)
+            count += 1
+        writer.patch(start + 4, struct.pack("<I", writer.tell() - start - 9))
+        writer.patch(start + 9, struct.pack("<I", count))
+
+    @classmethod
+    @final
+    @override
+    def from_json_full_into(cls, reader: GVASJSONReader, writer: GVASBinaryWriter) -> None:
+        start = writer.tell()
+        writer.buffer += struct.pack("<IIB", 0, 0, 0)
+        cls.from_json_into(reader, writer)
+        writer.patch(start + 4, struct.pack("<I", writer.tell() - start - 9))
+
+    @classmethod
+    @final
+    @override
+    def from_json_into(cls, reader: GVASJSONReader, writer: GVASBinaryWriter) -> None:
+        data = reader.buffered_value()
+        if data is not None:
+            cls.from_dict_into(data, writer.buffer)
+            writer.flush()
+            return
+        reader.begin_object()
+        while (name := reader.next_key()) is not None:
+            data = reader.buffered_value()
+            if data is not None:
+                cls._property_from_dict_into(name, data, writer.buffer)
+                writer.flush()
+                continue
+            writer.buffer += write_name(name)
+            reader.begin_object()
+            key = reader.next_key()
+            if key == "type":
+                descriptor = GVASPropertySerde.descriptor_from_dict(reader.value())
+                writer.buffer += descriptor.encoded
+                reader.expect_key("value")
+                descriptor.serde.from_json_full_into(reader, writer)
+            elif key == "value":
+                value = reader.value()
+                reader.expect_key("type")
+                descriptor = GVASPropertySerde.descriptor_from_dict(reader.value())
+                writer.buffer += descriptor.encoded
+                descriptor.serde.from_dict_full_into(value, writer.buffer)
+            else:
+                raise ValueError(f"Invalid key {key} in {name}")
+            reader.end_object()
+            writer.flush()
+        writer.buffer += write_name("None")
+
+    @classmethod
+    @final
+    @override
+    def json_from_bytes(cls, data: bytes, offset: int, writer: GVASJSONWriter) -> int:
+        writer.begin_object()
+        name, bytes_read = read_name(data, offset)
+        while name != "None":
+            descriptor, offset = GVASPropertySerde.descriptor_from_bytes(data, offset + bytes_read)
+            writer.key(name)
+            writer.begin_object()
+            writer.key("type")
+            writer.value(descriptor.mapping)
+            writer.key("value")
+            offset = descriptor.serde.json_from_bytes_full(data, offset, writer)
+            writer.end()
+            name, bytes_read = read_name(data, offset)
+        writer.end()
+        return offset + bytes_read
+
+    @classmethod
+    @final
+    @override
+    def json_from_bytes_array(cls, data: bytes, offset: int, writer: GVASJSONWriter) -> int:
+        count, expected_offset, offset = cls._array_span_from_bytes(data, offset)
+        writer.begin_array()
+        for _ in range(count):
+            writer.item()
+            offset = cls.json_from_bytes(data, offset, writer)
+        writer.end()
+        if offset != expected_offset:
+            raise ValueError(f"Invalid offset {offset}")
+        return offset
+
+    @classmethod
+    @final
+    @override
+    def json_from_bytes_full(cls, data: bytes, offset: int, writer: GVASJSONWriter) -> int:
+        expected_offset, offset = cls._full_span_from_bytes(data, offset)
+        offset = cls.json_from_bytes(data, offset, writer)
+        if offset != expected_offset:
+            raise ValueError(f"Invalid offset {offset}")
+        return offset
+
+    @classmethod
+    @final
+    @override
+    def query_from_bytes(cls, data: bytes, offset: int, segments: tuple[str, ...]) -> Generator[Any, None, int]:
+        if not segments:
+            value, offset = cls.from_bytes(data, offset)
+            yield value
+            return offset
+        name, bytes_read = read_name(data, offset)
+        while name != "None":
+            offset += bytes_read
+            end = GVASPropertySerde.skip_from_bytes(data, offset)
+            if fnmatchcase(name, segments[0]):
+                descriptor, value_offset = GVASPropertySerde.descriptor_from_bytes(data, offset)
+                yield from cls._query_property(descriptor, data, value_offset, segments[1:])
+            offset = end
+            name, bytes_read = read_name(data, offset)
+        return offset + bytes_read
+
+    @classmethod
+    @final
+    @override
+    def query_from_bytes_array(
+        cls,
+        data: bytes,
+        offset: int,
+        segments: tuple[str, ...],
+    ) -> Generator[Any, None, int]:
+        if not segments:
+            values, offset = cls.from_bytes_array(data, offset)
+            yield values
+            return offset
+        count, _, offset = cls._array_span_from_bytes(data, offset)
+        for index in range(count):
+            if fnmatchcase(str(index), segments[0]):
+                offset = yield from cls.query_from_bytes(data, offset, segments[1:])
+            else:
+                offset = cls.skip_element_from_bytes(data, offset)
+        return offset
+
+    @classmethod
+    @final
+    @override
+    def query_from_bytes_full(cls, data: bytes, offset: int, segments: tuple[str, ...]) -> Iterator[Any]:
+        _, offset = cls._full_span_from_bytes(data, offset)
+        yield from cls.query_from_bytes(data, offset, segments)
+
+    @classmethod
+    @final
+    @override
+    def skip_element_from_bytes(cls, data: bytes, offset: int) -> int:
+        name, bytes_read = read_name(data, offset)
+        while name != "None":
+            offset = GVASPropertySerde.skip_from_bytes(data, offset + bytes_read)
+            name, bytes_read = read_name(data, offset)
+        return offset + bytes_read
+
     @classmethod
     @final
     @override
@@ -582,6 +921,20 @@ class GVASBlueprintStructPropertySerde(GVASStructPropertySerde):
             result["guid"] = cls._GUID
         return result
 
+    @classmethod
+    @final
+    @override
+    def value_to_dict(cls, value: Mapping[str, Mapping[str, Any]]) -> dict[str, dict[str, Any]]:
+        if isinstance(value, GVASStructNode):
+            return value.to_dict()
+        return GVASStructNode.from_dict(value).to_dict()
+
+    @classmethod
+    @final
+    @override
+    def value_to_node(cls, value: Mapping[str, Mapping[str, Any]]) -> GVASStructNode:
+        return GVASStructNode.from_dict(value)
+
     @classmethod
     @final
     @override
@@ -596,42 +949,218 @@ class GVASBlueprintStructPropertySerde(GVASStructPropertySerde):
             return (
                 super().type_to_bytes()
                 + struct.pack("<I", 2)
-                + write_string(cls._NAME)
+                + write_name(cls._NAME)
                 + struct.pack("<I", 1)
-                + write_string(cls._BLUEPRINT)
+                + write_name(cls._BLUEPRINT)
                 + struct.pack("<I", 0)
-                + write_string(cls._GUID)
+                + write_name(cls._GUID)
             )
         return (
             super().type_to_bytes()
             + struct.pack("<I", 1)
-            + write_string(cls._NAME)
+            + write_name(cls._NAME)
             + struct.pack("<I", 1)
-            + write_string(cls._BLUEPRINT)
+            + write_name(cls._BLUEPRINT)
         )
 
     @classmethod
     @final
     @override
-    def from_dict(cls, data: dict[str, dict[str, Any]]) -> bytes:
-        result = bytearray()
-        for name, property_data in data.items():
-            result.extend(write_string(name))
-            property_type = GVASPropertySerde.type_from_dict(property_data["type"])
-            result.extend(property_type.type_to_bytes())
-            result.extend(property_type.from_dict_full(property_data["value"]))
-        result.extend(write_string("None"))
-        return bytes(result)
+    def from_dict_into(cls, data: Mapping[str, dict[str, Any]], buffer: bytearray) -> None:
+        if isinstance(data, GVASLazyStruct):
+            source = data.source()
+            if source is not None:
+                buffer += source
+                return
+            for name in data:
+                source = data.property_source(name)
+                if source is None:
+                    cls._property_from_dict_into(name, data[name], buffer)
+                else:
+                    buffer += source
+        elif (profiler := PROFILER.get()) is not None:
+            for name, property_data in data.items():
+                start = profiler.begin()
+                offset = len(buffer)
+                serde = cls._property_from_dict_into(name, property_data, buffer)
+                profiler.end(start, "encode", name, serde.descriptor().label, offset, len(buffer) - offset)
+        elif OPTIONS.get().compiled:
+            encoder = STRUCT_ENCODERS.get(cls)
+            if encoder is not None and encoder(data, buffer):
+                return
+            layout: list[tuple[str, type[GVASPropertySerde]]] = []
+            for name, property_data in data.items():
+                layout.append((name, cls._property_from_dict_into(name, property_data, buffer)))
+            if encoder is None:
+                compile_struct(cls, layout)
+        else:
+            for name, property_data in data.items():
+                cls._property_from_dict_into(name, property_data, buffer)
+        buffer += write_name("None")
 
     @classmethod
     @final
     @override
-    def from_dict_full(cls, data: dict[str, dict[str, Any]]) -> bytes:
-        body = cls.from_dict(data)
-        return struct.pack("<IIB", 0, len(body), 0) + body
+    def from_dict_full_into(cls, data: Mapping[str, dict[str, Any]], buffer: bytearray) -> None:
+        start = len(buffer)
+        buffer += struct.pack("<IIB", 0, 0, 0)
+        cls.from_dict_into(data, buffer)
+        struct.pack_into("<I", buffer, start + 4, len(buffer) - start - 9)
 
     @classmethod
     @override
-    def from_dict_array(cls, data: list[dict[str, dict[str, Any]]]) -> bytes:
-        result = b"".join(cls.from_dict(item) for item in data)
-        return struct.pack("<IIBI", 0, len(result) + 4, 0, len(data)) + result
+    def from_dict_array_into(cls, data: list[Mapping[str, dict[str, Any]]], buffer: bytearray) -> None:
+        start = len(buffer)
+        buffer += struct.pack("<IIBI", 0, 0, 0, len(data))
+        for item in data:
+            cls.from_dict_into(item, buffer)
+        struct.pack_into("<I", buffer, start + 4, len(buffer) - start - 9)
+
+    @classmethod
+    @final
+    def _array_span_from_bytes(cls, data: bytes, offset: int) -> tuple[int, int, int]:
+        padding, size, unit_width, count = struct.unpack_from("<IIBI", data, offset)
+        if padding != 0:
+            raise ValueError(f"Invalid padding at {offset}")
+        offset += 4
+        if size < 4:
+            raise ValueError(f"Invalid size at {offset}")
+        offset += 4
+        if unit_width != 0:
+            raise ValueError(f"Invalid unit width at {offset}")
+        offset += 1
+        expected_offset = offset + size
+        offset += 4
+        return count, expected_offset, offset
+
+    @classmethod
+    @final
+    def _full_span_from_bytes(cls, data: bytes, offset: int) -> tuple[int, int]:
+        padding, size, unit_width = struct.unpack_from("<IIB", data, offset)
+        if padding != 0:
+            raise ValueError(f"Invalid padding at {offset}")
+        offset += 8
+        if unit_width != 0:
+            raise ValueError(f"Invalid unit width at {offset}")
+        offset += 1
+        expected_offset = offset + size
+        return expected_offset, offset
+
+    @classmethod
+    @final
+    def _nodes_from_bytes(cls, data: bytes, offset: int) -> tuple[GVASStructNode, int]:
+        result: dict[str, GVASPropertyNode] = {}
+        name, bytes_read = read_name(data, offset)
+        while name != "None":
+            descriptor, offset = GVASPropertySerde.descriptor_from_bytes(data, offset + bytes_read)
+            value, offset = descriptor.serde.from_bytes_full(data, offset)
+            DECODED[descriptor.label] += 1
+            result[name] = GVASPropertyNode(descriptor, value)
+            name, bytes_read = read_name(data, offset)
+        return GVASStructNode(result), offset + bytes_read
+
+    @classmethod
+    @final
+    def _profiled_from_bytes(
+        cls,
+        data: bytes,
+        offset: int,
+        profiler: GVASProfiler,
+        validation: str,
+        nodes: bool,
+    ) -> tuple[MutableMapping[str, Any], int]:
+        result: dict[str, Any] = {}
+        name, bytes_read = read_name(data, offset)
+        while name != "None":
+            start = profiler.begin()
+            type_start = profiler.begin()
+            descriptor, value_offset = GVASPropertySerde.descriptor_from_bytes(data, offset + bytes_read)
+            profiler.end(type_start, "type", name, descriptor.label, offset, value_offset - offset)
+            value, end = descriptor.value_from_bytes(data, value_offset, validation)
+            profiler.end(start, "decode", name, descriptor.label, offset, end - offset)
+            DECODED[descriptor.label] += 1
+            if nodes:
+                result[name] = GVASPropertyNode(descriptor, value)
+            else:
+                result[name] = {"type": descriptor.mapping.copy(), "value": value}
+            offset = end
+            name, bytes_read = read_name(data, offset)
+        if nodes:
+            return GVASStructNode(result), offset + bytes_read
+        return result, offset + bytes_read
+
+    @classmethod
+    @final
+    def _projected_from_bytes(
+        cls,
+        data: bytes,
+        offset: int,
+        patterns: tuple[tuple[str, ...], ...],
+        validation: str,
+        nodes: bool,
+    ) -> tuple[MutableMapping[str, Any], int]:
+        result: dict[str, Any] = {}
+        name, bytes_read = read_name(data, offset)
+        while name != "None":
+            offset += bytes_read
+            children = project(patterns, name)
+            if children == ():
+                offset = GVASPropertySerde.skip_from_bytes(data, offset)
+            else:
+                descriptor, offset = GVASPropertySerde.descriptor_from_bytes(data, offset)
+                token = PROJECTION.set(children if descriptor.serde._PROJECTABLE else None)
+                try:
+                    value, offset = descriptor.value_from_bytes(data, offset, validation)
+                finally:
+                    PROJECTION.reset(token)
+                DECODED[descriptor.label] += 1
+                if nodes:
+                    result[name] = GVASPropertyNode(descriptor, value)
+                else:
+                    result[name] = {"type": descriptor.mapping.copy(), "value": value}
+            name, bytes_read = read_name(data, offset)
+        if nodes:
+            return GVASStructNode(result), offset + bytes_read
+        return result, offset + bytes_read
+
+    @classmethod
+    @final
+    def _property_from_dict_into(
+        cls,
+        name: str,
+        data: Mapping[str, Any],
+        buffer: bytearray,
+    ) -> type[GVASPropertySerde]:
+        buffer += write_name(name)
+        if isinstance(data, GVASPropertyNode):
+            descriptor = data.descriptor
+        else:
+            descriptor = GVASPropertySerde.descriptor_from_dict(data["type"])
+        buffer += descriptor.encoded
+        descriptor.serde.from_dict_full_into(data["value"], buffer)
+        ENCODED[descriptor.label] += 1
+        return descriptor.serde
+
+    @classmethod
+    @final
+    def _relaxed_from_bytes(
+        cls,
+        data: bytes,
+        offset: int,
+        validation: str,
+        nodes: bool,
+    ) -> tuple[MutableMapping[str, Any], int]:
+        result: dict[str, Any] = {}
+        name, bytes_read = read_name(data, offset)
+        while name != "None":
+            descriptor, offset = GVASPropertySerde.descriptor_from_bytes(data, offset + bytes_read)
+            value, offset = descriptor.value_from_bytes(data, offset, validation)
+            DECODED[descriptor.label] += 1
+            if nodes:
+                result[name] = GVASPropertyNode(descriptor, value)
+            else:
+                result[name] = {"type": descriptor.mapping.copy(), "value": value}
+            name, bytes_read = read_name(data, offset)
+        if nodes:
+            return GVASStructNode(result), offset + bytes_read
+        return result, offset + bytes_read
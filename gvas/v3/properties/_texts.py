@@ -59,7 +59,9 @@ class GVASTextPropertySerde(GVASPropertySerde):
     @classmethod
     @final
     @override
-    def from_dict_full(cls, data: dict[str, Any]) -> bytes:
+    def from_dict_full_into(cls, data: dict[str, Any], buffer: bytearray) -> None:
         type_id = data["type"]
-        value_bytes = getattr(cls, f"_type_{type_id}_from_dict")(data["value"])
-        return struct.pack("<IIBIB", 0, len(value_bytes) + 5, 0, 0, type_id) + value_bytes
+        start = len(buffer)
+        buffer += struct.pack("<IIBIB", 0, 0, 0, 0, type_id)
+        buffer += getattr(cls, f"_type_{type_id}_from_dict")(data["value"])
+        struct.pack_into("<I", buffer, start + 4, len(buffer) - start - 9)